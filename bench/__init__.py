@@ -0,0 +1,9 @@
+#!/usr/bin/python3
+
+from field import BaseField, P, ScalarField, N, batch_inv
+from field.base_field_utils import montgomery_mul, to_montgomery, to_radix_r
+from point import Point, mul_generator, mul_double_scalar, mul_multi_scalar
+import ecdsa
+from ecdsa.keygen import generate_public_key
+import schnorr
+from schnorr.hashing import hash_challenge
@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+
+import pytest
+from . import ecdsa, N, generate_public_key
+from random import Random
+
+# inputs are derived from a fixed seed, so that runs are comparable
+rng = Random(2)
+
+# batch sizes, for which batched routines are measured
+BATCH_SIZES = [1, 8, 32]
+
+# fixed ECDSA keypair, so that runs are comparable
+SKEY = rng.randrange(1, N)
+PKEY = generate_public_key(SKEY)
+
+
+def signed_messages(count: int, recoverable: bool = False):
+    """
+    Random messages, along with their signatures, under same key
+    """
+    msgs = [rng.randbytes(32) for _ in range(count)]
+    return [(msg, ecdsa.sign(SKEY, msg, recoverable)) for msg in msgs]
+
+
+def test_sign(benchmark):
+    """
+    Benchmark ECDSA signing
+    """
+    benchmark.pedantic(
+        ecdsa.sign, args=(SKEY, rng.randbytes(32)), rounds=5, warmup_rounds=1
+    )
+
+
+def test_verify(benchmark):
+    """
+    Benchmark ECDSA verification, with public key already prepared
+    """
+    ((msg, sig),) = signed_messages(1)
+    benchmark.pedantic(ecdsa.verify, args=(PKEY, msg, sig), rounds=5, warmup_rounds=1)
+
+
+def test_signer_sign(benchmark):
+    """
+    Benchmark online phase of ECDSA signing, using precomputed nonce pool
+    """
+    with ecdsa.Signer(SKEY, pool_size=64, low_watermark=0) as signer:
+        signer.wait_ready()
+        benchmark.pedantic(signer.sign, args=(rng.randbytes(32),), rounds=32)
+
+
+@pytest.mark.parametrize("size", BATCH_SIZES)
+def test_sign_batch(benchmark, size):
+    """
+    Benchmark ECDSA signing of many messages, sharing inversions
+    """
+    items = [(SKEY, rng.randbytes(32)) for _ in range(size)]
+    benchmark.pedantic(ecdsa.sign_batch, args=(items,), rounds=5, warmup_rounds=1)
+
+
+@pytest.mark.parametrize("size", BATCH_SIZES)
+def test_verify_many(benchmark, size):
+    """
+    Benchmark ECDSA verification of many signatures, sharing inversions
+    """
+    items = [(PKEY, msg, sig) for msg, sig in signed_messages(size)]
+    benchmark.pedantic(ecdsa.verify_many, args=(items,), rounds=5, warmup_rounds=1)
+
+
+@pytest.mark.parametrize("size", BATCH_SIZES)
+def test_verify_batch(benchmark, size):
+    """
+    Benchmark ECDSA batch verification of many signatures carrying recovery id, using
+    randomized linear combination
+    """
+    items = [(PKEY, msg, sig) for msg, sig in signed_messages(size, True)]
+    benchmark.pedantic(ecdsa.verify_batch, args=(items,), rounds=5, warmup_rounds=1)
+
+
+@pytest.mark.parametrize("size", BATCH_SIZES)
+def test_recover_batch(benchmark, size):
+    """
+    Benchmark ECDSA public key recovery of many signatures, sharing inversions
+    """
+    items = [(msg, sig[:2], sig[2]) for msg, sig in signed_messages(size, True)]
+    benchmark.pedantic(ecdsa.recover_batch, args=(items,), rounds=5, warmup_rounds=1)
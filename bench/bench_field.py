@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+
+import pytest
+from . import BaseField, P, ScalarField, N, batch_inv
+from . import montgomery_mul, to_montgomery, to_radix_r
+from random import Random
+
+# inputs are derived from a fixed seed, so that runs are comparable
+rng = Random(0)
+
+# batch sizes, for which batched routines are measured
+BATCH_SIZES = [1, 8, 32]
+
+
+def test_montgomery_mul(benchmark):
+    """
+    Benchmark Montgomery multiplication of two base field elements, kept as 32 -bit limbs
+    """
+    a = to_montgomery(to_radix_r(rng.randrange(P)))
+    b = to_montgomery(to_radix_r(rng.randrange(P)))
+
+    benchmark(montgomery_mul, a, b)
+
+
+def test_base_field_mul(benchmark):
+    """
+    Benchmark multiplication of two base field elements, using selected backend
+    """
+    a = BaseField.from_num(rng.randrange(P))
+    b = BaseField.from_num(rng.randrange(P))
+
+    benchmark(a.__mul__, b)
+
+
+def test_base_field_inv(benchmark):
+    """
+    Benchmark constant-time inversion of base field element
+    """
+    benchmark(BaseField.from_num(rng.randrange(1, P)).inv)
+
+
+def test_base_field_inv_vartime(benchmark):
+    """
+    Benchmark variable-time inversion of base field element
+    """
+    benchmark(BaseField.from_num(rng.randrange(1, P)).inv_vartime)
+
+
+def test_scalar_field_inv(benchmark):
+    """
+    Benchmark constant-time inversion of scalar field element
+    """
+    benchmark(ScalarField.from_num(rng.randrange(1, N)).inv)
+
+
+@pytest.mark.parametrize("size", BATCH_SIZES)
+def test_base_field_batch_inv(benchmark, size):
+    """
+    Benchmark simultaneous inversion of many base field elements
+    """
+    elems = [BaseField.from_num(rng.randrange(1, P)) for _ in range(size)]
+
+    benchmark(batch_inv, elems)
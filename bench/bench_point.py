@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+
+import pytest
+from . import Point, N, mul_generator, mul_double_scalar, mul_multi_scalar
+from random import Random
+
+# inputs are derived from a fixed seed, so that runs are comparable
+rng = Random(1)
+
+# number of (scalar, point) pairs, for which multi-scalar multiplication is measured
+MSM_SIZES = [2, 8, 32]
+
+
+def random_point() -> Point:
+    """
+    Secp256k1 point, which is a random multiple of generator, normalized s.t. Z = 1
+    """
+    return Point.fromAffine(*mul_generator(rng.randrange(1, N)).toAffine())
+
+
+def test_point_addition(benchmark):
+    """
+    Benchmark addition of two secp256k1 points, in projective coordinate system
+    """
+    benchmark(random_point().__add__, random_point() + random_point())
+
+
+def test_point_mixed_addition(benchmark):
+    """
+    Benchmark addition of a secp256k1 point and another one with Z = 1
+    """
+    benchmark((random_point() + random_point()).addMixed, random_point())
+
+
+def test_point_doubling(benchmark):
+    """
+    Benchmark doubling of a secp256k1 point, in projective coordinate system
+    """
+    benchmark((random_point() + random_point()).double)
+
+
+def test_point_to_affine(benchmark):
+    """
+    Benchmark conversion of a secp256k1 point to affine coordinate system
+    """
+    benchmark((random_point() + random_point()).toAffine)
+
+
+def test_mul_scalar(benchmark):
+    """
+    Benchmark multiplication of an arbitrary secp256k1 point by a scalar
+    """
+    benchmark.pedantic(
+        random_point().mulScalar, args=(rng.randrange(N),), rounds=5, warmup_rounds=1
+    )
+
+
+def test_mul_generator(benchmark):
+    """
+    Benchmark multiplication of secp256k1 generator by a scalar, using precomputed table
+    """
+    benchmark.pedantic(
+        mul_generator, args=(rng.randrange(N),), rounds=5, warmup_rounds=1
+    )
+
+
+def test_mul_double_scalar(benchmark):
+    """
+    Benchmark u1 * G + u2 * Q, as performed during ECDSA verification
+    """
+    args = (rng.randrange(N), rng.randrange(N), random_point())
+    benchmark.pedantic(mul_double_scalar, args=args, rounds=5, warmup_rounds=1)
+
+
+@pytest.mark.parametrize("size", MSM_SIZES)
+def test_mul_multi_scalar(benchmark, size):
+    """
+    Benchmark multi-scalar multiplication of many secp256k1 points
+    """
+    scalars = [rng.randrange(N) for _ in range(size)]
+    points = [random_point() for _ in range(size)]
+
+    benchmark.pedantic(
+        mul_multi_scalar, args=(scalars, points), rounds=5, warmup_rounds=1
+    )
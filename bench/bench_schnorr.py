@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+
+import pytest
+from . import schnorr, hash_challenge, Point, N, mul_generator
+from random import Random
+
+# inputs are derived from a fixed seed, so that runs are comparable
+rng = Random(3)
+
+# batch sizes, for which batch verification is measured, reporting per signature cost
+BATCH_SIZES = [100, 1_000, 10_000]
+
+# fixed Schnorr keypair, so that runs are comparable
+SKEY = rng.randrange(1, N)
+PKEY = schnorr.generate_public_key(SKEY)
+
+
+def consecutive_multiples(k: int, count: int):
+    """
+    Scalars k, k + 1, ..., k + count - 1, along with affine coordinates ( as integers ) of their
+    multiples of generator, obtained by repeatedly adding G, sharing one inversion across all of them
+    """
+    points = [mul_generator(k)]
+    for _ in range(count - 1):
+        points.append(points[-1].addMixed(Point.generator()))
+
+    affine = Point.batch_to_affine(points)
+    return [(k + i, x.to_num(), y.to_num()) for i, (x, y) in enumerate(affine)]
+
+
+def signed_messages(count: int, distinct_keys: bool = False):
+    """
+    Random messages, along with their signatures, under same key or each under a distinct one.
+
+    Signing 10,000 messages one by one would dominate run time, so nonces ( and keys ) are
+    consecutive, obtained by repeatedly adding G. As that leaks secret keys, never do it outside
+    of benchmarks.
+    """
+    keys = consecutive_multiples(
+        rng.randrange(1, N - count), count if distinct_keys else 1
+    )
+    nonces = consecutive_multiples(rng.randrange(1, N - count), count)
+
+    items = []
+    for i, (k, rx, ry) in enumerate(nonces):
+        d, px, py = keys[i if distinct_keys else 0]
+
+        # x-only public key and ephemeral point stand for ones with even y-coordinate
+        d = d if py & 1 == 0 else N - d
+        k = k if ry & 1 == 0 else N - k
+        pkey = px.to_bytes(32, "big")
+        r = rx.to_bytes(32, "big")
+        msg = rng.randbytes(32)
+
+        s = (k + hash_challenge(r, pkey, msg) * d) % N
+        items.append((pkey, msg, r + s.to_bytes(32, "big")))
+
+    return items
+
+
+def test_sign(benchmark):
+    """
+    Benchmark Schnorr signing
+    """
+    benchmark.pedantic(
+        schnorr.sign, args=(SKEY, rng.randbytes(32)), rounds=5, warmup_rounds=1
+    )
+
+
+def test_verify(benchmark):
+    """
+    Benchmark Schnorr verification
+    """
+    (item,) = signed_messages(1)
+    benchmark.pedantic(schnorr.verify, args=item, rounds=5, warmup_rounds=1)
+
+
+@pytest.mark.parametrize("keys", ["distinct", "same"])
+@pytest.mark.parametrize("size", BATCH_SIZES)
+def test_verify_batch(benchmark, size, keys):
+    """
+    Benchmark Schnorr batch verification of many signatures, using one multi-scalar multiplication,
+    recording per signature cost ( in seconds ) as `per_signature` in extra info. Signatures are
+    either each under a distinct key ( typical ) or all under same key ( best case, as terms of
+    same key are merged into one ).
+    """
+    items = signed_messages(size, keys == "distinct")
+    assert schnorr.verify(*items[-1])
+
+    res = benchmark.pedantic(schnorr.verify_batch, args=(items,), rounds=1)
+    assert all(res)
+
+    benchmark.extra_info["per_signature"] = benchmark.stats.stats.min / size
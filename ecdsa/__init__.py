@@ -1,5 +1,12 @@
 #!/usr/bin/python3
 
 from .keygen import keygen
-from .sign import sign
-from .verify import verify
+from .sign import sign, sign_batch
+from .signer import Signer
+from .verify import verify, verify_digest, verify_many
+from .batch import verify_batch
+from .recover import recover, recover_batch
+from .prepared import PreparedPublicKey, PublicKeyCache, PUBLIC_KEY_CACHE
+from .parallel import ParallelExecutor
+from .aio import AsyncECDSA
+from .stream import verify_file
@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+
+import sys
+from os import cpu_count
+from time import perf_counter
+from argparse import ArgumentParser
+from .parallel import ParallelExecutor, benchmark
+from .stream import DEFAULT_BATCH_SIZE, verify_file
+
+
+def report_progress(start: float):
+    """
+    Returns a callback, printing number of verified records and throughput to stderr, at most
+    once a second ( and once, when done )
+    """
+    last = start
+
+    def report(done: int, total: int):
+        nonlocal last
+
+        now = perf_counter()
+        if now - last < 1 and done < total:
+            return
+        last = now
+
+        rate = done / max(now - start, 1e-9)
+        print(
+            f"\rverified {done}/{total} records ( {100 * done / total:.1f}% ), {rate:.1f} records/s",
+            end="\n" if done == total else "",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    return report
+
+
+def run_verify_file(path: str, batch_size: int, workers: int) -> int:
+    """
+    Verifies records of given file, printing indices of failing ones to stdout. Returns exit
+    status, which is non-zero if some record failed verification.
+    """
+    progress = report_progress(perf_counter())
+    failures = 0
+
+    if workers > 1:
+        with ParallelExecutor(workers) as executor:
+            for idx in verify_file(
+                path,
+                batch_size,
+                executor=executor.pool,
+                max_inflight=2 * workers,
+                progress=progress,
+            ):
+                print(idx, flush=True)
+                failures += 1
+    else:
+        for idx in verify_file(path, batch_size, progress=progress):
+            print(idx, flush=True)
+            failures += 1
+
+    print(f"{failures} record(s) failed verification", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def main():
+    parser = ArgumentParser(
+        prog="python -m ecdsa", description="secp256k1 ECDSA utilities"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bench = commands.add_parser(
+        "bench-parallel",
+        help="benchmark parallel sign/ verify throughput, scaling worker count",
+    )
+    bench.add_argument(
+        "--count", type=int, default=256, help="operations per measurement"
+    )
+    bench.add_argument("--max-workers", type=int, default=cpu_count() or 1)
+
+    verify = commands.add_parser(
+        "verify-file",
+        help="verify a file of fixed size (pubkey, digest, r, s) records, printing indices of failing ones",
+    )
+    verify.add_argument(
+        "path", help="file of records, see `ecdsa.stream.encode_record`"
+    )
+    verify.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="records verified together",
+    )
+    verify.add_argument(
+        "--workers", type=int, default=1, help="number of worker processes"
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "bench-parallel":
+        benchmark(args.count, args.max_workers)
+    elif args.command == "verify-file":
+        sys.exit(run_verify_file(args.path, args.batch_size, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+#!/usr/bin/python3
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple, Union
+from point import Point
+from .batch import Signature
+from .parallel import sign_chunk, verify_chunk
+
+# Maximum number of requests coalesced into one micro-batch
+DEFAULT_MAX_BATCH_SIZE: int = 64
+
+# Maximum time ( in seconds ) a request waits for others to join its micro-batch
+DEFAULT_MAX_DELAY: float = 0.002
+
+# Maximum number of requests admitted at once, beyond which callers wait for a free slot
+DEFAULT_MAX_PENDING: int = 1 << 10
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrently submitted requests into micro-batches, each of which is handed over to
+    `func` ( which takes a list of requests and returns a list of results, in same order ), running
+    on given executor, so that event loop is never blocked.
+
+    A micro-batch is dispatched as soon as it has `max_batch_size` requests or its oldest request has
+    waited for `max_delay` seconds. At most `max_pending` requests are admitted at once and at most
+    `max_inflight` micro-batches run at once, so that bursts are queued up, instead of piling up work.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[List[Any]], List[Any]],
+        executor: Executor,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_inflight: int = 1,
+    ):
+        assert max_batch_size > 0, "micro-batch size must be positive"
+        assert max_delay >= 0, "micro-batch delay must be non-negative"
+        assert max_pending > 0, "number of pending requests must be positive"
+        assert max_inflight > 0, "number of in-flight micro-batches must be positive"
+
+        self._func = func
+        self._executor = executor
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._max_pending = max_pending
+        self._max_inflight = max_inflight
+
+        # created lazily, so that they're bound to event loop which submits requests
+        self._queue = None
+        self._pending = None
+        self._inflight = None
+        self._runner = None
+        self._tasks = set()
+        self._closed = False
+
+    def _start(self):
+        """
+        Creates queue, semaphores and background task dispatching micro-batches, on first request
+        """
+        self._queue = asyncio.Queue()
+        self._pending = asyncio.Semaphore(self._max_pending)
+        self._inflight = asyncio.Semaphore(self._max_inflight)
+        self._runner = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(self, request: Any) -> Any:
+        """
+        Submits a request, waiting for a free slot if too many are pending, and returns its result
+        once micro-batch holding it has been processed. Requests still waiting for a slot, when
+        batcher is closed, are rejected.
+        """
+        if self._closed:
+            raise RuntimeError("micro-batcher is closed")
+        if self._runner is None:
+            self._start()
+
+        async with self._pending:
+            if self._closed:
+                raise RuntimeError("micro-batcher is closed")
+
+            fut = asyncio.get_running_loop().create_future()
+            self._queue.put_nowait((request, fut))
+            return await fut
+
+    async def _collect(self) -> Tuple[List[Tuple[Any, asyncio.Future]], bool]:
+        """
+        Waits for a request, then collects more of them until micro-batch is full or its deadline
+        is reached. Returns collected requests and whether batcher is closing.
+        """
+        loop = asyncio.get_running_loop()
+
+        item = await self._queue.get()
+        if item is None:
+            return [], True
+
+        batch = [item]
+        deadline = loop.time() + self._max_delay
+
+        while len(batch) < self._max_batch_size:
+            if self._queue.empty():
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                item = self._queue.get_nowait()
+
+            if item is None:
+                return batch, True
+
+            batch.append(item)
+
+        return batch, False
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """
+        Processes a micro-batch on executor, resolving futures of its requests
+        """
+        loop = asyncio.get_running_loop()
+
+        # requests cancelled by their callers, while waiting, are dropped
+        batch = [(request, fut) for request, fut in batch if not fut.done()]
+
+        try:
+            if batch:
+                results = await loop.run_in_executor(
+                    self._executor, self._func, [request for request, _ in batch]
+                )
+                for (_, fut), res in zip(batch, results):
+                    if not fut.done():
+                        fut.set_result(res)
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+        finally:
+            self._inflight.release()
+
+    async def _run(self):
+        """
+        Background task, forming micro-batches and dispatching them, until batcher is closed
+        """
+        closing = False
+        while not closing:
+            batch, closing = await self._collect()
+            if not batch:
+                continue
+
+            await self._inflight.acquire()
+            task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def close(self):
+        """
+        Stops admitting new requests and waits until already submitted ones are processed
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        if self._runner is not None:
+            self._queue.put_nowait(None)
+            await self._runner
+
+            # nothing reads queue anymore, so fail whatever is left behind
+            while not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is not None and not item[1].done():
+                    item[1].set_exception(RuntimeError("micro-batcher is closed"))
+
+
+class AsyncECDSA:
+    """
+    asyncio friendly ECDSA sign/ verify API, which offloads work to an executor ( a single worker
+    thread, by default ), while coalescing concurrent requests into micro-batches, so that batch
+    inversion ( see `sign_batch`, `verify_many` ) and batch verification ( see `verify_batch` )
+    pay off.
+
+    Passing a process pool executor ( along with `max_inflight` = number of workers ) lets micro-batches
+    run on multiple cores. Use as an async context manager or call `close` when done.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_inflight: int = 1,
+    ):
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_inflight)
+
+        kwargs = dict(
+            executor=self._executor,
+            max_batch_size=max_batch_size,
+            max_delay=max_delay,
+            max_pending=max_pending,
+            max_inflight=max_inflight,
+        )
+        self._signer = MicroBatcher(sign_chunk, **kwargs)
+        self._verifier = MicroBatcher(verify_chunk, **kwargs)
+
+    async def sign(self, skey: int, msg: bytes) -> Tuple[int, int]:
+        """
+        Signs message using ECDSA secret key, see `ecdsa.sign`
+        """
+        return await self._signer.submit((skey, msg))
+
+    async def verify(
+        self, pkey: Point, msg: bytes, sig: Union[Tuple[int, int], Signature]
+    ) -> bool:
+        """
+        Verifies ECDSA signature ( either (r, s) or (r, s, R), see `ecdsa.verify_batch` ) over
+        message, using public key
+        """
+        return await self._verifier.submit((pkey, msg, sig))
+
+    async def close(self):
+        """
+        Waits until already submitted requests are processed, then releases executor, if owned
+        """
+        await self._signer.close()
+        await self._verifier.close()
+
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        await self.close()
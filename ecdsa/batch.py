@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+
+from typing import List, Tuple, Union
+from field import N
+from field import ScalarField
+from .hashing import hash_message
+from .verify import has_affine_x_mod_n
+from point import Point, mul_generator, mul_multi_scalar, random_coefficient, bisect
+
+# A signature (r, s, R), where R is either the ephemeral point itself or its recovery id
+Signature = Tuple[int, int, Union[Point, int]]
+
+
+def ephemeral_point(r: int, R: Union[Point, int]) -> Point:
+    """
+    Given `r` of an ECDSA signature and either ephemeral point `R` or its recovery id, this routine
+    returns `R` after ensuring its x-coordinate matches `r`.
+
+    Recovery id is a two -bit integer, where bit 0 denotes parity of R's y-coordinate and bit 1 denotes
+    whether R's x-coordinate is r + n. Raises ValueError, if no such point exists.
+    """
+    if isinstance(R, Point):
+        if has_affine_x_mod_n(R, r):
+            return R
+
+        raise ValueError("x-coordinate of ephemeral point doesn't match r")
+
+    if not 0 <= R < 4:
+        raise ValueError("recovery id must be ∈ [0, 4)")
+
+    return Point.liftX(r + (R >> 1) * N, R & 1)
+
+
+def check_batch(items: List[Tuple[Point, int, int, int, Point]]) -> bool:
+    """
+    Given (Q, h, r, s, R) tuples, this routine checks whether s * R = h * G + r * Q holds for all
+    of them at once, by testing Σ z * (h * G + r * Q - s * R) = 0 for random coefficients z, using
+    one multi-scalar multiplication, see section 3 of https://eprint.iacr.org/2012/549.pdf
+    """
+    g = 0
+    scalars = []
+    points = []
+
+    for idx, (q, h, r, s, R) in enumerate(items):
+        z = ScalarField.from_num(random_coefficient(idx))
+
+        g += z.mul_num(h)
+        scalars.append(z.mul_num(r))
+        points.append(q)
+        scalars.append((N - z.mul_num(s)) % N)
+        points.append(R)
+
+    res = mul_generator(g % N) + mul_multi_scalar(scalars, points)
+    return res.isZero()
+
+
+def verify_batch(items: List[Tuple[Point, bytes, Signature]]) -> List[bool]:
+    """
+    Given a batch of (ECDSA public key, message, signature) tuples, where each signature carries
+    its ephemeral point `R` or its recovery id ( i.e. (r, s, R) ), this routine verifies all of them
+    using randomized linear combination, falling back to bisection for locating invalid ones.
+
+    Returns per entry boolean values denoting success, in same order as input.
+    """
+    res = [False] * len(items)
+    pending = []
+    positions = []
+
+    for idx, (pkey, msg, (r, s, R)) in enumerate(items):
+        if not (0 < r < N and 0 < s < N):
+            continue
+
+        try:
+            R = ephemeral_point(r, R)
+        except ValueError:
+            continue
+
+        pending.append((pkey, hash_message(msg), r, s, R))
+        positions.append(idx)
+
+    for idx, ok in zip(positions, bisect(pending, check_batch)):
+        res[idx] = ok
+
+    return res
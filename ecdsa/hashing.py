@@ -0,0 +1,14 @@
+#!/usr/bin/python3
+
+from hashlib import sha3_256
+from field import N
+
+
+def hash_message(msg: bytes) -> int:
+    """
+    Hashes message using SHA3-256, interpreting digest as a big-endian integer,
+    reduced modulo secp256k1 scalar field prime
+    """
+    h = sha3_256(msg).digest()
+    h = int.from_bytes(h, byteorder="big")
+    return h % N
@@ -1,9 +1,8 @@
 #!/usr/bin/python3
 
 from typing import Tuple
-from field import Gx, Gy, N
-from point import Point
-from field import BaseField
+from field import N
+from point import Point, mul_generator
 from secrets import randbelow
 
 
@@ -20,8 +19,7 @@ def generate_public_key(skey: int) -> Point:
     Given an ECDSA secret key, this routine generates corresponding ECDSA public key
     s.t. pkey = skey * G | G = secp256k1 generator point
     """
-    gen = Point.fromAffine(BaseField.from_num(Gx), BaseField.from_num(Gy))
-    pkey = gen.mulScalar(skey)
+    pkey = mul_generator(skey)
 
     return pkey
 
@@ -0,0 +1,187 @@
+#!/usr/bin/python3
+
+from os import cpu_count
+from time import perf_counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple, Union
+from point import (
+    Point,
+    generator_table,
+    set_generator_table_budget,
+    get_generator_table_budget,
+)
+from point.multi_scalar import generator_endo_odd_multiples
+from .sign import sign_batch
+from .verify import verify_many
+from .batch import Signature, verify_batch
+from .keygen import keygen
+
+# Each worker is handed roughly these many chunks of a batch, so that load stays balanced
+CHUNKS_PER_WORKER: int = 4
+
+# Bounds on number of sign/ verify operations sent to a worker in one go
+MIN_CHUNK_SIZE: int = 1
+MAX_CHUNK_SIZE: int = 1 << 10
+
+
+def warm_up(memory_budget: int):
+    """
+    Runs once in each worker process, building precomputed generator tables up front, so that
+    first chunk handled by worker doesn't pay for them
+    """
+    set_generator_table_budget(memory_budget)
+    generator_table()
+    generator_endo_odd_multiples()
+
+
+def sign_chunk(chunk: List[Tuple[int, bytes]]) -> List[Tuple[int, int]]:
+    """
+    Signs a chunk of (ECDSA secret key, message) pairs, inside worker process
+    """
+    return sign_batch(chunk)
+
+
+def verify_chunk(
+    chunk: List[Tuple[Point, bytes, Union[Tuple[int, int], Signature]]]
+) -> List[bool]:
+    """
+    Verifies a chunk of (ECDSA public key, message, signature) tuples, inside worker process.
+    Signatures carrying ephemeral point or its recovery id ( i.e. (r, s, R) ) are verified together
+    using `verify_batch`, while others are verified using `verify_many`.
+    """
+    plain = [idx for idx, (_, _, sig) in enumerate(chunk) if len(sig) == 2]
+    extended = [idx for idx, (_, _, sig) in enumerate(chunk) if len(sig) != 2]
+
+    res = [False] * len(chunk)
+    for idx, ok in zip(plain, verify_many([chunk[idx] for idx in plain])):
+        res[idx] = ok
+    for idx, ok in zip(extended, verify_batch([chunk[idx] for idx in extended])):
+        res[idx] = ok
+
+    return res
+
+
+class ParallelExecutor:
+    """
+    Shards large batches of ECDSA sign/ verify operations across a pool of worker processes,
+    returning results in input order. Use as a context manager or call `close` when done.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: Optional[int] = None):
+        self._workers = workers or cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._pool = ProcessPoolExecutor(
+            max_workers=self._workers,
+            initializer=warm_up,
+            initargs=(get_generator_table_budget(),),
+        )
+
+    @property
+    def workers(self) -> int:
+        """
+        Number of worker processes in pool
+        """
+        return self._workers
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        """
+        Underlying pool of ( warmed up ) worker processes, for submitting other work to
+        """
+        return self._pool
+
+    def chunk_size(self, count: int) -> int:
+        """
+        Chooses number of operations per chunk, for a batch of given size, unless it's fixed
+        during construction. Aims for `CHUNKS_PER_WORKER` chunks per worker, so that slower
+        chunks don't leave other workers idle, while keeping inter-process overhead amortized.
+        """
+        if self._chunk_size is not None:
+            return self._chunk_size
+
+        size = -(-count // (self._workers * CHUNKS_PER_WORKER))
+        return max(MIN_CHUNK_SIZE, min(size, MAX_CHUNK_SIZE))
+
+    def _run(self, func, items: Sequence) -> List:
+        """
+        Splits items into chunks, maps them over worker processes and flattens results,
+        preserving input order
+        """
+        size = self.chunk_size(len(items))
+        chunks = [list(items[i : i + size]) for i in range(0, len(items), size)]
+
+        res = []
+        for part in self._pool.map(func, chunks):
+            res.extend(part)
+
+        return res
+
+    def sign(self, items: Sequence[Tuple[int, bytes]]) -> List[Tuple[int, int]]:
+        """
+        Signs many (ECDSA secret key, message) pairs in parallel, returning signatures in input order
+        """
+        return self._run(sign_chunk, items)
+
+    def verify(
+        self, items: Sequence[Tuple[Point, bytes, Union[Tuple[int, int], Signature]]]
+    ) -> List[bool]:
+        """
+        Verifies many (ECDSA public key, message, signature) tuples in parallel, returning
+        boolean values denoting success, in input order
+        """
+        return self._run(verify_chunk, items)
+
+    def close(self):
+        """
+        Shuts down worker processes, after pending work is done
+        """
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def benchmark(count: int, max_workers: int):
+    """
+    Reports sign/ verify throughput of `ParallelExecutor`, while scaling number of worker
+    processes from 1 to `max_workers`, along with speedup of each, relative to single worker
+    """
+    keys = [keygen() for _ in range(min(count, 16))]
+    msgs = [i.to_bytes(8, "big") for i in range(count)]
+
+    sign_items = [(keys[i % len(keys)][0], msg) for i, msg in enumerate(msgs)]
+
+    print(
+        f"{'workers':>8} {'sign/s':>12} {'speedup':>8} {'verify/s':>12} {'speedup':>8}"
+    )
+
+    sign_base = verify_base = None
+    for workers in range(1, max_workers + 1):
+        with ParallelExecutor(workers) as executor:
+            # warm up worker processes, before measuring
+            executor.sign(sign_items[:workers])
+
+            start = perf_counter()
+            sigs = executor.sign(sign_items)
+            sign_rate = count / (perf_counter() - start)
+
+            verify_items = [
+                (keys[i % len(keys)][1], msg, sig)
+                for i, (msg, sig) in enumerate(zip(msgs, sigs))
+            ]
+
+            start = perf_counter()
+            res = executor.verify(verify_items)
+            verify_rate = count / (perf_counter() - start)
+
+            assert all(res), "signature verification failed"
+
+        sign_base = sign_base or sign_rate
+        verify_base = verify_base or verify_rate
+        print(
+            f"{workers:>8} {sign_rate:>12.1f} {sign_rate / sign_base:>7.2f}x"
+            f" {verify_rate:>12.1f} {verify_rate / verify_base:>7.2f}x"
+        )
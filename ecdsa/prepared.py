@@ -0,0 +1,164 @@
+#!/usr/bin/python3
+
+from threading import Lock
+from collections import OrderedDict
+from typing import NamedTuple, Union
+from point import Point, OddMultiples, mul_double_scalar
+
+# Window width of wNAF, used for precomputed odd multiples of a prepared public key
+PREPARED_WNAF_WIDTH: int = 6
+
+# Default number of prepared public keys kept around by a cache
+DEFAULT_CACHE_SIZE: int = 1 << 10
+
+
+class PreparedPublicKey:
+    """
+    An ECDSA public key `Q`, along with its precomputed odd multiples ( and their images under
+    secp256k1 endomorphism ), normalized s.t. Z = 1, so that many signatures can be verified
+    under same key without recomputing them
+    """
+
+    def __init__(self, pkey: Point, width: int = PREPARED_WNAF_WIDTH):
+        self._point = pkey
+        self._table = OddMultiples(pkey, width, normalized=True)
+        # images of odd multiples under endomorphism are computed lazily, force it now
+        self._table.endo
+
+    @property
+    def point(self) -> Point:
+        """
+        Public key, as secp256k1 elliptic curve point
+        """
+        return self._point
+
+    def mul_double_scalar(self, u1: int, u2: int) -> Point:
+        """
+        Computes u1 * G + u2 * Q, using precomputed odd multiples of Q
+        """
+        return mul_double_scalar(u1, u2, self._table)
+
+
+class CacheStats(NamedTuple):
+    """
+    Usage statistics of a prepared public key cache
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class PublicKeyCache:
+    """
+    A bounded, thread-safe cache of prepared public keys, keyed by their SEC1 encoding, which evicts
+    least recently used entry when full. Cache with maxsize = 0 keeps nothing, so it doesn't
+    prepare public keys either.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        assert maxsize >= 0, "cache size must be non-negative"
+
+        self._lock = Lock()
+        self._entries = OrderedDict()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(
+        self, pkey: Union[Point, PreparedPublicKey]
+    ) -> Union[Point, PreparedPublicKey]:
+        """
+        Returns prepared form of given public key, either from cache or by preparing it now,
+        in which case it's also cached. When cache can't keep anything, public key is returned
+        as is, as preparing it would cost more than it saves for a single verification.
+        """
+        if isinstance(pkey, PreparedPublicKey):
+            return pkey
+
+        key = pkey.to_bytes()
+
+        with self._lock:
+            prepared = self._entries.get(key)
+            if prepared is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return prepared
+
+            self._misses += 1
+            if self._maxsize == 0:
+                return pkey
+
+        # precomputation happens outside of lock, so that other keys can be served meanwhile
+        prepared = PreparedPublicKey(pkey)
+
+        with self._lock:
+            self._entries[key] = prepared
+            self._entries.move_to_end(key)
+            self._evict()
+
+        return prepared
+
+    def _evict(self):
+        """
+        Evicts least recently used entries, until cache size is within bound. Must be called
+        while holding lock.
+        """
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def resize(self, maxsize: int):
+        """
+        Changes maximum number of entries kept in cache, evicting least recently used ones if needed
+        """
+        assert maxsize >= 0, "cache size must be non-negative"
+
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def discard(self, pkey: Point):
+        """
+        Evicts given public key from cache, if it's present
+        """
+        key = pkey.to_bytes()
+
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._evictions += 1
+
+    def clear(self):
+        """
+        Evicts all entries and resets usage statistics
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """
+        Usage statistics, useful for sizing cache as per distribution of public keys
+        """
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._maxsize,
+            )
+
+    def __len__(self) -> int:
+        """
+        Number of prepared public keys currently kept in cache
+        """
+        with self._lock:
+            return len(self._entries)
+
+
+# Process-wide cache, transparently used by `verify`
+PUBLIC_KEY_CACHE = PublicKeyCache()
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+
+from typing import List, Optional, Tuple
+from field import N, ScalarField, batch_inv
+from point import Point, mul_double_scalar
+from .hashing import hash_message
+from .batch import ephemeral_point
+
+
+def recover(msg: bytes, sig: Tuple[int, int], recid: int) -> Point:
+    """
+    Given message, ECDSA signature (r, s) and recovery id of its ephemeral point `R` ( see `sign` with
+    `recoverable` set ), this routine recovers public key Q = r^-1 * (s * R - h * G), using one
+    x-coordinate decompression and one double-scalar multiplication, see section 4.1.6 of
+    https://www.secg.org/sec1-v2.pdf
+
+    Raises ValueError, if no public key can be recovered. Recovered key still needs to be checked
+    against expected one ( or verified signature must be tied to it some other way ).
+    """
+    (r, s) = sig
+    if not (0 < r < N and 0 < s < N):
+        raise ValueError("signature must have r, s ∈ (0, N)")
+
+    R = ephemeral_point(r, recid)
+
+    r1 = ScalarField.from_num(r).inv_vartime()
+
+    t0 = (N - r1.mul_num(hash_message(msg))) % N
+    t1 = r1.mul_num(s)
+
+    q = mul_double_scalar(t0, t1, R)
+    if q.isZero():
+        raise ValueError("recovered public key is identity element")
+
+    return q
+
+
+def recover_batch(
+    items: List[Tuple[bytes, Tuple[int, int], int]]
+) -> List[Optional[Point]]:
+    """
+    Given many (message, signature, recovery id) tuples, this routine recovers public key of each
+    of them, same as `recover`, while sharing one scalar field inversion ( for inverting `r` ) and one
+    base field inversion ( for normalizing recovered keys s.t. Z = 1 ) across whole batch.
+
+    Returns recovered public keys in same order as input, where None denotes failure.
+    """
+    pending = []
+    positions = []
+
+    for idx, (msg, (r, s), recid) in enumerate(items):
+        if not (0 < r < N and 0 < s < N):
+            continue
+
+        try:
+            R = ephemeral_point(r, recid)
+        except ValueError:
+            continue
+
+        pending.append((hash_message(msg), r, s, R))
+        positions.append(idx)
+
+    r1s = batch_inv([ScalarField.from_num(r) for _, r, _, _ in pending], vartime=True)
+
+    points = []
+    for (h, _, s, R), r1 in zip(pending, r1s):
+        t0 = (N - r1.mul_num(h)) % N
+        t1 = r1.mul_num(s)
+
+        points.append(mul_double_scalar(t0, t1, R))
+
+    res = [None] * len(items)
+    for idx, q, (x, y) in zip(positions, points, Point.batch_to_affine(points)):
+        if not q.isZero():
+            res[idx] = Point.fromAffine(x, y)
+
+    return res
@@ -1,40 +1,84 @@
 #!/usr/bin/python3
 
 
-from typing import Tuple
-from hashlib import sha3_256
-from field import BaseField
-from field import ScalarField
-from point import Point
+from typing import List, Tuple, Union
+from field import ScalarField, batch_inv
+from .hashing import hash_message
+from point import Point, mul_generator
 from secrets import randbelow
-from field import Gx, Gy, N
+from field import N
 
 
-def sign(skey: int, msg: bytes) -> Tuple[int, int]:
+def sign(
+    skey: int, msg: bytes, recoverable: bool = False
+) -> Union[Tuple[int, int], Tuple[int, int, int]]:
     """
     Given ECDSA secret key ( a 256 -bit integer ) and a message `m`, this routine attempts to
     perform randomized signing, while hashing the message using SHA3-256.
 
-    Returns (r, s) two 256 -bit integers ( ∈ [0, n) ), as ECDSA signature.
+    Returns (r, s) two 256 -bit integers ( ∈ [0, n) ), as ECDSA signature. If `recoverable` is set,
+    also returns recovery id of ephemeral point ( i.e. (r, s, recid), see `ecdsa.recover` ).
 
     Follows scheme described https://cryptobook.nakov.com/digital-signatures/ecdsa-sign-verify-messages#ecdsa-sign
     """
-    h = sha3_256(msg).digest()
-    h = int.from_bytes(h, byteorder="big")
-    h = h % N
+    h = hash_message(msg)
 
     k = 1 + randbelow(N - 1)
 
-    g = Point.fromAffine(BaseField.from_num(Gx), BaseField.from_num(Gy))
-    r = g.mulScalar(k)
-    r = r.toAffine()[0].to_num()
+    x, y = mul_generator(k).toAffine()
+    r = x.to_num()
 
     t0 = ScalarField.from_num(k).inv()
-    t1 = ScalarField.from_num(h)
-    t2 = ScalarField.from_num(r)
-    t3 = ScalarField.from_num(skey)
+    t1 = ScalarField.from_num(skey).mul_num(r)
+    s = t0.mul_num((h + t1) % N)
 
-    t4 = t0 * (t1 + t2 * t3)
-    s = t4.to_num()
+    if recoverable:
+        # r is affine x-coordinate itself, so only parity of y-coordinate needs to be recorded
+        return r, s, y.to_num() & 1
 
     return r, s
+
+
+def precompute_nonces(count: int) -> List[Tuple[ScalarField, int]]:
+    """
+    Precomputes message independent part of ECDSA signing, for given number of fresh random nonces
+    `k`, returning (k^-1, r) pairs, where r = x-coordinate of k * G. One base field inversion and one
+    scalar field inversion are shared across all of them, see `batch_inv`.
+
+    Each pair must be used for signing exactly once, otherwise secret key is leaked.
+    """
+    nonces = [1 + randbelow(N - 1) for _ in range(count)]
+
+    rs = Point.batch_to_affine([mul_generator(k) for k in nonces])
+    ks = batch_inv([ScalarField.from_num(k) for k in nonces])
+
+    return [(k1, x.to_num()) for k1, (x, _) in zip(ks, rs)]
+
+
+def sign_with_nonce(
+    skey: ScalarField, h: int, nonce: Tuple[ScalarField, int]
+) -> Tuple[int, int]:
+    """
+    Given ECDSA secret key, message digest `h` ( see `hash_message` ) and a precomputed (k^-1, r)
+    pair ( see `precompute_nonces` ), this routine computes signature (r, s = k^-1 * (h + r * skey))
+    """
+    t0, r = nonce
+
+    t1 = skey.mul_num(r)
+    return r, t0.mul_num((h + t1) % N)
+
+
+def sign_batch(items: List[Tuple[int, bytes]]) -> List[Tuple[int, int]]:
+    """
+    Given many (ECDSA secret key, message) pairs, this routine signs each of them, same as `sign`,
+    while sharing one base field inversion ( for computing affine x-coordinates of ephemeral points )
+    and one scalar field inversion ( for inverting nonces ) across whole batch, see `precompute_nonces`.
+
+    Returns signatures in same order as input.
+    """
+    nonces = precompute_nonces(len(items))
+
+    return [
+        sign_with_nonce(ScalarField.from_num(skey), hash_message(msg), nonce)
+        for (skey, msg), nonce in zip(items, nonces)
+    ]
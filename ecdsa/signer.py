@@ -0,0 +1,197 @@
+#!/usr/bin/python3
+
+import os
+from collections import deque
+from threading import Condition, Thread
+from weakref import WeakSet
+from typing import NamedTuple, Optional, Tuple
+from field import ScalarField
+from .hashing import hash_message
+from .sign import precompute_nonces, sign_with_nonce
+
+# Maximum number of precomputed (k^-1, r) pairs kept in pool
+DEFAULT_POOL_SIZE: int = 1 << 8
+
+# Pool is refilled, once number of precomputed pairs drops to these many
+DEFAULT_LOW_WATERMARK: int = 1 << 6
+
+# Number of pairs precomputed together, sharing inversions
+DEFAULT_REFILL_BATCH: int = 1 << 5
+
+
+# Live signers, whose nonce pools are discarded in a forked child, see `Signer._after_fork_in_child`
+_signers: WeakSet = WeakSet()
+
+
+def _after_fork_in_child():
+    """
+    Resets every live signer in a freshly forked child process, so that it never spends a nonce
+    precomputed by its parent
+    """
+    for signer in list(_signers):
+        signer._after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+class SignerStats(NamedTuple):
+    """
+    Usage statistics of a signer's nonce pool
+    """
+
+    signed: int
+    # signatures for which pool was empty, so nonce was computed on the spot
+    misses: int
+    precomputed: int
+    size: int
+    capacity: int
+
+
+class Signer:
+    """
+    ECDSA signer for a fixed secret key, which splits signing into an offline phase, where (k^-1, r)
+    pairs are precomputed by a background thread into a bounded pool, and an online phase, where a
+    message is signed by hashing it and spending one of those pairs, costing just two scalar field
+    multiplications.
+
+    Each precomputed pair is removed from pool when spent, so it's used exactly once. If pool runs
+    empty, a pair is computed on the spot, which is counted as a miss, see `stats`. Use as a context
+    manager or call `close` when done.
+
+    Signer is fork-safe i.e. a forked child process discards pool it inherits and refills its own,
+    as parent and child signing different messages with same nonce would reveal secret key.
+    """
+
+    def __init__(
+        self,
+        skey: int,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        low_watermark: int = DEFAULT_LOW_WATERMARK,
+        refill_batch: int = DEFAULT_REFILL_BATCH,
+    ):
+        assert pool_size > 0, "pool size must be positive"
+        assert 0 <= low_watermark < pool_size, "low watermark must be ∈ [0, pool size)"
+        assert refill_batch > 0, "refill batch size must be positive"
+
+        self._skey = ScalarField.from_num(skey)
+        self._pool_size = pool_size
+        self._low_watermark = low_watermark
+        self._refill_batch = refill_batch
+
+        self._cond = Condition()
+        self._pool = deque()
+        self._closed = False
+        self._signed = 0
+        self._misses = 0
+        self._precomputed = 0
+
+        self._worker = Thread(target=self._refill, daemon=True)
+        self._worker.start()
+        _signers.add(self)
+
+    def _after_fork_in_child(self):
+        """
+        Discards nonce pool inherited from parent process and restarts background thread, which
+        doesn't survive fork. Lock is replaced too, as it may have been held by a parent's thread.
+        """
+        self._cond = Condition()
+        self._pool = deque()
+
+        if not self._closed:
+            self._worker = Thread(target=self._refill, daemon=True)
+            self._worker.start()
+
+    def _refill(self):
+        """
+        Background thread, which tops up pool to its capacity ( in batches ), whenever it drops to
+        low watermark
+        """
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed or len(self._pool) <= self._low_watermark
+                )
+                if self._closed:
+                    return
+
+            while True:
+                with self._cond:
+                    if self._closed:
+                        return
+
+                    count = min(self._refill_batch, self._pool_size - len(self._pool))
+                    if count <= 0:
+                        break
+
+                # precomputation happens outside of lock, so that signing isn't blocked meanwhile
+                nonces = precompute_nonces(count)
+
+                with self._cond:
+                    if self._closed:
+                        return
+
+                    self._pool.extend(nonces)
+                    self._precomputed += count
+                    self._cond.notify_all()
+
+    def sign(self, msg: bytes) -> Tuple[int, int]:
+        """
+        Signs message, same as `ecdsa.sign`, using a precomputed (k^-1, r) pair, if one's available
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("signer is closed")
+
+            nonce = self._pool.popleft() if self._pool else None
+
+            self._signed += 1
+            if nonce is None:
+                self._misses += 1
+            if len(self._pool) <= self._low_watermark:
+                self._cond.notify_all()
+
+        if nonce is None:
+            (nonce,) = precompute_nonces(1)
+
+        return sign_with_nonce(self._skey, hash_message(msg), nonce)
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until pool is filled up to its capacity, returning whether it happened before timeout
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._closed or len(self._pool) >= self._pool_size, timeout
+            )
+
+    def stats(self) -> SignerStats:
+        """
+        Usage statistics, useful for tuning pool size and refill parameters
+        """
+        with self._cond:
+            return SignerStats(
+                self._signed,
+                self._misses,
+                self._precomputed,
+                len(self._pool),
+                self._pool_size,
+            )
+
+    def close(self):
+        """
+        Stops background thread and discards unused precomputed pairs, so that they're never spent
+        """
+        with self._cond:
+            self._closed = True
+            self._pool.clear()
+            self._cond.notify_all()
+
+        self._worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
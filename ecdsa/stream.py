@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+
+import mmap
+from collections import deque
+from concurrent.futures import Executor
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+from point import Point
+from .verify import verify_many_digests
+
+# Each record is 64 -bytes public key ( big-endian affine x, y coordinates ), followed by 32 -bytes
+# big-endian message digest ( see `hash_message` ) and 32 -bytes big-endian r, s, of signature
+PKEY_SIZE: int = 64
+RECORD_SIZE: int = PKEY_SIZE + 3 * 32
+
+# Number of records verified together, sharing inversions, see `verify_many_digests`
+DEFAULT_BATCH_SIZE: int = 256
+
+
+def encode_record(pkey: Point, h: int, sig: Tuple[int, int]) -> bytes:
+    """
+    Encodes (ECDSA public key, message digest, signature) as a fixed size record, which can be
+    appended to a file, verifiable using `verify_file`
+    """
+    x, y = pkey.toAffine()
+    (r, s) = sig
+
+    return b"".join(v.to_bytes(32, "big") for v in (x.to_num(), y.to_num(), h, r, s))
+
+
+def decode_public_key(buf: memoryview) -> Optional[Point]:
+    """
+    Decodes public key from its 64 -bytes encoding ( i.e. SEC1 uncompressed encoding, without
+    leading 0x04 byte ), returning None if it's not a point on curve
+    """
+    try:
+        return Point.from_bytes(b"\x04" + buf)
+    except ValueError:
+        return None
+
+
+def verify_records(buf: Union[bytes, memoryview]) -> List[int]:
+    """
+    Verifies a chunk of consecutive records, returning ( sorted ) indices of those failing
+    verification, relative to start of chunk. Chunk is decoded in place, without copying it.
+    """
+    buf = memoryview(buf)
+    items = []
+    positions = []
+    failures = []
+
+    for idx in range(len(buf) // RECORD_SIZE):
+        rec = buf[idx * RECORD_SIZE : (idx + 1) * RECORD_SIZE]
+
+        pkey = decode_public_key(rec[:PKEY_SIZE])
+        if pkey is None:
+            failures.append(idx)
+            continue
+
+        h, r, s = (
+            int.from_bytes(rec[off : off + 32], "big")
+            for off in range(PKEY_SIZE, RECORD_SIZE, 32)
+        )
+
+        items.append((pkey, h, (r, s)))
+        positions.append(idx)
+
+    for idx, ok in zip(positions, verify_many_digests(items)):
+        if not ok:
+            failures.append(idx)
+
+    return sorted(failures)
+
+
+def verify_file(
+    path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    executor: Optional[Executor] = None,
+    max_inflight: int = 1,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Iterator[int]:
+    """
+    Streams through a file of fixed size records ( see `encode_record` ), memory-mapping it and
+    verifying records in batches, yielding indices of records failing verification, in order.
+
+    Batches are verified in calling process, unless an executor ( e.g. a process pool ) is given, in
+    which case at most `max_inflight` batches are handed over to it at once. Either way memory usage
+    stays bounded, irrespective of file size. If given, `progress` is invoked with (number of records
+    verified so far, total number of records), after each batch.
+    """
+    assert batch_size > 0, "batch size must be positive"
+    assert max_inflight > 0, "number of in-flight batches must be positive"
+
+    with open(path, "rb") as fd:
+        fd.seek(0, 2)
+        size = fd.tell()
+
+        if size % RECORD_SIZE != 0:
+            raise ValueError(f"file size must be a multiple of {RECORD_SIZE} -bytes")
+        if size == 0:
+            return
+
+        total = size // RECORD_SIZE
+        step = batch_size * RECORD_SIZE
+
+        with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # records are read once, front to back, so let kernel read ahead and drop pages behind
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+
+            view = memoryview(mm)
+
+            try:
+                if executor is None:
+                    for off in range(0, size, step):
+                        base = off // RECORD_SIZE
+                        for idx in verify_records(view[off : off + step]):
+                            yield base + idx
+
+                        if progress is not None:
+                            progress(min(base + batch_size, total), total)
+
+                    return
+
+                # records are copied out of mapping, so that they can be sent to worker
+                inflight = deque()
+
+                def drain() -> Iterator[int]:
+                    base, fut = inflight.popleft()
+                    for idx in fut.result():
+                        yield base + idx
+
+                    if progress is not None:
+                        progress(min(base + batch_size, total), total)
+
+                for off in range(0, size, step):
+                    fut = executor.submit(verify_records, bytes(view[off : off + step]))
+                    inflight.append((off // RECORD_SIZE, fut))
+
+                    if len(inflight) >= max_inflight:
+                        yield from drain()
+
+                while inflight:
+                    yield from drain()
+            finally:
+                view.release()
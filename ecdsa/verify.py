@@ -1,45 +1,106 @@
 #!/usr/bin/python3
 
-from typing import Tuple
-from field import Gx, Gy, N
-from field import BaseField
-from field import ScalarField
-from point import Point
-from hashlib import sha3_256
+from typing import List, Tuple, Union
+from field import N, P, ScalarField, batch_inv
+from .hashing import hash_message
+from point import Point, mul_double_scalar
+from .prepared import PreparedPublicKey, PUBLIC_KEY_CACHE
 
 
-def verify(pkey: Point, msg: bytes, sig: Tuple[int, int]) -> bool:
+def verify(
+    pkey: Union[Point, PreparedPublicKey], msg: bytes, sig: Tuple[int, int]
+) -> bool:
     """
     Given ECDSA public key, message `m` and signature tuple ( i.e. (r, s) ), this routine
     attempts to verify signature.
 
-    Returns boolean value denoting success.
+    Returns boolean value denoting success. Signatures having r or s ∉ (0, N) are rejected. Public key
+    is prepared ( see `PreparedPublicKey` ) through process-wide cache, unless it's already prepared
+    or that cache is sized 0.
 
     Follows scheme described https://cryptobook.nakov.com/digital-signatures/ecdsa-sign-verify-messages#ecdsa-verify-signature
     """
+    return verify_digest(pkey, hash_message(msg), sig)
+
+
+def verify_digest(
+    pkey: Union[Point, PreparedPublicKey], h: int, sig: Tuple[int, int]
+) -> bool:
+    """
+    Same as `verify`, but takes message digest `h` ( see `hash_message` ), instead of message itself
+    """
     (r, s) = sig
+    if not (0 < r < N and 0 < s < N):
+        return False
+
+    pkey = PUBLIC_KEY_CACHE.get(pkey)
+
+    s1 = ScalarField.from_num(s).inv_vartime()
+
+    t0 = s1.mul_num(h)
+    t1 = s1.mul_num(r)
+
+    t2 = mul_double_scalar_pkey(t0, t1, pkey)
+    return has_affine_x_mod_n(t2, r)
+
+
+def mul_double_scalar_pkey(
+    u1: int, u2: int, pkey: Union[Point, PreparedPublicKey]
+) -> Point:
+    """
+    Computes u1 * G + u2 * Q, using precomputed odd multiples of Q, if it's prepared
+    """
+    if isinstance(pkey, PreparedPublicKey):
+        return pkey.mul_double_scalar(u1, u2)
+    return mul_double_scalar(u1, u2, pkey)
+
+
+def has_affine_x_mod_n(point: Point, r: int) -> bool:
+    """
+    Checks whether affine x-coordinate of elliptic curve point, reduced modulo N, is `r` ∈ (0, N),
+    without computing inverse of Z. As N < P, x-coordinate is either r or r + N, where latter is
+    possible only when r + N < P.
+    """
+    if point.hasAffineX(r):
+        return True
 
-    h = sha3_256(msg).digest()
-    h = int.from_bytes(h, byteorder="big")
-    h = h % N
+    return r + N < P and point.hasAffineX(r + N)
 
-    s1 = ScalarField.from_num(s).inv()
 
-    t0 = ScalarField.from_num(h)
-    t1 = ScalarField.from_num(r)
+def verify_many(
+    items: List[Tuple[Union[Point, PreparedPublicKey], bytes, Tuple[int, int]]]
+) -> List[bool]:
+    """
+    Given many (ECDSA public key, message, signature) tuples, this routine verifies each of them,
+    same as `verify`, while sharing one scalar field inversion ( for inverting `s` ) across whole batch,
+    see `batch_inv`. Signatures having r or s ∉ (0, N) are rejected.
 
-    t2 = t0 * s1
-    t3 = t1 * s1
+    Returns boolean values denoting success, in same order as input.
+    """
+    return verify_many_digests(
+        [(pkey, hash_message(msg), sig) for pkey, msg, sig in items]
+    )
+
+
+def verify_many_digests(
+    items: List[Tuple[Union[Point, PreparedPublicKey], int, Tuple[int, int]]]
+) -> List[bool]:
+    """
+    Same as `verify_many`, but takes (ECDSA public key, message digest, signature) tuples
+    """
+    valid = [0 < r < N and 0 < s < N for _, _, (r, s) in items]
+    pending = [item for item, ok in zip(items, valid) if ok]
 
-    t4 = t2.to_num()
-    t5 = t3.to_num()
+    s1s = batch_inv([ScalarField.from_num(s) for _, _, (_, s) in pending], vartime=True)
 
-    g = Point.fromAffine(BaseField.from_num(Gx), BaseField.from_num(Gy))
+    checks = []
+    for (pkey, h, (r, _)), s1 in zip(pending, s1s):
+        pkey = PUBLIC_KEY_CACHE.get(pkey)
 
-    t6 = g.mulScalar(t4)
-    t7 = pkey.mulScalar(t5)
+        t0 = s1.mul_num(h)
+        t1 = s1.mul_num(r)
 
-    t8 = t6 + t7
-    t9 = t8.toAffine()[0].to_num()
+        checks.append(has_affine_x_mod_n(mul_double_scalar_pkey(t0, t1, pkey), r))
 
-    return r == t9
+    checks = iter(checks)
+    return [ok and next(checks) for ok in valid]
@@ -1,7 +1,23 @@
 #!/usr/bin/python3
 
+from os import environ
 from utils import bit_count
-from .base_field import BaseField
-from .base_field_consts import P
-from .scalar_field import ScalarField
-from .scalar_field_consts import N, Gx, Gy
+
+# Base field and scalar field arithmetic backend, selected at import time using environment variable
+FIELD_BACKEND: str = environ.get("SECP256K1_FIELD_BACKEND", "montgomery")
+
+if FIELD_BACKEND == "montgomery":
+    from .base_field import BaseField
+    from .scalar_field import ScalarField
+elif FIELD_BACKEND == "native":
+    from .base_field_native import BaseField
+    from .scalar_field_native import ScalarField
+else:
+    raise ValueError(
+        f"unknown field backend {FIELD_BACKEND}, expected montgomery or native"
+    )
+
+from .base_field_consts import P, BETA
+from .scalar_field_consts import N, Gx, Gy, LAMBDA
+from .endomorphism import split_scalar
+from .batch import batch_inv
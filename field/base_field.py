@@ -1,16 +1,19 @@
 #!/usr/bin/python3
 
-from functools import reduce
 from typing_extensions import Self
 from .base_field_utils import *
+from typing import Optional
+from .inversion import chain_pow, inv_vartime, P_INV_CHAIN, P_SQRT_CHAIN
 
 
 class BaseField:
     """
-    A secp256k1 base field element, kept in Montgomery form
+    A secp256k1 base field element, kept in Montgomery form, as an immutable tuple of radix-r limbs
     """
 
-    def __init__(self, limbs: List[int]):
+    __slots__ = ("_limbs",)
+
+    def __init__(self, limbs: Limbs):
         self._limbs = limbs
 
     @classmethod
@@ -44,8 +47,12 @@ class BaseField:
         return from_montgomery(self._limbs)
 
     def __eq__(self, rhs: Self) -> bool:
-        tmp = [bool(self._limbs[i] ^ rhs._limbs[i]) for i in range(LIMB_COUNT)]
-        return not reduce(lambda acc, cur: acc | cur, tmp, False)
+        """
+        Checks equality of two elements of secp256k1 base field, when they're
+        kept in their Montgomery form. Limbs are not necessarily fully reduced ( i.e.
+        they may represent some value ∈ [P, 2^256) ), so canonical values are compared.
+        """
+        return from_radix_r(self._limbs) % P == from_radix_r(rhs._limbs) % P
 
     def __mul__(self, rhs: Self) -> Self:
         """
@@ -58,78 +65,60 @@ class BaseField:
         """
         Modular addition of two secp256k1 base field elements, input/ output in Montgomery form
         """
-        c = [0] * LIMB_COUNT
-        carry = 0
-
-        c[0], carry = adc(self._limbs[0], rhs._limbs[0], carry)
-        c[1], carry = adc(self._limbs[1], rhs._limbs[1], carry)
-        c[2], carry = adc(self._limbs[2], rhs._limbs[2], carry)
-        c[3], carry = adc(self._limbs[3], rhs._limbs[3], carry)
-        c[4], carry = adc(self._limbs[4], rhs._limbs[4], carry)
-        c[5], carry = adc(self._limbs[5], rhs._limbs[5], carry)
-        c[6], carry = adc(self._limbs[6], rhs._limbs[6], carry)
-        c[7], carry = adc(self._limbs[7], rhs._limbs[7], carry)
-
-        one = [977, 1, 0, 0, 0, 0, 0, 0]
-        one = [i * carry for i in one]
-
-        carry = 0
-        c[0], carry = adc(c[0], one[0], carry)
-        c[1], carry = adc(c[1], one[1], carry)
-        c[2], carry = adc(c[2], one[2], carry)
-        c[3], carry = adc(c[3], one[3], carry)
-        c[4], carry = adc(c[4], one[4], carry)
-        c[5], carry = adc(c[5], one[5], carry)
-        c[6], carry = adc(c[6], one[6], carry)
-        c[7], _ = adc(c[7], one[7], carry)
-
-        return BaseField(c)
+        return BaseField(add(self._limbs, rhs._limbs))
 
     def __neg__(self) -> Self:
         """
         Negates a secp256k1 field element such that a + b = 0, if b = -a
         """
-        P_ = to_radix_r(P)
-
-        c = [0] * LIMB_COUNT
-        borrow = 0
-
-        c[0], borrow = sbb(P_[0], self._limbs[0], borrow)
-        c[1], borrow = sbb(P_[1], self._limbs[1], borrow)
-        c[2], borrow = sbb(P_[2], self._limbs[2], borrow)
-        c[3], borrow = sbb(P_[3], self._limbs[3], borrow)
-        c[4], borrow = sbb(P_[4], self._limbs[4], borrow)
-        c[5], borrow = sbb(P_[5], self._limbs[5], borrow)
-        c[6], borrow = sbb(P_[6], self._limbs[6], borrow)
-        c[7], _ = sbb(P_[7], self._limbs[7], borrow)
-
-        return BaseField(c)
+        return BaseField(neg(self._limbs))
 
     def __sub__(self, rhs: Self) -> Self:
         """
         Modular subtraction of two secp256k1 base field elements, input/ output in Montgomery form
         """
-        return self + (-rhs)
+        return BaseField(sub(self._limbs, rhs._limbs))
 
-    def inv(self) -> Self:
+    def add_lazy(self, rhs: Self) -> Self:
         """
-        Computes multiplicative inverse of a secp256k1 base field element. If operand is 0,
-        returns 0, because it's not possible to compute multiplicative inverse of zero element.
+        Addition of two secp256k1 base field elements, without reducing sum, see `add_lazy` of
+        generated module for bounds on excess bits it leaves. Sum can only be used as an operand of
+        multiplication or of another lazy operation.
         """
+        return BaseField(add_lazy(self._limbs, rhs._limbs))
 
-        def pow(a: List[int], b: List[int]) -> List[int]:
-            res = to_radix_r(R)
+    def sub_lazy(self, rhs: Self, excess: int) -> Self:
+        """
+        Subtraction of two secp256k1 base field elements, without reducing difference, where `rhs`
+        carries at most `excess` excess bits, see `sub_lazy` of generated module. Difference can
+        only be used as an operand of multiplication or of another lazy operation.
+        """
+        return BaseField(sub_lazy(self._limbs, rhs._limbs, excess))
 
-            for i in reversed(b):
-                for j in reversed(range(RADIX_BIT_LEN)):
-                    res = montgomery_mul(res, res)
+    def inv(self) -> Self:
+        """
+        Computes multiplicative inverse of a secp256k1 base field element. If operand is 0,
+        returns 0, because it's not possible to compute multiplicative inverse of zero element.
 
-                    if (i >> j) & 1:
-                        res = montgomery_mul(res, a)
+        Raises operand to P - 2, using precomputed addition chain, which runs in constant time.
+        """
+        return chain_pow(self, P_INV_CHAIN)
 
-            return res
+    def inv_vartime(self) -> Self:
+        """
+        Computes multiplicative inverse of a secp256k1 base field element, same as `inv`, but
+        using extended GCD algorithm, which runs in variable time. Don't use it with secret operands.
+        """
+        return BaseField.from_num(inv_vartime(self.to_num(), P))
 
-        return BaseField(pow(self._limbs, to_radix_r(P - 2)))
+    def sqrt(self) -> Optional[Self]:
+        """
+        Computes square root of a secp256k1 base field element, by raising it to (P + 1) / 4 ( works
+        because P = 3 mod 4 ), using precomputed addition chain. Returns None, if operand is not a
+        quadratic residue.
+        """
+        root = chain_pow(self, P_SQRT_CHAIN)
+        return root if root * root == self else None
 
     def __repr__(self) -> str:
         """
@@ -20,6 +20,9 @@ def calculate_mu() -> int:
 # see section 2.4.1 of https://www.secg.org/sec2-v2.pdf#page=13
 P: int = 0x_FFFFFFFF_FFFFFFFF_FFFFFFFF_FFFFFFFF_FFFFFFFF_FFFFFFFF_FFFFFFFE_FFFFFC2F
 
+# Cube root of unity in base field, defining secp256k1 endomorphism (x, y) -> (β * x, y)
+BETA: int = 0x_7AE96A2B_657C0710_6E64479E_AC3434E9_9CF04975_12F58995_C1396C28_719501EE
+
 RADIX_BIT_LEN: int = 32
 RADIX: int = 1 << RADIX_BIT_LEN
 
@@ -0,0 +1,151 @@
+#!/usr/bin/python3
+
+from typing import List, Optional
+from typing_extensions import Self
+from .base_field_consts import P
+from .base_field_utils import to_radix_r, from_radix_r
+from .inversion import inv_vartime
+
+# P = 2^256 - C, where C = 2^32 + 977
+C: int = (1 << 256) - P
+MASK: int = (1 << 256) - 1
+
+
+def reduce(num: int) -> int:
+    """
+    Reduces a non-negative integer < 2^522 ( i.e. even a product of operands carrying 5 excess bits,
+    see `LAZY_EXCESS_BITS` ) modulo secp256k1 base field prime, using the fact that 2^256 = C mod P,
+    see section 2.2.6 of https://link.springer.com/book/10.1007/b97644
+    """
+    num = (num & MASK) + (num >> 256) * C
+    num = (num & MASK) + (num >> 256) * C
+    return num - P if num >= P else num
+
+
+class BaseField:
+    """
+    A secp256k1 base field element, kept as a single canonical integer ∈ [0, P), unless it's
+    result of a lazy operation, in which case it's < 2^e * P, for e excess bits
+    """
+
+    __slots__ = ("_num",)
+
+    def __init__(self, num: int):
+        self._num = num
+
+    @classmethod
+    def from_num(cls, num: int) -> Self:
+        """
+        Given an element of secp256k1 base field as integer, this routine returns
+        it in canonical form
+        """
+        return cls(num % P)
+
+    def to_num(self) -> int:
+        """
+        Given secp256k1 base field element, this routine returns it as an integer
+        """
+        return self._num
+
+    @classmethod
+    def from_radix_r(cls, limbs: List[int]) -> Self:
+        """
+        Given an element of secp256k1 base field in radix-r form, this routine returns
+        it in canonical form | r = 2^32
+        """
+        return cls(from_radix_r(limbs) % P)
+
+    def to_radix_r(self) -> List[int]:
+        """
+        Given a secp256k1 base field element, this routine computes it in radix-r form | r = 2^32
+        """
+        return to_radix_r(self._num)
+
+    def __eq__(self, rhs: Self) -> bool:
+        """
+        Checks equality of two elements of secp256k1 base field
+        """
+        return self._num == rhs._num
+
+    def __mul__(self, rhs: Self) -> Self:
+        """
+        Modular multiplication of two secp256k1 base field elements, using pseudo-Mersenne
+        reduction ( inlined for sake of performance, see `reduce` )
+        """
+        num = self._num * rhs._num
+        num = (num & MASK) + (num >> 256) * C
+        num = (num & MASK) + (num >> 256) * C
+        return BaseField(num - P if num >= P else num)
+
+    def __add__(self, rhs: Self) -> Self:
+        """
+        Modular addition of two secp256k1 base field elements
+        """
+        num = self._num + rhs._num
+        return BaseField(num - P if num >= P else num)
+
+    def __neg__(self) -> Self:
+        """
+        Negates a secp256k1 field element such that a + b = 0, if b = -a
+        """
+        return BaseField(P - self._num if self._num else 0)
+
+    def __sub__(self, rhs: Self) -> Self:
+        """
+        Modular subtraction of two secp256k1 base field elements
+        """
+        num = self._num - rhs._num
+        return BaseField(num + P if num < 0 else num)
+
+    def add_lazy(self, rhs: Self) -> Self:
+        """
+        Addition of two secp256k1 base field elements, without reducing sum. If operands carry at
+        most `ea`, `eb` excess bits, sum carries at most max(ea, eb) + 1. Sum can only be used as an
+        operand of multiplication or of another lazy operation.
+        """
+        return BaseField(self._num + rhs._num)
+
+    def sub_lazy(self, rhs: Self, excess: int) -> Self:
+        """
+        Subtraction of two secp256k1 base field elements, without reducing difference, where `rhs`
+        carries at most `excess` excess bits, so adding 2^(excess + 1) * P keeps it non-negative.
+        If `self` carries at most `ea` excess bits, difference carries at most
+        max(ea, excess + 1) + 1. Difference can only be used as an operand of multiplication or of
+        another lazy operation.
+        """
+        return BaseField(self._num - rhs._num + (P << (excess + 1)))
+
+    def inv(self) -> Self:
+        """
+        Computes multiplicative inverse of a secp256k1 base field element. If operand is 0,
+        returns 0, because it's not possible to compute multiplicative inverse of zero element.
+        """
+        return BaseField(pow(self._num, P - 2, P))
+
+    def inv_vartime(self) -> Self:
+        """
+        Computes multiplicative inverse of a secp256k1 base field element, same as `inv`, but
+        using extended GCD algorithm, which runs in variable time. Don't use it with secret operands.
+        """
+        return BaseField(inv_vartime(self._num, P))
+
+    def sqrt(self) -> Optional[Self]:
+        """
+        Computes square root of a secp256k1 base field element, by raising it to (P + 1) / 4 ( works
+        because P = 3 mod 4 ), using Python runtime's native modular exponentiation. Returns None, if
+        operand is not a quadratic residue.
+        """
+        root = pow(self._num, (P + 1) >> 2, P)
+        return BaseField(root) if root * root % P == self._num else None
+
+    def __repr__(self) -> str:
+        """
+        Pretty print on console
+        """
+        return f"Fp({self._num}, {P})"
+
+    def __str__(self) -> str:
+        """
+        Display when printed to stdout/ file
+        """
+        return str(self._num)
@@ -0,0 +1,42 @@
+#!/usr/bin/python3
+
+from typing import List, TypeVar
+
+# Either of secp256k1 base field or scalar field element
+T = TypeVar("T")
+
+
+def batch_inv(elems: List[T], vartime: bool = False) -> List[T]:
+    """
+    Computes multiplicative inverses of many field elements, using Montgomery's simultaneous
+    inversion trick i.e. one inversion and 3 multiplications per element, see section 2.4.1 of
+    https://link.springer.com/book/10.1007/b97644. Zero elements are mapped to zero, same as `inv`.
+
+    Set `vartime` for inverting public operands only, so that variable-time inversion is used.
+    """
+    if not elems:
+        return []
+
+    field = type(elems[0])
+    zero = field.from_num(0)
+    one = field.from_num(1)
+
+    # prefix[i] = product of all non-zero elements in elems[:i]
+    prefix = []
+    acc = one
+    for elem in elems:
+        prefix.append(acc)
+        if not elem == zero:
+            acc = acc * elem
+
+    acc = acc.inv_vartime() if vartime else acc.inv()
+
+    res = [zero] * len(elems)
+    for i in reversed(range(len(elems))):
+        if elems[i] == zero:
+            continue
+
+        res[i] = acc * prefix[i]
+        acc = acc * elems[i]
+
+    return res
@@ -0,0 +1,550 @@
+#!/usr/bin/python3
+
+import sys
+from functools import lru_cache
+from hashlib import sha256
+from importlib.util import module_from_spec, spec_from_file_location
+from os import environ, getpid, makedirs, path, replace
+from types import ModuleType
+from typing import Dict, List, Optional, Tuple
+
+RADIX_BIT_LEN: int = 32
+MASK: int = (1 << RADIX_BIT_LEN) - 1
+
+# Montgomery multiplication of generated modules accepts operands left partially reduced by lazy
+# addition/ subtraction, as long as each of their limbs is < 2^(32 + LAZY_EXCESS_BITS)
+LAZY_EXCESS_BITS: int = 5
+
+# Directory where modules generated at import time ( see `load` ) are cached
+CACHE_DIR: str = environ.get(
+    "SECP256K1_CODEGEN_CACHE",
+    path.join(path.expanduser("~"), ".cache", "secp256k1", "codegen"),
+)
+
+# Modules checked into `field` package, generated at build time using `python -m field.codegen`,
+# as module name -> (module defining prime, name of prime, description of field)
+MODULES: Dict[str, Tuple[str, str, str]] = {
+    "base_field_utils": ("base_field_consts", "P", "secp256k1 base field"),
+    "scalar_field_utils": ("scalar_field_consts", "N", "secp256k1 scalar field"),
+}
+
+
+def split(num: int, count: int) -> List[int]:
+    """
+    Splits a non-negative integer into `count` little-endian radix-2^32 limbs
+    """
+    return [(num >> (i * RADIX_BIT_LEN)) & MASK for i in range(count)]
+
+
+def literal(num: int) -> str:
+    """
+    Formats a limb as hexadecimal literal, the way black would
+    """
+    return f"0x{num:08X}"
+
+
+def term(var: str, const: int) -> Optional[str]:
+    """
+    Product of a variable and a constant limb, folded when constant is 0 or 1
+    """
+    if const == 0:
+        return None
+    if const == 1:
+        return var
+    return f"{var} * {literal(const)}"
+
+
+class Emitter:
+    """
+    Emits straight-line arithmetic modulo a fixed prime, where all constants ( limbs of prime,
+    R = 2^(32 * n) mod prime, R^2 mod prime and Montgomery magic constant ) are folded into code
+    """
+
+    def __init__(self, modulus: int):
+        assert modulus > 2 and modulus & 1, "modulus must be an odd prime"
+
+        self.modulus = modulus
+        self.count = -(-modulus.bit_length() // RADIX_BIT_LEN)
+        self.r = (1 << (self.count * RADIX_BIT_LEN)) % modulus
+        self.r2 = (self.r * self.r) % modulus
+        self.mu = -pow(modulus, -1, 1 << RADIX_BIT_LEN) & MASK
+
+        self.prime = split(modulus, self.count)
+        self.r_limbs = split(self.r, self.count)
+
+        # when operands carry excess bits, carry out of Montgomery multiplication can be as large as
+        # 2^(2 * LAZY_EXCESS_BITS), so folding it back in may overflow once more, by 1, leaving a
+        # value which, after folding again, fits in these many low limbs
+        carry = 1 << (2 * LAZY_EXCESS_BITS)
+        assert carry * self.r < 1 << (
+            self.count * RADIX_BIT_LEN
+        ), "R too large for lazy operands"
+        bits = ((carry + 1) * self.r).bit_length()
+        self.refold = min(-(-bits // RADIX_BIT_LEN), self.count)
+
+        self.lines: List[str] = []
+
+    def emit(self, line: str = ""):
+        self.lines.append(f"    {line}" if line else "")
+
+    def unpack(self, name: str, var: str):
+        names = ", ".join(f"{name}{i}" for i in range(self.count))
+        self.emit(f"{names} = {var}")
+
+    def pack(self, name: str, start: int = 0) -> str:
+        return ", ".join(f"{name}{i}" for i in range(start, start + self.count))
+
+    def fold(
+        self,
+        out: str,
+        carry: str,
+        start: int = 0,
+        count: Optional[int] = None,
+        carry_out: Optional[str] = None,
+    ):
+        """
+        Folds a carry out of top limb back in, using 2^(32 * n) = R mod prime, propagating it through
+        lowest `count` limbs. Final carry is kept in `carry_out`, when given, otherwise discarded.
+        """
+        count = count or self.count
+        for i in range(count):
+            terms = [f"{out}{start + i}", term(carry, self.r_limbs[i])]
+            if i > 0:
+                terms.append("(t >> 32)")
+
+            expr = " + ".join(t for t in terms if t is not None)
+            if i < count - 1 or carry_out is not None:
+                self.emit(f"t = {expr}")
+                self.emit(f"{out}{start + i} = t & MASK")
+            else:
+                self.emit(f"{out}{start + i} = ({expr}) & MASK")
+
+        if carry_out is not None:
+            self.emit(f"{carry_out} = t >> 32")
+
+    def montgomery_mul(self, const: Optional[List[int]] = None):
+        """
+        Body of Montgomery multiplication of `a` by `b`, or by a constant, when it's given, using
+        coarsely integrated operand scanning, see algorithm 2 of https://eprint.iacr.org/2017/1057.pdf
+        """
+        n = self.count
+
+        self.unpack("a", "a")
+        if const is None:
+            self.unpack("b", "b")
+
+        for k in range(n):
+            self.emit()
+            self.emit(f"# c[{k} : {k + n + 1}] += a{k} * b")
+
+            first = True
+            for j in range(n):
+                if const is None:
+                    prod = f"a{k} * b{j}"
+                else:
+                    prod = term(f"a{k}", const[j])
+
+                terms = [f"c{k + j}" if k > 0 else None, prod]
+                if not first:
+                    terms.append("(t >> 32)")
+
+                terms = [t for t in terms if t is not None]
+                if terms == ["(t >> 32)"]:
+                    self.emit("t >>= 32")
+                else:
+                    self.emit(f"t = {' + '.join(terms) or '0'}")
+                self.emit(f"c{k + j} = t & MASK")
+                first = False
+
+            self.emit(f"c{k + n} = t >> 32")
+
+            self.emit()
+            self.emit(f"# reduce c[{k}] to zero, by adding q * prime")
+            self.emit(f"q = (c{k} * {literal(self.mu)}) & MASK")
+            self.emit(f"t = c{k} + {term('q', self.prime[0]) or '0'}")
+            for j in range(1, n):
+                terms = [f"c{k + j}", term("q", self.prime[j]), "(t >> 32)"]
+                self.emit(f"t = {' + '.join(t for t in terms if t is not None)}")
+                self.emit(f"c{k + j} = t & MASK")
+
+            pc = " + pc" if k > 0 else ""
+            self.emit(f"t = c{k + n} + (t >> 32){pc}")
+            self.emit(f"c{k + n} = t & MASK")
+            self.emit("pc = t >> 32")
+
+        self.emit()
+        self.emit(
+            f"# fold final carry back in, using 2^{n * RADIX_BIT_LEN} = R mod prime"
+        )
+        self.fold("c", "pc", n, carry_out="pc")
+        self.emit()
+        self.emit("# which overflows again only if operands carry excess bits")
+        self.fold("c", "pc", n, self.refold)
+        self.emit()
+        self.emit(f"return ({self.pack('c', n)})")
+
+    def sum(self):
+        """
+        Addition of `a` and `b` limbs into `c` limbs, where carry out of top limb is folded back in
+        """
+        n = self.count
+        for i in range(n):
+            carry = " + (t >> 32)" if i > 0 else ""
+            self.emit(f"t = a{i} + b{i}{carry}")
+            self.emit(f"c{i} = t & MASK")
+        self.emit("carry = t >> 32")
+        self.emit()
+        self.emit(f"# fold carry back in, using 2^{n * RADIX_BIT_LEN} = R mod prime")
+        self.fold("c", "carry")
+        self.emit()
+        self.emit(f"return ({self.pack('c')})")
+
+    def add(self):
+        """
+        Body of addition of `a` and `b`
+        """
+        self.unpack("a", "a")
+        self.unpack("b", "b")
+        self.emit()
+        self.sum()
+
+    def neg(self, src: str, out: str):
+        """
+        Negation of `src` limbs ( i.e. prime - src, wrapping around 2^(32 * n) ) into `out` limbs
+        """
+        n = self.count
+        for i in range(n):
+            borrow = " + (t >> 32)" if i > 0 else ""
+            expr = f"{literal(self.prime[i])} - {src}{i}{borrow}"
+            if i < n - 1:
+                self.emit(f"t = {expr}")
+                self.emit(f"{out}{i} = t & MASK")
+            else:
+                self.emit(f"{out}{i} = ({expr}) & MASK")
+
+    def negate(self):
+        """
+        Body of negation of `a`
+        """
+        self.unpack("a", "a")
+        self.emit()
+        self.neg("a", "c")
+        self.emit()
+        self.emit(f"return ({self.pack('c')})")
+
+    def sub(self):
+        """
+        Body of subtraction of `b` from `a`, computed as a + (-b)
+        """
+        self.unpack("a", "a")
+        self.unpack("b", "b")
+        self.emit()
+        self.emit("# negate b")
+        self.neg("b", "b")
+        self.emit()
+        self.sum()
+
+    def lazy_sub_limbs(self, excess: int) -> List[int]:
+        """
+        Smallest power of two multiple of prime in redundant radix-r form, where every limb is
+        ≥ 2^(32 + excess) and < 2^(34 + excess), so that limbs of an operand carrying that many excess
+        bits can be subtracted from it, without any going negative
+        """
+        n = self.count
+        low = 1 << (RADIX_BIT_LEN + excess)
+
+        mult = 1
+        while True:
+            num = mult * self.modulus
+            limbs = split(num, n - 1) + [num >> ((n - 1) * RADIX_BIT_LEN)]
+
+            # borrow from next limb, wherever a limb is too small
+            for i in range(n - 1):
+                if limbs[i] < low:
+                    borrow = -(-(low - limbs[i]) >> RADIX_BIT_LEN)
+                    limbs[i] += borrow << RADIX_BIT_LEN
+                    limbs[i + 1] -= borrow
+
+            if limbs[-1] >= low:
+                assert all(limb < low << 2 for limb in limbs)
+                return limbs
+
+            mult <<= 1
+
+    def add_lazy(self):
+        """
+        Body of limb-wise addition of `a` and `b`, without propagating carries
+        """
+        self.unpack("a", "a")
+        self.unpack("b", "b")
+        self.emit()
+        self.emit("return (")
+        for i in range(self.count):
+            self.emit(f"    a{i} + b{i},")
+        self.emit(")")
+
+    def sub_lazy(self):
+        """
+        Body of limb-wise subtraction of `b` from `a` plus a multiple of prime, without propagating
+        borrows
+        """
+        self.emit(f"{self.pack('m')} = LAZY_SUB_LIMBS[excess]")
+        self.unpack("a", "a")
+        self.unpack("b", "b")
+        self.emit()
+        self.emit("return (")
+        for i in range(self.count):
+            self.emit(f"    a{i} + m{i} - b{i},")
+        self.emit(")")
+
+    def take(self) -> str:
+        body = "\n".join(self.lines)
+        self.lines = []
+        return body
+
+
+def limbs_constant(name: str, comment: str, limbs: List[int]) -> str:
+    """
+    Emits a module level tuple of limbs, formatted the way black would
+    """
+    items = "".join(f"    {literal(limb)},\n" for limb in limbs)
+    return f"# {comment}\n{name}: Tuple[int, ...] = (\n{items})\n"
+
+
+def generate(modulus: int, field: str, consts: Optional[str] = None) -> str:
+    """
+    Generates source of a Python module, implementing radix-r conversions and Montgomery form
+    arithmetic modulo given odd prime, where all constants are precomputed and every operation is
+    unrolled into straight-line code over local variables. If `consts` is given, generated module
+    star-imports that module ( relative to `field` package ), so that it can stand in for it.
+    """
+    em = Emitter(modulus)
+    n = em.count
+    bits = n * RADIX_BIT_LEN
+
+    src = ["#!/usr/bin/python3", ""]
+    src.append(f"# Arithmetic modulo {field} prime, on {n} radix-r limbs | r = 2^32")
+    src.append(
+        "# Generated by `python -m field.codegen` ( see field/codegen.py ), don't edit."
+    )
+    src.append("")
+    if consts is not None:
+        src.append(f"from .{consts} import *")
+    src.append("from typing import List, Sequence, Tuple")
+    src.append("")
+    src.append(
+        "# Little-endian radix-r limbs of a field element, kept as tuple unless being computed"
+    )
+    src.append("Limbs = Sequence[int]")
+    src.append("")
+    src.append(f"MODULUS: int = 0x{modulus:X}")
+    src.append(f"LIMB_COUNT: int = {n}")
+    src.append(f"MASK: int = {literal(MASK)}")
+    src.append("")
+    src.append(limbs_constant("PRIME_LIMBS", "Limbs of prime", em.prime))
+    src.append(
+        limbs_constant("R_LIMBS", f"Limbs of R = 2^{bits} mod prime", em.r_limbs)
+    )
+    src.append(limbs_constant("R2_LIMBS", "Limbs of R^2 mod prime", split(em.r2, n)))
+    src.append(limbs_constant("ONE_LIMBS", "Limbs of 1", split(1, n)))
+
+    src.append(
+        "# Operands of Montgomery multiplication may carry up to these many excess bits per limb"
+    )
+    src.append(f"LAZY_EXCESS_BITS: int = {LAZY_EXCESS_BITS}")
+    src.append("")
+    src.append(
+        "# Multiples of prime in redundant radix-r form, used by `sub_lazy`, indexed by excess bits"
+    )
+    src.append("LAZY_SUB_LIMBS: Tuple[Tuple[int, ...], ...] = (")
+    for excess in range(LAZY_EXCESS_BITS + 1):
+        src.append("    (")
+        src.extend(f"        {literal(limb)}," for limb in em.lazy_sub_limbs(excess))
+        src.append("    ),")
+    src.append(")")
+    src.append("")
+
+    def function(signature: str, doc: str, body: str):
+        src.append("")
+        src.append(f"def {signature}:")
+        src.append('    """')
+        src.extend(f"    {line}" if line else "" for line in doc.split("\n"))
+        src.append('    """')
+        src.append(body)
+        src.append("")
+
+    function(
+        "to_radix_r(num: int) -> List[int]",
+        f"Converts {field} element ( represented as integer ) to radix-r\n"
+        "interleaved representation | r = 2^32",
+        "    limbs = [0] * LIMB_COUNT\n"
+        "    idx = 0\n"
+        "    while num > 0:\n"
+        "        limbs[idx] = num & MASK\n"
+        "        num >>= 32\n"
+        "        idx += 1\n"
+        "    return limbs",
+    )
+
+    function(
+        "from_radix_r(limbs: Limbs) -> int",
+        f"Converts radix-r interleaved representation of a {field} element\n"
+        "to integer | r = 2^32",
+        "    num = 0\n"
+        "    for limb in reversed(limbs):\n"
+        "        num = (num << 32) + limb\n"
+        "    return num",
+    )
+
+    em.montgomery_mul()
+    function(
+        "montgomery_mul(a: Limbs, b: Limbs) -> Limbs",
+        f"Multiplies two {bits} -bit numbers ( in Montgomery form ), resulting into a {bits} -bit\n"
+        f"number ( in Montgomery form ), reduced by {field} prime, not necessarily fully.\n"
+        "Operands may be partially reduced ones, see `add_lazy` and `sub_lazy`.\n"
+        "\n"
+        "Inspired by https://github.com/dusk-network/bls12_381/blob/ed4d87c/src/fp.rs#L437-L560\n"
+        "and algorithm 2 of https://eprint.iacr.org/2017/1057.pdf",
+        em.take(),
+    )
+
+    em.add()
+    function(
+        "add(a: Limbs, b: Limbs) -> Limbs",
+        f"Modular addition of two {field} elements, input/ output in Montgomery form",
+        em.take(),
+    )
+
+    em.negate()
+    function(
+        "neg(a: Limbs) -> Limbs",
+        f"Negates a {field} element, such that a + b = 0, if b = -a",
+        em.take(),
+    )
+
+    em.sub()
+    function(
+        "sub(a: Limbs, b: Limbs) -> Limbs",
+        f"Modular subtraction of two {field} elements, input/ output in Montgomery form",
+        em.take(),
+    )
+
+    em.add_lazy()
+    function(
+        "add_lazy(a: Limbs, b: Limbs) -> Limbs",
+        f"Adds two {field} elements ( in Montgomery form ) limb-wise, without propagating\n"
+        "carries or reducing sum. If limbs of operands carry at most `ea` and `eb` excess bits i.e.\n"
+        "they're < 2^(32 + e), limbs of sum carry at most max(ea, eb) + 1 excess bits.\n"
+        "\n"
+        "Sum can only be an operand of Montgomery multiplication, as long as it carries at most\n"
+        "`LAZY_EXCESS_BITS`, or of another lazy operation.",
+        em.take(),
+    )
+
+    em.sub_lazy()
+    function(
+        "sub_lazy(a: Limbs, b: Limbs, excess: int) -> Limbs",
+        f"Subtracts two {field} elements ( in Montgomery form ) limb-wise, without propagating\n"
+        "borrows or reducing difference, where limbs of `b` carry at most `excess` excess bits. A\n"
+        "multiple of prime is added to `a`, so that no limb goes negative. If limbs of `a` carry at\n"
+        "most `ea` excess bits, limbs of difference carry at most max(ea, excess + 2) + 1 excess bits.\n"
+        "\n"
+        "Difference can only be an operand of Montgomery multiplication, as long as it carries at most\n"
+        "`LAZY_EXCESS_BITS`, or of another lazy operation.",
+        em.take(),
+    )
+
+    em.montgomery_mul(split(em.r2, n))
+    function(
+        "to_montgomery(a: Limbs) -> Limbs",
+        f"Converts a radix-r form {field} element to Montgomery form, by multiplying it\n"
+        "with R^2, see section 2.2 of https://eprint.iacr.org/2017/1057.pdf",
+        em.take(),
+    )
+
+    em.montgomery_mul(split(1, n))
+    function(
+        "from_montgomery(a: Limbs) -> Limbs",
+        f"Converts a Montgomery form {field} element to radix-r form, by multiplying it\n"
+        "with 1, see section 2.2 of https://eprint.iacr.org/2017/1057.pdf",
+        em.take(),
+    )
+
+    return "\n".join(src).rstrip("\n") + "\n"
+
+
+def generate_builtin(name: str) -> str:
+    """
+    Generates source of one of modules checked into `field` package, see `MODULES`
+    """
+    consts, prime, field = MODULES[name]
+    module = __import__(f"field.{consts}", fromlist=[prime])
+    return generate(getattr(module, prime), field, consts)
+
+
+@lru_cache(maxsize=None)
+def load(modulus: int, field: Optional[str] = None) -> ModuleType:
+    """
+    Generates ( see `generate` ) and imports a module implementing arithmetic modulo given prime,
+    at run time. Generated source is cached in `CACHE_DIR` ( keyed by its digest ), so that later
+    processes import it along with its cached bytecode, instead of compiling it again, while
+    modules are memoized per process. If cache directory is not writable, module is compiled and
+    executed in memory.
+    """
+    field = field or f"prime field of order 0x{modulus:X}"
+    src = generate(modulus, field)
+    digest = sha256(src.encode()).hexdigest()[:16]
+    name = f"field_codegen_{digest}"
+
+    try:
+        makedirs(CACHE_DIR, exist_ok=True)
+
+        target = path.join(CACHE_DIR, f"{name}.py")
+        if not path.exists(target):
+            # written atomically, so that concurrent processes never see partially written file
+            tmp = f"{target}.{getpid()}.tmp"
+            with open(tmp, "w") as fd:
+                fd.write(src)
+            replace(tmp, target)
+
+        spec = spec_from_file_location(name, target)
+        module = module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except OSError:
+        module = ModuleType(name)
+        exec(compile(src, f"<{name}>", "exec"), module.__dict__)
+
+    return module
+
+
+def main(args: List[str]) -> int:
+    """
+    Regenerates modules checked into `field` package, or just checks that they're up to date,
+    when invoked with `--check`
+    """
+    check = "--check" in args
+    stale = []
+
+    for name in MODULES:
+        target = path.join(path.dirname(path.abspath(__file__)), f"{name}.py")
+        src = generate_builtin(name)
+
+        with open(target) as fd:
+            current = fd.read()
+
+        if current == src:
+            continue
+
+        stale.append(target)
+        if not check:
+            with open(target, "w") as fd:
+                fd.write(src)
+
+    for target in stale:
+        print(f"{'stale' if check else 'regenerated'}: {target}")
+
+    return 1 if check and stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
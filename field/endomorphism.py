@@ -0,0 +1,19 @@
+#!/usr/bin/python3
+
+from typing import Tuple
+from .scalar_field_consts import N, A1, B1, A2, B2
+
+
+def split_scalar(k: int) -> Tuple[int, int]:
+    """
+    Decomposes a scalar k ∈ [0, n) into (k1, k2) s.t. k = k1 + k2 * λ mod n, where both k1, k2
+    are signed integers of ~128 -bit magnitude, see algorithm 3.74 of https://link.springer.com/book/10.1007/b97644
+    """
+    # c1 = round(B2 * k / n), c2 = round(-B1 * k / n)
+    c1 = ((B2 * k << 1) + N) // (N << 1)
+    c2 = ((-B1 * k << 1) + N) // (N << 1)
+
+    k1 = k - c1 * A1 - c2 * A2
+    k2 = -c1 * B1 - c2 * B2
+
+    return k1, k2
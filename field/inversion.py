@@ -0,0 +1,130 @@
+#!/usr/bin/python3
+
+from typing import List, Optional, Tuple, TypeVar
+from .base_field_consts import P
+from .scalar_field_consts import N
+
+# Either of secp256k1 base field or scalar field element
+T = TypeVar("T")
+
+# Each step of an addition chain computes r[i] = r[src] ^ (2 ^ sqr) * r[mul], where r[0] = x
+# and r[mul] is skipped when `mul` is None. Last register holds x ^ exponent.
+Chain = List[Tuple[int, int, Optional[int]]]
+
+
+def build_chain(exponent: int) -> Chain:
+    """
+    Builds an addition chain for a fixed exponent, which is first split into its leading run of
+    one bits ( handled using x^(2^k - 1) ladder, as in https://github.com/bitcoin-core/secp256k1/blob/1c131af/src/field_impl.h#L240-L322 )
+    and remaining bits ( handled using sliding window over precomputed odd powers, see algorithm 14.85
+    of https://cacr.uwaterloo.ca/hac/about/chap14.pdf ).
+
+    Sequence of operations depends only on exponent, so exponentiation using it runs in constant time.
+    """
+    assert exponent > 0
+
+    chain = []
+
+    def emit(src: int, sqr: int, mul: Optional[int]) -> int:
+        chain.append((src, sqr, mul))
+        return len(chain)
+
+    bits = exponent.bit_length()
+    ones = 0
+    while ones < bits and (exponent >> (bits - 1 - ones)) & 1:
+        ones += 1
+
+    # acc = x ^ (2^k - 1), built up by either doubling k or incrementing it
+    k, acc = 1, 0
+    for bit in bin(ones)[3:]:
+        acc = emit(acc, k, acc)
+        k <<= 1
+
+        if bit == "1":
+            acc = emit(acc, 1, 0)
+            k += 1
+
+    rest = bits - ones
+    if rest == 0:
+        return chain
+
+    low = exponent & ((1 << rest) - 1)
+    width = min(range(1, 9), key=lambda w: (1 << (w - 1)) + rest / (w + 1))
+
+    # odd[i] = x ^ (2i + 1)
+    odd = [0]
+    if width > 1:
+        sqr = emit(0, 1, None)
+        for _ in range((1 << (width - 1)) - 1):
+            odd.append(emit(odd[-1], 0, sqr))
+
+    pending = 0
+    i = rest - 1
+    while i >= 0:
+        if not (low >> i) & 1:
+            pending += 1
+            i -= 1
+            continue
+
+        j = max(i - width + 1, 0)
+        while not (low >> j) & 1:
+            j += 1
+
+        val = (low >> j) & ((1 << (i - j + 1)) - 1)
+        acc = emit(acc, pending + i - j + 1, odd[val >> 1])
+
+        pending = 0
+        i = j - 1
+
+    if pending:
+        emit(acc, pending, None)
+
+    return chain
+
+
+def chain_cost(chain: Chain) -> Tuple[int, int]:
+    """
+    Counts (squarings, multiplications) performed when exponentiating using given addition chain
+    """
+    sqr = sum(step[1] for step in chain)
+    mul = sum(step[2] is not None for step in chain)
+    return sqr, mul
+
+
+def chain_pow(x: T, chain: Chain) -> T:
+    """
+    Exponentiates a field element using precomputed addition chain, see `build_chain`
+    """
+    regs = [x]
+
+    for src, sqr, mul in chain:
+        t = regs[src]
+        for _ in range(sqr):
+            t = t * t
+
+        if mul is not None:
+            t = t * regs[mul]
+
+        regs.append(t)
+
+    return regs[-1]
+
+
+def inv_vartime(num: int, mod: int) -> int:
+    """
+    Computes multiplicative inverse of an integer modulo a prime, in variable time, using
+    extended GCD algorithm ( as `utils.mul_inv` does, but natively implemented by Python runtime ).
+    If operand is 0, returns 0. Only meant for public operands, such as components of signatures
+    being verified or recovered from, where leaking timing is harmless.
+    """
+    num %= mod
+    return pow(num, -1, mod) if num else 0
+
+
+# Addition chains for computing multiplicative inverse using Fermat's little theorem
+P_INV_CHAIN: Chain = build_chain(P - 2)
+N_INV_CHAIN: Chain = build_chain(N - 2)
+
+# Addition chain for computing square root of a base field element, as x^((P + 1) / 4), which
+# works because P = 3 mod 4
+P_SQRT_CHAIN: Chain = build_chain((P + 1) >> 2)
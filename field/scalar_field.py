@@ -1,16 +1,18 @@
 #!/usr/bin/python3
 
-from functools import reduce
 from typing_extensions import Self
 from .scalar_field_utils import *
+from .inversion import chain_pow, inv_vartime, N_INV_CHAIN
 
 
 class ScalarField:
     """
-    A secp256k1 scalar field element, kept in Montgomery form
+    A secp256k1 scalar field element, kept in Montgomery form, as an immutable tuple of radix-r limbs
     """
 
-    def __init__(self, limbs: List[int]):
+    __slots__ = ("_limbs",)
+
+    def __init__(self, limbs: Limbs):
         self._limbs = limbs
 
     @classmethod
@@ -46,10 +48,10 @@ class ScalarField:
     def __eq__(self, rhs: Self) -> bool:
         """
         Checks equality of two elements of secp256k1 scalar field, when they're
-        kept in their Montgomery form
+        kept in their Montgomery form. Limbs are not necessarily fully reduced ( i.e.
+        they may represent some value ∈ [N, 2^256) ), so canonical values are compared.
         """
-        tmp = [bool(self._limbs[i] ^ rhs._limbs[i]) for i in range(LIMB_COUNT)]
-        return not reduce(lambda acc, cur: acc | cur, tmp, False)
+        return from_radix_r(self._limbs) % N == from_radix_r(rhs._limbs) % N
 
     def __mul__(self, rhs: Self) -> Self:
         """
@@ -58,82 +60,48 @@ class ScalarField:
         """
         return ScalarField(montgomery_mul(self._limbs, rhs._limbs))
 
+    def mul_num(self, num: int) -> int:
+        """
+        Multiplies secp256k1 scalar field element ( in Montgomery form ) by an integer ∈ [0, 2^256),
+        returning product as a canonical integer ∈ [0, N). Integer operand is not converted to
+        Montgomery form, as a(R) * b * R^-1 = ab, so it costs one Montgomery multiplication, instead of
+        three ( including conversions in and out of Montgomery form ).
+        """
+        return from_radix_r(montgomery_mul(self._limbs, to_radix_r(num))) % N
+
     def __add__(self, rhs: Self) -> Self:
         """
         Modular addition of two secp256k1 scalar field elements, input/ output in Montgomery form
         """
-        c = [0] * LIMB_COUNT
-        carry = 0
-
-        c[0], carry = adc(self._limbs[0], rhs._limbs[0], carry)
-        c[1], carry = adc(self._limbs[1], rhs._limbs[1], carry)
-        c[2], carry = adc(self._limbs[2], rhs._limbs[2], carry)
-        c[3], carry = adc(self._limbs[3], rhs._limbs[3], carry)
-        c[4], carry = adc(self._limbs[4], rhs._limbs[4], carry)
-        c[5], carry = adc(self._limbs[5], rhs._limbs[5], carry)
-        c[6], carry = adc(self._limbs[6], rhs._limbs[6], carry)
-        c[7], carry = adc(self._limbs[7], rhs._limbs[7], carry)
-
-        one = [801750719, 1076732275, 1354194884, 1162945305, 1, 0, 0, 0]
-        one = [i * carry for i in one]
-
-        carry = 0
-        c[0], carry = adc(c[0], one[0], carry)
-        c[1], carry = adc(c[1], one[1], carry)
-        c[2], carry = adc(c[2], one[2], carry)
-        c[3], carry = adc(c[3], one[3], carry)
-        c[4], carry = adc(c[4], one[4], carry)
-        c[5], carry = adc(c[5], one[5], carry)
-        c[6], carry = adc(c[6], one[6], carry)
-        c[7], _ = adc(c[7], one[7], carry)
-
-        return ScalarField(c)
+        return ScalarField(add(self._limbs, rhs._limbs))
 
     def __neg__(self) -> Self:
         """
         Negates a secp256k1 scalar element such that a + b = 0, if b = -a
         """
-        P_ = to_radix_r(N)
-
-        c = [0] * LIMB_COUNT
-        borrow = 0
-
-        c[0], borrow = sbb(P_[0], self._limbs[0], borrow)
-        c[1], borrow = sbb(P_[1], self._limbs[1], borrow)
-        c[2], borrow = sbb(P_[2], self._limbs[2], borrow)
-        c[3], borrow = sbb(P_[3], self._limbs[3], borrow)
-        c[4], borrow = sbb(P_[4], self._limbs[4], borrow)
-        c[5], borrow = sbb(P_[5], self._limbs[5], borrow)
-        c[6], borrow = sbb(P_[6], self._limbs[6], borrow)
-        c[7], _ = sbb(P_[7], self._limbs[7], borrow)
-
-        return ScalarField(c)
+        return ScalarField(neg(self._limbs))
 
     def __sub__(self, rhs: Self) -> Self:
         """
         Modular subtraction of two secp256k1 scalar field elements, input/ output in Montgomery form
         """
-        return self + (-rhs)
+        return ScalarField(sub(self._limbs, rhs._limbs))
 
     def inv(self) -> Self:
         """
         Computes multiplicative inverse of a secp256k1 scalar field element. If operand is 0,
         returns 0, because it's not possible to compute multiplicative inverse of zero element.
-        """
-
-        def pow(a: List[int], b: List[int]) -> List[int]:
-            res = to_radix_r(R)
-
-            for i in reversed(b):
-                for j in reversed(range(RADIX_BIT_LEN)):
-                    res = montgomery_mul(res, res)
-
-                    if (i >> j) & 1:
-                        res = montgomery_mul(res, a)
 
-            return res
+        Raises operand to N - 2, using precomputed addition chain, which runs in constant time.
+        """
+        return chain_pow(self, N_INV_CHAIN)
 
-        return ScalarField(pow(self._limbs, to_radix_r(N - 2)))
+    def inv_vartime(self) -> Self:
+        """
+        Computes multiplicative inverse of a secp256k1 scalar field element, same as `inv`, but
+        using extended GCD algorithm, which runs in variable time. Don't use it with secret operands.
+        """
+        return ScalarField.from_num(inv_vartime(self.to_num(), N))
 
     def __repr__(self) -> str:
         """
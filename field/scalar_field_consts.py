@@ -25,6 +25,17 @@ Gx = 550662630222773436695787188951685343262506034537775941755001873603891167292
 # Secp256k1 curve generator point y, , see section 2.4.1 of https://www.secg.org/sec2-v2.pdf#page=13
 Gy = 32670510020758816978083085130507043184471273380659243275938904335757337482424
 
+# Cube root of unity in scalar field s.t. λ * (x, y) = (β * x, y), for every point on secp256k1 curve,
+# see section 3.5 of https://link.springer.com/book/10.1007/b97644
+LAMBDA: int = 0x_5363AD4C_C05C30E0_A5261C02_8812645A_122E22EA_20816678_DF02967C_1B23BD72
+
+# Short basis {(A1, B1), (A2, B2)} of lattice {(x, y) | x + y * λ = 0 mod n}, used for GLV
+# scalar decomposition, see algorithm 3.74 of https://link.springer.com/book/10.1007/b97644
+A1: int = 0x_3086D221_A7D46BCD_E86C90E4_9284EB15
+B1: int = -0x_E4437ED6_010E8828_6F547FA9_0ABFE4C3
+A2: int = 0x_1_14CA50F7_A8E2F3F6_57C1108D_9D44CFD8
+B2: int = A1
+
 RADIX_BIT_LEN: int = 32
 RADIX: int = 1 << RADIX_BIT_LEN
 
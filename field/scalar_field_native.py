@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+
+from typing import List
+from typing_extensions import Self
+from .scalar_field_consts import N
+from .scalar_field_utils import to_radix_r, from_radix_r
+from .inversion import inv_vartime
+
+
+class ScalarField:
+    """
+    A secp256k1 scalar field element, kept as a single canonical integer ∈ [0, N).
+
+    Though N = 2^256 - C is of special form, C is 129 -bit wide, so folding reduction ( see
+    section 2.2.6 of https://link.springer.com/book/10.1007/b97644 ) needs three rounds of
+    multiplication by C, which, same as Barrett reduction, turns out to be slower than Python
+    runtime's native 512 -bit by 256 -bit division. So products are reduced using latter.
+    """
+
+    __slots__ = ("_num",)
+
+    def __init__(self, num: int):
+        self._num = num
+
+    @classmethod
+    def from_num(cls, num: int) -> Self:
+        """
+        Given an element of secp256k1 scalar field as integer, this routine returns
+        it in canonical form
+        """
+        return cls(num % N)
+
+    def to_num(self) -> int:
+        """
+        Given secp256k1 scalar field element, this routine returns it as an integer
+        """
+        return self._num
+
+    @classmethod
+    def from_radix_r(cls, limbs: List[int]) -> Self:
+        """
+        Given an element of secp256k1 scalar field in radix-r form, this routine returns
+        it in canonical form | r = 2^32
+        """
+        return cls(from_radix_r(limbs) % N)
+
+    def to_radix_r(self) -> List[int]:
+        """
+        Given a secp256k1 scalar field element, this routine computes it in radix-r form | r = 2^32
+        """
+        return to_radix_r(self._num)
+
+    def __eq__(self, rhs: Self) -> bool:
+        """
+        Checks equality of two elements of secp256k1 scalar field
+        """
+        return self._num == rhs._num
+
+    def __mul__(self, rhs: Self) -> Self:
+        """
+        Modular multiplication of two secp256k1 scalar field elements
+        """
+        return ScalarField(self._num * rhs._num % N)
+
+    def mul_num(self, num: int) -> int:
+        """
+        Multiplies secp256k1 scalar field element by an integer ∈ [0, 2^256), returning product
+        as a canonical integer ∈ [0, N)
+        """
+        return self._num * num % N
+
+    def __add__(self, rhs: Self) -> Self:
+        """
+        Modular addition of two secp256k1 scalar field elements
+        """
+        num = self._num + rhs._num
+        return ScalarField(num - N if num >= N else num)
+
+    def __neg__(self) -> Self:
+        """
+        Negates a secp256k1 scalar element such that a + b = 0, if b = -a
+        """
+        return ScalarField(N - self._num if self._num else 0)
+
+    def __sub__(self, rhs: Self) -> Self:
+        """
+        Modular subtraction of two secp256k1 scalar field elements
+        """
+        num = self._num - rhs._num
+        return ScalarField(num + N if num < 0 else num)
+
+    def inv(self) -> Self:
+        """
+        Computes multiplicative inverse of a secp256k1 scalar field element. If operand is 0,
+        returns 0, because it's not possible to compute multiplicative inverse of zero element.
+        """
+        return ScalarField(pow(self._num, N - 2, N))
+
+    def inv_vartime(self) -> Self:
+        """
+        Computes multiplicative inverse of a secp256k1 scalar field element, same as `inv`, but
+        using extended GCD algorithm, which runs in variable time. Don't use it with secret operands.
+        """
+        return ScalarField(inv_vartime(self._num, N))
+
+    def __repr__(self) -> str:
+        """
+        Pretty print on console
+        """
+        return f"Fp({self._num}, {N})"
+
+    def __str__(self) -> str:
+        """
+        Display when printed to stdout/ file
+        """
+        return str(self._num)
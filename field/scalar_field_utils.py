@@ -1,7 +1,132 @@
 #!/usr/bin/python3
 
+# Arithmetic modulo secp256k1 scalar field prime, on 8 radix-r limbs | r = 2^32
+# Generated by `python -m field.codegen` ( see field/codegen.py ), don't edit.
+
 from .scalar_field_consts import *
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
+
+# Little-endian radix-r limbs of a field element, kept as tuple unless being computed
+Limbs = Sequence[int]
+
+MODULUS: int = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+LIMB_COUNT: int = 8
+MASK: int = 0xFFFFFFFF
+
+# Limbs of prime
+PRIME_LIMBS: Tuple[int, ...] = (
+    0xD0364141,
+    0xBFD25E8C,
+    0xAF48A03B,
+    0xBAAEDCE6,
+    0xFFFFFFFE,
+    0xFFFFFFFF,
+    0xFFFFFFFF,
+    0xFFFFFFFF,
+)
+
+# Limbs of R = 2^256 mod prime
+R_LIMBS: Tuple[int, ...] = (
+    0x2FC9BEBF,
+    0x402DA173,
+    0x50B75FC4,
+    0x45512319,
+    0x00000001,
+    0x00000000,
+    0x00000000,
+    0x00000000,
+)
+
+# Limbs of R^2 mod prime
+R2_LIMBS: Tuple[int, ...] = (
+    0x67D7D140,
+    0x896CF214,
+    0x0E7CF878,
+    0x741496C2,
+    0x5BCD07C6,
+    0xE697F5E4,
+    0x81C69BC5,
+    0x9D671CD5,
+)
+
+# Limbs of 1
+ONE_LIMBS: Tuple[int, ...] = (
+    0x00000001,
+    0x00000000,
+    0x00000000,
+    0x00000000,
+    0x00000000,
+    0x00000000,
+    0x00000000,
+    0x00000000,
+)
+
+# Operands of Montgomery multiplication may carry up to these many excess bits per limb
+LAZY_EXCESS_BITS: int = 5
+
+# Multiples of prime in redundant radix-r form, used by `sub_lazy`, indexed by excess bits
+LAZY_SUB_LIMBS: Tuple[Tuple[int, ...], ...] = (
+    (
+        0x1A06C8282,
+        0x17FA4BD18,
+        0x15E914076,
+        0x1755DB9CC,
+        0x1FFFFFFFC,
+        0x1FFFFFFFE,
+        0x1FFFFFFFE,
+        0x1FFFFFFFE,
+    ),
+    (
+        0x240D90504,
+        0x2FF497A31,
+        0x2BD2280EC,
+        0x2EABB7398,
+        0x2FFFFFFF8,
+        0x2FFFFFFFD,
+        0x2FFFFFFFD,
+        0x3FFFFFFFD,
+    ),
+    (
+        0x481B20A08,
+        0x4FE92F462,
+        0x47A4501D9,
+        0x4D576E731,
+        0x4FFFFFFF1,
+        0x4FFFFFFFB,
+        0x4FFFFFFFB,
+        0x7FFFFFFFB,
+    ),
+    (
+        0x803641410,
+        0x8FD25E8C5,
+        0x8F48A03B3,
+        0x8AAEDCE62,
+        0x8FFFFFFE3,
+        0x8FFFFFFF7,
+        0x8FFFFFFF7,
+        0xFFFFFFFF7,
+    ),
+    (
+        0x1006C82820,
+        0x10FA4BD18A,
+        0x10E9140767,
+        0x1055DB9CC5,
+        0x10FFFFFFC7,
+        0x10FFFFFFEF,
+        0x10FFFFFFEF,
+        0x1FFFFFFFEF,
+    ),
+    (
+        0x200D905040,
+        0x20F497A314,
+        0x20D2280ECF,
+        0x20ABB7398B,
+        0x20FFFFFF8E,
+        0x20FFFFFFDF,
+        0x20FFFFFFDF,
+        0x3FFFFFFFDF,
+    ),
+)
 
 
 def to_radix_r(num: int) -> List[int]:
@@ -12,240 +137,1285 @@ def to_radix_r(num: int) -> List[int]:
     limbs = [0] * LIMB_COUNT
     idx = 0
     while num > 0:
-        limbs[idx] = num % RADIX
-        num //= RADIX
+        limbs[idx] = num & MASK
+        num >>= 32
         idx += 1
     return limbs
 
 
-def from_radix_r(limbs: List[int]) -> int:
+def from_radix_r(limbs: Limbs) -> int:
     """
     Converts radix-r interleaved representation of a secp256k1 scalar field element
     to integer | r = 2^32
     """
-    cnt = len(limbs)
     num = 0
-    for idx in range(cnt - 1, -1, -1):
-        num = num * RADIX + limbs[idx]
+    for limb in reversed(limbs):
+        num = (num << 32) + limb
     return num
 
 
-def adc(a: int, b: int, carry: int) -> Tuple[int, int]:
+def montgomery_mul(a: Limbs, b: Limbs) -> Limbs:
     """
-    See https://github.com/dusk-network/bls12_381/blob/ed4d87c/src/util.rs#L1-L6
+    Multiplies two 256 -bit numbers ( in Montgomery form ), resulting into a 256 -bit
+    number ( in Montgomery form ), reduced by secp256k1 scalar field prime, not necessarily fully.
+    Operands may be partially reduced ones, see `add_lazy` and `sub_lazy`.
+
+    Inspired by https://github.com/dusk-network/bls12_381/blob/ed4d87c/src/fp.rs#L437-L560
+    and algorithm 2 of https://eprint.iacr.org/2017/1057.pdf
     """
-    tmp = a + b + carry
-    return tmp & (RADIX - 1), tmp >> RADIX_BIT_LEN
+    a0, a1, a2, a3, a4, a5, a6, a7 = a
+    b0, b1, b2, b3, b4, b5, b6, b7 = b
+
+    # c[0 : 9] += a0 * b
+    t = a0 * b0
+    c0 = t & MASK
+    t = a0 * b1 + (t >> 32)
+    c1 = t & MASK
+    t = a0 * b2 + (t >> 32)
+    c2 = t & MASK
+    t = a0 * b3 + (t >> 32)
+    c3 = t & MASK
+    t = a0 * b4 + (t >> 32)
+    c4 = t & MASK
+    t = a0 * b5 + (t >> 32)
+    c5 = t & MASK
+    t = a0 * b6 + (t >> 32)
+    c6 = t & MASK
+    t = a0 * b7 + (t >> 32)
+    c7 = t & MASK
+    c8 = t >> 32
+
+    # reduce c[0] to zero, by adding q * prime
+    q = (c0 * 0x5588B13F) & MASK
+    t = c0 + q * 0xD0364141
+    t = c1 + q * 0xBFD25E8C + (t >> 32)
+    c1 = t & MASK
+    t = c2 + q * 0xAF48A03B + (t >> 32)
+    c2 = t & MASK
+    t = c3 + q * 0xBAAEDCE6 + (t >> 32)
+    c3 = t & MASK
+    t = c4 + q * 0xFFFFFFFE + (t >> 32)
+    c4 = t & MASK
+    t = c5 + q * 0xFFFFFFFF + (t >> 32)
+    c5 = t & MASK
+    t = c6 + q * 0xFFFFFFFF + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xFFFFFFFF + (t >> 32)
+    c7 = t & MASK
+    t = c8 + (t >> 32)
+    c8 = t & MASK
+    pc = t >> 32
+
+    # c[1 : 10] += a1 * b
+    t = c1 + a1 * b0
+    c1 = t & MASK
+    t = c2 + a1 * b1 + (t >> 32)
+    c2 = t & MASK
+    t = c3 + a1 * b2 + (t >> 32)
+    c3 = t & MASK
+    t = c4 + a1 * b3 + (t >> 32)
+    c4 = t & MASK
+    t = c5 + a1 * b4 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + a1 * b5 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + a1 * b6 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + a1 * b7 + (t >> 32)
+    c8 = t & MASK
+    c9 = t >> 32
+
+    # reduce c[1] to zero, by adding q * prime
+    q = (c1 * 0x5588B13F) & MASK
+    t = c1 + q * 0xD0364141
+    t = c2 + q * 0xBFD25E8C + (t >> 32)
+    c2 = t & MASK
+    t = c3 + q * 0xAF48A03B + (t >> 32)
+    c3 = t & MASK
+    t = c4 + q * 0xBAAEDCE6 + (t >> 32)
+    c4 = t & MASK
+    t = c5 + q * 0xFFFFFFFE + (t >> 32)
+    c5 = t & MASK
+    t = c6 + q * 0xFFFFFFFF + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xFFFFFFFF + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xFFFFFFFF + (t >> 32)
+    c8 = t & MASK
+    t = c9 + (t >> 32) + pc
+    c9 = t & MASK
+    pc = t >> 32
+
+    # c[2 : 11] += a2 * b
+    t = c2 + a2 * b0
+    c2 = t & MASK
+    t = c3 + a2 * b1 + (t >> 32)
+    c3 = t & MASK
+    t = c4 + a2 * b2 + (t >> 32)
+    c4 = t & MASK
+    t = c5 + a2 * b3 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + a2 * b4 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + a2 * b5 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + a2 * b6 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + a2 * b7 + (t >> 32)
+    c9 = t & MASK
+    c10 = t >> 32
+
+    # reduce c[2] to zero, by adding q * prime
+    q = (c2 * 0x5588B13F) & MASK
+    t = c2 + q * 0xD0364141
+    t = c3 + q * 0xBFD25E8C + (t >> 32)
+    c3 = t & MASK
+    t = c4 + q * 0xAF48A03B + (t >> 32)
+    c4 = t & MASK
+    t = c5 + q * 0xBAAEDCE6 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + q * 0xFFFFFFFE + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xFFFFFFFF + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xFFFFFFFF + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xFFFFFFFF + (t >> 32)
+    c9 = t & MASK
+    t = c10 + (t >> 32) + pc
+    c10 = t & MASK
+    pc = t >> 32
+
+    # c[3 : 12] += a3 * b
+    t = c3 + a3 * b0
+    c3 = t & MASK
+    t = c4 + a3 * b1 + (t >> 32)
+    c4 = t & MASK
+    t = c5 + a3 * b2 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + a3 * b3 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + a3 * b4 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + a3 * b5 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + a3 * b6 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + a3 * b7 + (t >> 32)
+    c10 = t & MASK
+    c11 = t >> 32
+
+    # reduce c[3] to zero, by adding q * prime
+    q = (c3 * 0x5588B13F) & MASK
+    t = c3 + q * 0xD0364141
+    t = c4 + q * 0xBFD25E8C + (t >> 32)
+    c4 = t & MASK
+    t = c5 + q * 0xAF48A03B + (t >> 32)
+    c5 = t & MASK
+    t = c6 + q * 0xBAAEDCE6 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xFFFFFFFE + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xFFFFFFFF + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xFFFFFFFF + (t >> 32)
+    c9 = t & MASK
+    t = c10 + q * 0xFFFFFFFF + (t >> 32)
+    c10 = t & MASK
+    t = c11 + (t >> 32) + pc
+    c11 = t & MASK
+    pc = t >> 32
+
+    # c[4 : 13] += a4 * b
+    t = c4 + a4 * b0
+    c4 = t & MASK
+    t = c5 + a4 * b1 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + a4 * b2 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + a4 * b3 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + a4 * b4 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + a4 * b5 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + a4 * b6 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + a4 * b7 + (t >> 32)
+    c11 = t & MASK
+    c12 = t >> 32
 
+    # reduce c[4] to zero, by adding q * prime
+    q = (c4 * 0x5588B13F) & MASK
+    t = c4 + q * 0xD0364141
+    t = c5 + q * 0xBFD25E8C + (t >> 32)
+    c5 = t & MASK
+    t = c6 + q * 0xAF48A03B + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xBAAEDCE6 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xFFFFFFFE + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xFFFFFFFF + (t >> 32)
+    c9 = t & MASK
+    t = c10 + q * 0xFFFFFFFF + (t >> 32)
+    c10 = t & MASK
+    t = c11 + q * 0xFFFFFFFF + (t >> 32)
+    c11 = t & MASK
+    t = c12 + (t >> 32) + pc
+    c12 = t & MASK
+    pc = t >> 32
 
-def mac(a: int, b: int, c: int, carry: int) -> Tuple[int, int]:
+    # c[5 : 14] += a5 * b
+    t = c5 + a5 * b0
+    c5 = t & MASK
+    t = c6 + a5 * b1 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + a5 * b2 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + a5 * b3 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + a5 * b4 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + a5 * b5 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + a5 * b6 + (t >> 32)
+    c11 = t & MASK
+    t = c12 + a5 * b7 + (t >> 32)
+    c12 = t & MASK
+    c13 = t >> 32
+
+    # reduce c[5] to zero, by adding q * prime
+    q = (c5 * 0x5588B13F) & MASK
+    t = c5 + q * 0xD0364141
+    t = c6 + q * 0xBFD25E8C + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xAF48A03B + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xBAAEDCE6 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xFFFFFFFE + (t >> 32)
+    c9 = t & MASK
+    t = c10 + q * 0xFFFFFFFF + (t >> 32)
+    c10 = t & MASK
+    t = c11 + q * 0xFFFFFFFF + (t >> 32)
+    c11 = t & MASK
+    t = c12 + q * 0xFFFFFFFF + (t >> 32)
+    c12 = t & MASK
+    t = c13 + (t >> 32) + pc
+    c13 = t & MASK
+    pc = t >> 32
+
+    # c[6 : 15] += a6 * b
+    t = c6 + a6 * b0
+    c6 = t & MASK
+    t = c7 + a6 * b1 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + a6 * b2 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + a6 * b3 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + a6 * b4 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + a6 * b5 + (t >> 32)
+    c11 = t & MASK
+    t = c12 + a6 * b6 + (t >> 32)
+    c12 = t & MASK
+    t = c13 + a6 * b7 + (t >> 32)
+    c13 = t & MASK
+    c14 = t >> 32
+
+    # reduce c[6] to zero, by adding q * prime
+    q = (c6 * 0x5588B13F) & MASK
+    t = c6 + q * 0xD0364141
+    t = c7 + q * 0xBFD25E8C + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xAF48A03B + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xBAAEDCE6 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + q * 0xFFFFFFFE + (t >> 32)
+    c10 = t & MASK
+    t = c11 + q * 0xFFFFFFFF + (t >> 32)
+    c11 = t & MASK
+    t = c12 + q * 0xFFFFFFFF + (t >> 32)
+    c12 = t & MASK
+    t = c13 + q * 0xFFFFFFFF + (t >> 32)
+    c13 = t & MASK
+    t = c14 + (t >> 32) + pc
+    c14 = t & MASK
+    pc = t >> 32
+
+    # c[7 : 16] += a7 * b
+    t = c7 + a7 * b0
+    c7 = t & MASK
+    t = c8 + a7 * b1 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + a7 * b2 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + a7 * b3 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + a7 * b4 + (t >> 32)
+    c11 = t & MASK
+    t = c12 + a7 * b5 + (t >> 32)
+    c12 = t & MASK
+    t = c13 + a7 * b6 + (t >> 32)
+    c13 = t & MASK
+    t = c14 + a7 * b7 + (t >> 32)
+    c14 = t & MASK
+    c15 = t >> 32
+
+    # reduce c[7] to zero, by adding q * prime
+    q = (c7 * 0x5588B13F) & MASK
+    t = c7 + q * 0xD0364141
+    t = c8 + q * 0xBFD25E8C + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xAF48A03B + (t >> 32)
+    c9 = t & MASK
+    t = c10 + q * 0xBAAEDCE6 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + q * 0xFFFFFFFE + (t >> 32)
+    c11 = t & MASK
+    t = c12 + q * 0xFFFFFFFF + (t >> 32)
+    c12 = t & MASK
+    t = c13 + q * 0xFFFFFFFF + (t >> 32)
+    c13 = t & MASK
+    t = c14 + q * 0xFFFFFFFF + (t >> 32)
+    c14 = t & MASK
+    t = c15 + (t >> 32) + pc
+    c15 = t & MASK
+    pc = t >> 32
+
+    # fold final carry back in, using 2^256 = R mod prime
+    t = c8 + pc * 0x2FC9BEBF
+    c8 = t & MASK
+    t = c9 + pc * 0x402DA173 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + pc * 0x50B75FC4 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + pc * 0x45512319 + (t >> 32)
+    c11 = t & MASK
+    t = c12 + pc + (t >> 32)
+    c12 = t & MASK
+    t = c13 + (t >> 32)
+    c13 = t & MASK
+    t = c14 + (t >> 32)
+    c14 = t & MASK
+    t = c15 + (t >> 32)
+    c15 = t & MASK
+    pc = t >> 32
+
+    # which overflows again only if operands carry excess bits
+    t = c8 + pc * 0x2FC9BEBF
+    c8 = t & MASK
+    t = c9 + pc * 0x402DA173 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + pc * 0x50B75FC4 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + pc * 0x45512319 + (t >> 32)
+    c11 = t & MASK
+    c12 = (c12 + pc + (t >> 32)) & MASK
+
+    return (c8, c9, c10, c11, c12, c13, c14, c15)
+
+
+def add(a: Limbs, b: Limbs) -> Limbs:
     """
-    See https://github.com/dusk-network/bls12_381/blob/ed4d87c/src/util.rs#L15-L20
+    Modular addition of two secp256k1 scalar field elements, input/ output in Montgomery form
     """
-    tmp = a + (b * c) + carry
-    return tmp & (RADIX - 1), tmp >> RADIX_BIT_LEN
+    a0, a1, a2, a3, a4, a5, a6, a7 = a
+    b0, b1, b2, b3, b4, b5, b6, b7 = b
+
+    t = a0 + b0
+    c0 = t & MASK
+    t = a1 + b1 + (t >> 32)
+    c1 = t & MASK
+    t = a2 + b2 + (t >> 32)
+    c2 = t & MASK
+    t = a3 + b3 + (t >> 32)
+    c3 = t & MASK
+    t = a4 + b4 + (t >> 32)
+    c4 = t & MASK
+    t = a5 + b5 + (t >> 32)
+    c5 = t & MASK
+    t = a6 + b6 + (t >> 32)
+    c6 = t & MASK
+    t = a7 + b7 + (t >> 32)
+    c7 = t & MASK
+    carry = t >> 32
 
+    # fold carry back in, using 2^256 = R mod prime
+    t = c0 + carry * 0x2FC9BEBF
+    c0 = t & MASK
+    t = c1 + carry * 0x402DA173 + (t >> 32)
+    c1 = t & MASK
+    t = c2 + carry * 0x50B75FC4 + (t >> 32)
+    c2 = t & MASK
+    t = c3 + carry * 0x45512319 + (t >> 32)
+    c3 = t & MASK
+    t = c4 + carry + (t >> 32)
+    c4 = t & MASK
+    t = c5 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + (t >> 32)
+    c6 = t & MASK
+    c7 = (c7 + (t >> 32)) & MASK
 
-def sbb(a: int, b: int, borrow: int) -> Tuple[int, int]:
+    return (c0, c1, c2, c3, c4, c5, c6, c7)
+
+
+def neg(a: Limbs) -> Limbs:
     """
-    See https://github.com/dusk-network/bls12_381/blob/2c679a2/src/util.rs#L8-L13
+    Negates a secp256k1 scalar field element, such that a + b = 0, if b = -a
     """
-    wrap_at = RADIX << RADIX_BIT_LEN
-    tmp = (a - (b + (borrow >> (RADIX_BIT_LEN - 1)))) % wrap_at
-    return tmp & (RADIX - 1), tmp >> RADIX_BIT_LEN
+    a0, a1, a2, a3, a4, a5, a6, a7 = a
+
+    t = 0xD0364141 - a0
+    c0 = t & MASK
+    t = 0xBFD25E8C - a1 + (t >> 32)
+    c1 = t & MASK
+    t = 0xAF48A03B - a2 + (t >> 32)
+    c2 = t & MASK
+    t = 0xBAAEDCE6 - a3 + (t >> 32)
+    c3 = t & MASK
+    t = 0xFFFFFFFE - a4 + (t >> 32)
+    c4 = t & MASK
+    t = 0xFFFFFFFF - a5 + (t >> 32)
+    c5 = t & MASK
+    t = 0xFFFFFFFF - a6 + (t >> 32)
+    c6 = t & MASK
+    c7 = (0xFFFFFFFF - a7 + (t >> 32)) & MASK
 
+    return (c0, c1, c2, c3, c4, c5, c6, c7)
 
-def bitwise_not(a: int) -> int:
+
+def sub(a: Limbs, b: Limbs) -> Limbs:
     """
-    Same as `!a` in C
+    Modular subtraction of two secp256k1 scalar field elements, input/ output in Montgomery form
     """
-    return RADIX - 1 - a
+    a0, a1, a2, a3, a4, a5, a6, a7 = a
+    b0, b1, b2, b3, b4, b5, b6, b7 = b
 
+    # negate b
+    t = 0xD0364141 - b0
+    b0 = t & MASK
+    t = 0xBFD25E8C - b1 + (t >> 32)
+    b1 = t & MASK
+    t = 0xAF48A03B - b2 + (t >> 32)
+    b2 = t & MASK
+    t = 0xBAAEDCE6 - b3 + (t >> 32)
+    b3 = t & MASK
+    t = 0xFFFFFFFE - b4 + (t >> 32)
+    b4 = t & MASK
+    t = 0xFFFFFFFF - b5 + (t >> 32)
+    b5 = t & MASK
+    t = 0xFFFFFFFF - b6 + (t >> 32)
+    b6 = t & MASK
+    b7 = (0xFFFFFFFF - b7 + (t >> 32)) & MASK
 
-def u256xu32(a: List[int], b: int, c: List[int]) -> List[int]:
-    """
-    Multiplies a 256 -bit number by another 32 -bit number, resulting into a 288 -bit one.
+    t = a0 + b0
+    c0 = t & MASK
+    t = a1 + b1 + (t >> 32)
+    c1 = t & MASK
+    t = a2 + b2 + (t >> 32)
+    c2 = t & MASK
+    t = a3 + b3 + (t >> 32)
+    c3 = t & MASK
+    t = a4 + b4 + (t >> 32)
+    c4 = t & MASK
+    t = a5 + b5 + (t >> 32)
+    c5 = t & MASK
+    t = a6 + b6 + (t >> 32)
+    c6 = t & MASK
+    t = a7 + b7 + (t >> 32)
+    c7 = t & MASK
+    carry = t >> 32
+
+    # fold carry back in, using 2^256 = R mod prime
+    t = c0 + carry * 0x2FC9BEBF
+    c0 = t & MASK
+    t = c1 + carry * 0x402DA173 + (t >> 32)
+    c1 = t & MASK
+    t = c2 + carry * 0x50B75FC4 + (t >> 32)
+    c2 = t & MASK
+    t = c3 + carry * 0x45512319 + (t >> 32)
+    c3 = t & MASK
+    t = c4 + carry + (t >> 32)
+    c4 = t & MASK
+    t = c5 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + (t >> 32)
+    c6 = t & MASK
+    c7 = (c7 + (t >> 32)) & MASK
 
-    Collects inspiration from https://github.com/dusk-network/bls12_381/blob/ed4d87c/src/fp.rs#L517-L522
+    return (c0, c1, c2, c3, c4, c5, c6, c7)
+
+
+def add_lazy(a: Limbs, b: Limbs) -> Limbs:
     """
-    assert len(a) == (LIMB_COUNT + 1) and len(c) == LIMB_COUNT
+    Adds two secp256k1 scalar field elements ( in Montgomery form ) limb-wise, without propagating
+    carries or reducing sum. If limbs of operands carry at most `ea` and `eb` excess bits i.e.
+    they're < 2^(32 + e), limbs of sum carry at most max(ea, eb) + 1 excess bits.
 
-    a_ = [0] * len(c)
-    carry = 0
+    Sum can only be an operand of Montgomery multiplication, as long as it carries at most
+    `LAZY_EXCESS_BITS`, or of another lazy operation.
+    """
+    a0, a1, a2, a3, a4, a5, a6, a7 = a
+    b0, b1, b2, b3, b4, b5, b6, b7 = b
 
-    a_[0], carry = mac(0, c[0], b, carry)
-    a_[1], carry = mac(0, c[1], b, carry)
-    a_[2], carry = mac(0, c[2], b, carry)
-    a_[3], carry = mac(0, c[3], b, carry)
-    a_[4], carry = mac(0, c[4], b, carry)
-    a_[5], carry = mac(0, c[5], b, carry)
-    a_[6], carry = mac(0, c[6], b, carry)
-    a_[7], a[8] = mac(0, c[7], b, carry)
+    return (
+        a0 + b0,
+        a1 + b1,
+        a2 + b2,
+        a3 + b3,
+        a4 + b4,
+        a5 + b5,
+        a6 + b6,
+        a7 + b7,
+    )
 
-    carry = 0
 
-    a[0], carry = adc(a[0], a_[0], carry)
-    a[1], carry = adc(a[1], a_[1], carry)
-    a[2], carry = adc(a[2], a_[2], carry)
-    a[3], carry = adc(a[3], a_[3], carry)
-    a[4], carry = adc(a[4], a_[4], carry)
-    a[5], carry = adc(a[5], a_[5], carry)
-    a[6], carry = adc(a[6], a_[6], carry)
-    a[7], carry = adc(a[7], a_[7], carry)
+def sub_lazy(a: Limbs, b: Limbs, excess: int) -> Limbs:
+    """
+    Subtracts two secp256k1 scalar field elements ( in Montgomery form ) limb-wise, without propagating
+    borrows or reducing difference, where limbs of `b` carry at most `excess` excess bits. A
+    multiple of prime is added to `a`, so that no limb goes negative. If limbs of `a` carry at
+    most `ea` excess bits, limbs of difference carry at most max(ea, excess + 2) + 1 excess bits.
 
-    a[8] += carry
+    Difference can only be an operand of Montgomery multiplication, as long as it carries at most
+    `LAZY_EXCESS_BITS`, or of another lazy operation.
+    """
+    m0, m1, m2, m3, m4, m5, m6, m7 = LAZY_SUB_LIMBS[excess]
+    a0, a1, a2, a3, a4, a5, a6, a7 = a
+    b0, b1, b2, b3, b4, b5, b6, b7 = b
 
-    return a
+    return (
+        a0 + m0 - b0,
+        a1 + m1 - b1,
+        a2 + m2 - b2,
+        a3 + m3 - b3,
+        a4 + m4 - b4,
+        a5 + m5 - b5,
+        a6 + m6 - b6,
+        a7 + m7 - b7,
+    )
 
 
-def montgomery_mul(a: List[int], b: List[int]) -> List[int]:
+def to_montgomery(a: Limbs) -> Limbs:
     """
-    Multiplies two 256 -bit numbers ( in Montgomery form ), resulting into a 256 -bit
-    number ( in Montgomery form ), reduced by secp256k1 scalar field prime.
+    Converts a radix-r form secp256k1 scalar field element to Montgomery form, by multiplying it
+    with R^2, see section 2.2 of https://eprint.iacr.org/2017/1057.pdf
+    """
+    a0, a1, a2, a3, a4, a5, a6, a7 = a
 
-    Inspired by https://github.com/dusk-network/bls12_381/blob/ed4d87c/src/fp.rs#L437-L560
-    and algorithm 2 of https://eprint.iacr.org/2017/1057.pdf
+    # c[0 : 9] += a0 * b
+    t = a0 * 0x67D7D140
+    c0 = t & MASK
+    t = a0 * 0x896CF214 + (t >> 32)
+    c1 = t & MASK
+    t = a0 * 0x0E7CF878 + (t >> 32)
+    c2 = t & MASK
+    t = a0 * 0x741496C2 + (t >> 32)
+    c3 = t & MASK
+    t = a0 * 0x5BCD07C6 + (t >> 32)
+    c4 = t & MASK
+    t = a0 * 0xE697F5E4 + (t >> 32)
+    c5 = t & MASK
+    t = a0 * 0x81C69BC5 + (t >> 32)
+    c6 = t & MASK
+    t = a0 * 0x9D671CD5 + (t >> 32)
+    c7 = t & MASK
+    c8 = t >> 32
+
+    # reduce c[0] to zero, by adding q * prime
+    q = (c0 * 0x5588B13F) & MASK
+    t = c0 + q * 0xD0364141
+    t = c1 + q * 0xBFD25E8C + (t >> 32)
+    c1 = t & MASK
+    t = c2 + q * 0xAF48A03B + (t >> 32)
+    c2 = t & MASK
+    t = c3 + q * 0xBAAEDCE6 + (t >> 32)
+    c3 = t & MASK
+    t = c4 + q * 0xFFFFFFFE + (t >> 32)
+    c4 = t & MASK
+    t = c5 + q * 0xFFFFFFFF + (t >> 32)
+    c5 = t & MASK
+    t = c6 + q * 0xFFFFFFFF + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xFFFFFFFF + (t >> 32)
+    c7 = t & MASK
+    t = c8 + (t >> 32)
+    c8 = t & MASK
+    pc = t >> 32
+
+    # c[1 : 10] += a1 * b
+    t = c1 + a1 * 0x67D7D140
+    c1 = t & MASK
+    t = c2 + a1 * 0x896CF214 + (t >> 32)
+    c2 = t & MASK
+    t = c3 + a1 * 0x0E7CF878 + (t >> 32)
+    c3 = t & MASK
+    t = c4 + a1 * 0x741496C2 + (t >> 32)
+    c4 = t & MASK
+    t = c5 + a1 * 0x5BCD07C6 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + a1 * 0xE697F5E4 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + a1 * 0x81C69BC5 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + a1 * 0x9D671CD5 + (t >> 32)
+    c8 = t & MASK
+    c9 = t >> 32
+
+    # reduce c[1] to zero, by adding q * prime
+    q = (c1 * 0x5588B13F) & MASK
+    t = c1 + q * 0xD0364141
+    t = c2 + q * 0xBFD25E8C + (t >> 32)
+    c2 = t & MASK
+    t = c3 + q * 0xAF48A03B + (t >> 32)
+    c3 = t & MASK
+    t = c4 + q * 0xBAAEDCE6 + (t >> 32)
+    c4 = t & MASK
+    t = c5 + q * 0xFFFFFFFE + (t >> 32)
+    c5 = t & MASK
+    t = c6 + q * 0xFFFFFFFF + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xFFFFFFFF + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xFFFFFFFF + (t >> 32)
+    c8 = t & MASK
+    t = c9 + (t >> 32) + pc
+    c9 = t & MASK
+    pc = t >> 32
+
+    # c[2 : 11] += a2 * b
+    t = c2 + a2 * 0x67D7D140
+    c2 = t & MASK
+    t = c3 + a2 * 0x896CF214 + (t >> 32)
+    c3 = t & MASK
+    t = c4 + a2 * 0x0E7CF878 + (t >> 32)
+    c4 = t & MASK
+    t = c5 + a2 * 0x741496C2 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + a2 * 0x5BCD07C6 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + a2 * 0xE697F5E4 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + a2 * 0x81C69BC5 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + a2 * 0x9D671CD5 + (t >> 32)
+    c9 = t & MASK
+    c10 = t >> 32
+
+    # reduce c[2] to zero, by adding q * prime
+    q = (c2 * 0x5588B13F) & MASK
+    t = c2 + q * 0xD0364141
+    t = c3 + q * 0xBFD25E8C + (t >> 32)
+    c3 = t & MASK
+    t = c4 + q * 0xAF48A03B + (t >> 32)
+    c4 = t & MASK
+    t = c5 + q * 0xBAAEDCE6 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + q * 0xFFFFFFFE + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xFFFFFFFF + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xFFFFFFFF + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xFFFFFFFF + (t >> 32)
+    c9 = t & MASK
+    t = c10 + (t >> 32) + pc
+    c10 = t & MASK
+    pc = t >> 32
+
+    # c[3 : 12] += a3 * b
+    t = c3 + a3 * 0x67D7D140
+    c3 = t & MASK
+    t = c4 + a3 * 0x896CF214 + (t >> 32)
+    c4 = t & MASK
+    t = c5 + a3 * 0x0E7CF878 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + a3 * 0x741496C2 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + a3 * 0x5BCD07C6 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + a3 * 0xE697F5E4 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + a3 * 0x81C69BC5 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + a3 * 0x9D671CD5 + (t >> 32)
+    c10 = t & MASK
+    c11 = t >> 32
+
+    # reduce c[3] to zero, by adding q * prime
+    q = (c3 * 0x5588B13F) & MASK
+    t = c3 + q * 0xD0364141
+    t = c4 + q * 0xBFD25E8C + (t >> 32)
+    c4 = t & MASK
+    t = c5 + q * 0xAF48A03B + (t >> 32)
+    c5 = t & MASK
+    t = c6 + q * 0xBAAEDCE6 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xFFFFFFFE + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xFFFFFFFF + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xFFFFFFFF + (t >> 32)
+    c9 = t & MASK
+    t = c10 + q * 0xFFFFFFFF + (t >> 32)
+    c10 = t & MASK
+    t = c11 + (t >> 32) + pc
+    c11 = t & MASK
+    pc = t >> 32
+
+    # c[4 : 13] += a4 * b
+    t = c4 + a4 * 0x67D7D140
+    c4 = t & MASK
+    t = c5 + a4 * 0x896CF214 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + a4 * 0x0E7CF878 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + a4 * 0x741496C2 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + a4 * 0x5BCD07C6 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + a4 * 0xE697F5E4 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + a4 * 0x81C69BC5 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + a4 * 0x9D671CD5 + (t >> 32)
+    c11 = t & MASK
+    c12 = t >> 32
+
+    # reduce c[4] to zero, by adding q * prime
+    q = (c4 * 0x5588B13F) & MASK
+    t = c4 + q * 0xD0364141
+    t = c5 + q * 0xBFD25E8C + (t >> 32)
+    c5 = t & MASK
+    t = c6 + q * 0xAF48A03B + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xBAAEDCE6 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xFFFFFFFE + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xFFFFFFFF + (t >> 32)
+    c9 = t & MASK
+    t = c10 + q * 0xFFFFFFFF + (t >> 32)
+    c10 = t & MASK
+    t = c11 + q * 0xFFFFFFFF + (t >> 32)
+    c11 = t & MASK
+    t = c12 + (t >> 32) + pc
+    c12 = t & MASK
+    pc = t >> 32
+
+    # c[5 : 14] += a5 * b
+    t = c5 + a5 * 0x67D7D140
+    c5 = t & MASK
+    t = c6 + a5 * 0x896CF214 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + a5 * 0x0E7CF878 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + a5 * 0x741496C2 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + a5 * 0x5BCD07C6 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + a5 * 0xE697F5E4 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + a5 * 0x81C69BC5 + (t >> 32)
+    c11 = t & MASK
+    t = c12 + a5 * 0x9D671CD5 + (t >> 32)
+    c12 = t & MASK
+    c13 = t >> 32
+
+    # reduce c[5] to zero, by adding q * prime
+    q = (c5 * 0x5588B13F) & MASK
+    t = c5 + q * 0xD0364141
+    t = c6 + q * 0xBFD25E8C + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xAF48A03B + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xBAAEDCE6 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xFFFFFFFE + (t >> 32)
+    c9 = t & MASK
+    t = c10 + q * 0xFFFFFFFF + (t >> 32)
+    c10 = t & MASK
+    t = c11 + q * 0xFFFFFFFF + (t >> 32)
+    c11 = t & MASK
+    t = c12 + q * 0xFFFFFFFF + (t >> 32)
+    c12 = t & MASK
+    t = c13 + (t >> 32) + pc
+    c13 = t & MASK
+    pc = t >> 32
+
+    # c[6 : 15] += a6 * b
+    t = c6 + a6 * 0x67D7D140
+    c6 = t & MASK
+    t = c7 + a6 * 0x896CF214 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + a6 * 0x0E7CF878 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + a6 * 0x741496C2 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + a6 * 0x5BCD07C6 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + a6 * 0xE697F5E4 + (t >> 32)
+    c11 = t & MASK
+    t = c12 + a6 * 0x81C69BC5 + (t >> 32)
+    c12 = t & MASK
+    t = c13 + a6 * 0x9D671CD5 + (t >> 32)
+    c13 = t & MASK
+    c14 = t >> 32
+
+    # reduce c[6] to zero, by adding q * prime
+    q = (c6 * 0x5588B13F) & MASK
+    t = c6 + q * 0xD0364141
+    t = c7 + q * 0xBFD25E8C + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xAF48A03B + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xBAAEDCE6 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + q * 0xFFFFFFFE + (t >> 32)
+    c10 = t & MASK
+    t = c11 + q * 0xFFFFFFFF + (t >> 32)
+    c11 = t & MASK
+    t = c12 + q * 0xFFFFFFFF + (t >> 32)
+    c12 = t & MASK
+    t = c13 + q * 0xFFFFFFFF + (t >> 32)
+    c13 = t & MASK
+    t = c14 + (t >> 32) + pc
+    c14 = t & MASK
+    pc = t >> 32
+
+    # c[7 : 16] += a7 * b
+    t = c7 + a7 * 0x67D7D140
+    c7 = t & MASK
+    t = c8 + a7 * 0x896CF214 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + a7 * 0x0E7CF878 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + a7 * 0x741496C2 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + a7 * 0x5BCD07C6 + (t >> 32)
+    c11 = t & MASK
+    t = c12 + a7 * 0xE697F5E4 + (t >> 32)
+    c12 = t & MASK
+    t = c13 + a7 * 0x81C69BC5 + (t >> 32)
+    c13 = t & MASK
+    t = c14 + a7 * 0x9D671CD5 + (t >> 32)
+    c14 = t & MASK
+    c15 = t >> 32
+
+    # reduce c[7] to zero, by adding q * prime
+    q = (c7 * 0x5588B13F) & MASK
+    t = c7 + q * 0xD0364141
+    t = c8 + q * 0xBFD25E8C + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xAF48A03B + (t >> 32)
+    c9 = t & MASK
+    t = c10 + q * 0xBAAEDCE6 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + q * 0xFFFFFFFE + (t >> 32)
+    c11 = t & MASK
+    t = c12 + q * 0xFFFFFFFF + (t >> 32)
+    c12 = t & MASK
+    t = c13 + q * 0xFFFFFFFF + (t >> 32)
+    c13 = t & MASK
+    t = c14 + q * 0xFFFFFFFF + (t >> 32)
+    c14 = t & MASK
+    t = c15 + (t >> 32) + pc
+    c15 = t & MASK
+    pc = t >> 32
+
+    # fold final carry back in, using 2^256 = R mod prime
+    t = c8 + pc * 0x2FC9BEBF
+    c8 = t & MASK
+    t = c9 + pc * 0x402DA173 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + pc * 0x50B75FC4 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + pc * 0x45512319 + (t >> 32)
+    c11 = t & MASK
+    t = c12 + pc + (t >> 32)
+    c12 = t & MASK
+    t = c13 + (t >> 32)
+    c13 = t & MASK
+    t = c14 + (t >> 32)
+    c14 = t & MASK
+    t = c15 + (t >> 32)
+    c15 = t & MASK
+    pc = t >> 32
+
+    # which overflows again only if operands carry excess bits
+    t = c8 + pc * 0x2FC9BEBF
+    c8 = t & MASK
+    t = c9 + pc * 0x402DA173 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + pc * 0x50B75FC4 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + pc * 0x45512319 + (t >> 32)
+    c11 = t & MASK
+    c12 = (c12 + pc + (t >> 32)) & MASK
+
+    return (c8, c9, c10, c11, c12, c13, c14, c15)
+
+
+def from_montgomery(a: Limbs) -> Limbs:
+    """
+    Converts a Montgomery form secp256k1 scalar field element to radix-r form, by multiplying it
+    with 1, see section 2.2 of https://eprint.iacr.org/2017/1057.pdf
     """
-    assert len(a) == len(b)
-
-    prime = to_radix_r(N)
-    cnt = len(a)
-    c = [0] * (cnt << 1)
-
-    c[0:9] = u256xu32(c[0:9], a[0], b)
-    q = (MU * c[0]) % RADIX
-
-    _, carry = mac(c[0], q, prime[0], 0)
-    c[1], carry = mac(c[1], q, prime[1], carry)
-    c[2], carry = mac(c[2], q, prime[2], carry)
-    c[3], carry = mac(c[3], q, prime[3], carry)
-    c[4], carry = mac(c[4], q, prime[4], carry)
-    c[5], carry = mac(c[5], q, prime[5], carry)
-    c[6], carry = mac(c[6], q, prime[6], carry)
-    c[7], carry = mac(c[7], q, prime[7], carry)
-    c[8], pc = adc(c[8], 0, carry)
-
-    c[1:10] = u256xu32(c[1:10], a[1], b)
-    q = (MU * c[1]) % RADIX
-
-    _, carry = mac(c[1], q, prime[0], 0)
-    c[2], carry = mac(c[2], q, prime[1], carry)
-    c[3], carry = mac(c[3], q, prime[2], carry)
-    c[4], carry = mac(c[4], q, prime[3], carry)
-    c[5], carry = mac(c[5], q, prime[4], carry)
-    c[6], carry = mac(c[6], q, prime[5], carry)
-    c[7], carry = mac(c[7], q, prime[6], carry)
-    c[8], carry = mac(c[8], q, prime[7], carry)
-    c[9], pc = adc(c[9], pc, carry)
-
-    c[2:11] = u256xu32(c[2:11], a[2], b)
-    q = (MU * c[2]) % RADIX
-
-    _, carry = mac(c[2], q, prime[0], 0)
-    c[3], carry = mac(c[3], q, prime[1], carry)
-    c[4], carry = mac(c[4], q, prime[2], carry)
-    c[5], carry = mac(c[5], q, prime[3], carry)
-    c[6], carry = mac(c[6], q, prime[4], carry)
-    c[7], carry = mac(c[7], q, prime[5], carry)
-    c[8], carry = mac(c[8], q, prime[6], carry)
-    c[9], carry = mac(c[9], q, prime[7], carry)
-    c[10], pc = adc(c[10], pc, carry)
-
-    c[3:12] = u256xu32(c[3:12], a[3], b)
-    q = (MU * c[3]) % RADIX
-
-    _, carry = mac(c[3], q, prime[0], 0)
-    c[4], carry = mac(c[4], q, prime[1], carry)
-    c[5], carry = mac(c[5], q, prime[2], carry)
-    c[6], carry = mac(c[6], q, prime[3], carry)
-    c[7], carry = mac(c[7], q, prime[4], carry)
-    c[8], carry = mac(c[8], q, prime[5], carry)
-    c[9], carry = mac(c[9], q, prime[6], carry)
-    c[10], carry = mac(c[10], q, prime[7], carry)
-    c[11], pc = adc(c[11], pc, carry)
-
-    c[4:13] = u256xu32(c[4:13], a[4], b)
-    q = (MU * c[4]) % RADIX
-
-    _, carry = mac(c[4], q, prime[0], 0)
-    c[5], carry = mac(c[5], q, prime[1], carry)
-    c[6], carry = mac(c[6], q, prime[2], carry)
-    c[7], carry = mac(c[7], q, prime[3], carry)
-    c[8], carry = mac(c[8], q, prime[4], carry)
-    c[9], carry = mac(c[9], q, prime[5], carry)
-    c[10], carry = mac(c[10], q, prime[6], carry)
-    c[11], carry = mac(c[11], q, prime[7], carry)
-    c[12], pc = adc(c[12], pc, carry)
-
-    c[5:14] = u256xu32(c[5:14], a[5], b)
-    q = (MU * c[5]) % RADIX
-
-    _, carry = mac(c[5], q, prime[0], 0)
-    c[6], carry = mac(c[6], q, prime[1], carry)
-    c[7], carry = mac(c[7], q, prime[2], carry)
-    c[8], carry = mac(c[8], q, prime[3], carry)
-    c[9], carry = mac(c[9], q, prime[4], carry)
-    c[10], carry = mac(c[10], q, prime[5], carry)
-    c[11], carry = mac(c[11], q, prime[6], carry)
-    c[12], carry = mac(c[12], q, prime[7], carry)
-    c[13], pc = adc(c[13], pc, carry)
-
-    c[6:15] = u256xu32(c[6:15], a[6], b)
-    q = (MU * c[6]) % RADIX
-
-    _, carry = mac(c[6], q, prime[0], 0)
-    c[7], carry = mac(c[7], q, prime[1], carry)
-    c[8], carry = mac(c[8], q, prime[2], carry)
-    c[9], carry = mac(c[9], q, prime[3], carry)
-    c[10], carry = mac(c[10], q, prime[4], carry)
-    c[11], carry = mac(c[11], q, prime[5], carry)
-    c[12], carry = mac(c[12], q, prime[6], carry)
-    c[13], carry = mac(c[13], q, prime[7], carry)
-    c[14], pc = adc(c[14], pc, carry)
-
-    c[7:16] = u256xu32(c[7:16], a[7], b)
-    q = (MU * c[7]) % RADIX
-
-    _, carry = mac(c[7], q, prime[0], 0)
-    c[8], carry = mac(c[8], q, prime[1], carry)
-    c[9], carry = mac(c[9], q, prime[2], carry)
-    c[10], carry = mac(c[10], q, prime[3], carry)
-    c[11], carry = mac(c[11], q, prime[4], carry)
-    c[12], carry = mac(c[12], q, prime[5], carry)
-    c[13], carry = mac(c[13], q, prime[6], carry)
-    c[14], carry = mac(c[14], q, prime[7], carry)
-    c[15], pc = adc(c[15], pc, carry)
-
-    one = [801750719, 1076732275, 1354194884, 1162945305, 1, 0, 0, 0]
-    one = [i * pc for i in one]
-
-    carry = 0
-    c[8], carry = adc(c[8], one[0], carry)
-    c[9], carry = adc(c[9], one[1], carry)
-    c[10], carry = adc(c[10], one[2], carry)
-    c[11], carry = adc(c[11], one[3], carry)
-    c[12], carry = adc(c[12], one[4], carry)
-    c[13], carry = adc(c[13], one[5], carry)
-    c[14], carry = adc(c[14], one[6], carry)
-    c[15], _ = adc(c[15], one[7], carry)
-
-    return c[8:16]
-
-
-def to_montgomery(a: List[int]) -> List[int]:
-    """
-    Converts a radix-r form secp256k1 scalar field element to Montgomery form.
-
-    Just like https://github.com/dusk-network/bls12_381/blob/ed4d87c/src/fp.rs#L251-L253;
-    for better understanding read section 2.2 of https://eprint.iacr.org/2017/1057.pdf
-    """
-    return montgomery_mul(a, to_radix_r(R2))
-
-
-def from_montgomery(a: List[int]) -> List[int]:
-    """
-    Converts a Montgomery form secp256k1 scalar field element to radix-r form.
-
-    Read section 2.2 of https://eprint.iacr.org/2017/1057.pdf
-    """
-    return montgomery_mul(a, to_radix_r(1))
+    a0, a1, a2, a3, a4, a5, a6, a7 = a
+
+    # c[0 : 9] += a0 * b
+    t = a0
+    c0 = t & MASK
+    t >>= 32
+    c1 = t & MASK
+    t >>= 32
+    c2 = t & MASK
+    t >>= 32
+    c3 = t & MASK
+    t >>= 32
+    c4 = t & MASK
+    t >>= 32
+    c5 = t & MASK
+    t >>= 32
+    c6 = t & MASK
+    t >>= 32
+    c7 = t & MASK
+    c8 = t >> 32
+
+    # reduce c[0] to zero, by adding q * prime
+    q = (c0 * 0x5588B13F) & MASK
+    t = c0 + q * 0xD0364141
+    t = c1 + q * 0xBFD25E8C + (t >> 32)
+    c1 = t & MASK
+    t = c2 + q * 0xAF48A03B + (t >> 32)
+    c2 = t & MASK
+    t = c3 + q * 0xBAAEDCE6 + (t >> 32)
+    c3 = t & MASK
+    t = c4 + q * 0xFFFFFFFE + (t >> 32)
+    c4 = t & MASK
+    t = c5 + q * 0xFFFFFFFF + (t >> 32)
+    c5 = t & MASK
+    t = c6 + q * 0xFFFFFFFF + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xFFFFFFFF + (t >> 32)
+    c7 = t & MASK
+    t = c8 + (t >> 32)
+    c8 = t & MASK
+    pc = t >> 32
+
+    # c[1 : 10] += a1 * b
+    t = c1 + a1
+    c1 = t & MASK
+    t = c2 + (t >> 32)
+    c2 = t & MASK
+    t = c3 + (t >> 32)
+    c3 = t & MASK
+    t = c4 + (t >> 32)
+    c4 = t & MASK
+    t = c5 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + (t >> 32)
+    c8 = t & MASK
+    c9 = t >> 32
+
+    # reduce c[1] to zero, by adding q * prime
+    q = (c1 * 0x5588B13F) & MASK
+    t = c1 + q * 0xD0364141
+    t = c2 + q * 0xBFD25E8C + (t >> 32)
+    c2 = t & MASK
+    t = c3 + q * 0xAF48A03B + (t >> 32)
+    c3 = t & MASK
+    t = c4 + q * 0xBAAEDCE6 + (t >> 32)
+    c4 = t & MASK
+    t = c5 + q * 0xFFFFFFFE + (t >> 32)
+    c5 = t & MASK
+    t = c6 + q * 0xFFFFFFFF + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xFFFFFFFF + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xFFFFFFFF + (t >> 32)
+    c8 = t & MASK
+    t = c9 + (t >> 32) + pc
+    c9 = t & MASK
+    pc = t >> 32
+
+    # c[2 : 11] += a2 * b
+    t = c2 + a2
+    c2 = t & MASK
+    t = c3 + (t >> 32)
+    c3 = t & MASK
+    t = c4 + (t >> 32)
+    c4 = t & MASK
+    t = c5 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + (t >> 32)
+    c9 = t & MASK
+    c10 = t >> 32
+
+    # reduce c[2] to zero, by adding q * prime
+    q = (c2 * 0x5588B13F) & MASK
+    t = c2 + q * 0xD0364141
+    t = c3 + q * 0xBFD25E8C + (t >> 32)
+    c3 = t & MASK
+    t = c4 + q * 0xAF48A03B + (t >> 32)
+    c4 = t & MASK
+    t = c5 + q * 0xBAAEDCE6 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + q * 0xFFFFFFFE + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xFFFFFFFF + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xFFFFFFFF + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xFFFFFFFF + (t >> 32)
+    c9 = t & MASK
+    t = c10 + (t >> 32) + pc
+    c10 = t & MASK
+    pc = t >> 32
+
+    # c[3 : 12] += a3 * b
+    t = c3 + a3
+    c3 = t & MASK
+    t = c4 + (t >> 32)
+    c4 = t & MASK
+    t = c5 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + (t >> 32)
+    c10 = t & MASK
+    c11 = t >> 32
+
+    # reduce c[3] to zero, by adding q * prime
+    q = (c3 * 0x5588B13F) & MASK
+    t = c3 + q * 0xD0364141
+    t = c4 + q * 0xBFD25E8C + (t >> 32)
+    c4 = t & MASK
+    t = c5 + q * 0xAF48A03B + (t >> 32)
+    c5 = t & MASK
+    t = c6 + q * 0xBAAEDCE6 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xFFFFFFFE + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xFFFFFFFF + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xFFFFFFFF + (t >> 32)
+    c9 = t & MASK
+    t = c10 + q * 0xFFFFFFFF + (t >> 32)
+    c10 = t & MASK
+    t = c11 + (t >> 32) + pc
+    c11 = t & MASK
+    pc = t >> 32
+
+    # c[4 : 13] += a4 * b
+    t = c4 + a4
+    c4 = t & MASK
+    t = c5 + (t >> 32)
+    c5 = t & MASK
+    t = c6 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + (t >> 32)
+    c11 = t & MASK
+    c12 = t >> 32
+
+    # reduce c[4] to zero, by adding q * prime
+    q = (c4 * 0x5588B13F) & MASK
+    t = c4 + q * 0xD0364141
+    t = c5 + q * 0xBFD25E8C + (t >> 32)
+    c5 = t & MASK
+    t = c6 + q * 0xAF48A03B + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xBAAEDCE6 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xFFFFFFFE + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xFFFFFFFF + (t >> 32)
+    c9 = t & MASK
+    t = c10 + q * 0xFFFFFFFF + (t >> 32)
+    c10 = t & MASK
+    t = c11 + q * 0xFFFFFFFF + (t >> 32)
+    c11 = t & MASK
+    t = c12 + (t >> 32) + pc
+    c12 = t & MASK
+    pc = t >> 32
+
+    # c[5 : 14] += a5 * b
+    t = c5 + a5
+    c5 = t & MASK
+    t = c6 + (t >> 32)
+    c6 = t & MASK
+    t = c7 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + (t >> 32)
+    c11 = t & MASK
+    t = c12 + (t >> 32)
+    c12 = t & MASK
+    c13 = t >> 32
+
+    # reduce c[5] to zero, by adding q * prime
+    q = (c5 * 0x5588B13F) & MASK
+    t = c5 + q * 0xD0364141
+    t = c6 + q * 0xBFD25E8C + (t >> 32)
+    c6 = t & MASK
+    t = c7 + q * 0xAF48A03B + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xBAAEDCE6 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xFFFFFFFE + (t >> 32)
+    c9 = t & MASK
+    t = c10 + q * 0xFFFFFFFF + (t >> 32)
+    c10 = t & MASK
+    t = c11 + q * 0xFFFFFFFF + (t >> 32)
+    c11 = t & MASK
+    t = c12 + q * 0xFFFFFFFF + (t >> 32)
+    c12 = t & MASK
+    t = c13 + (t >> 32) + pc
+    c13 = t & MASK
+    pc = t >> 32
+
+    # c[6 : 15] += a6 * b
+    t = c6 + a6
+    c6 = t & MASK
+    t = c7 + (t >> 32)
+    c7 = t & MASK
+    t = c8 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + (t >> 32)
+    c11 = t & MASK
+    t = c12 + (t >> 32)
+    c12 = t & MASK
+    t = c13 + (t >> 32)
+    c13 = t & MASK
+    c14 = t >> 32
+
+    # reduce c[6] to zero, by adding q * prime
+    q = (c6 * 0x5588B13F) & MASK
+    t = c6 + q * 0xD0364141
+    t = c7 + q * 0xBFD25E8C + (t >> 32)
+    c7 = t & MASK
+    t = c8 + q * 0xAF48A03B + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xBAAEDCE6 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + q * 0xFFFFFFFE + (t >> 32)
+    c10 = t & MASK
+    t = c11 + q * 0xFFFFFFFF + (t >> 32)
+    c11 = t & MASK
+    t = c12 + q * 0xFFFFFFFF + (t >> 32)
+    c12 = t & MASK
+    t = c13 + q * 0xFFFFFFFF + (t >> 32)
+    c13 = t & MASK
+    t = c14 + (t >> 32) + pc
+    c14 = t & MASK
+    pc = t >> 32
+
+    # c[7 : 16] += a7 * b
+    t = c7 + a7
+    c7 = t & MASK
+    t = c8 + (t >> 32)
+    c8 = t & MASK
+    t = c9 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + (t >> 32)
+    c11 = t & MASK
+    t = c12 + (t >> 32)
+    c12 = t & MASK
+    t = c13 + (t >> 32)
+    c13 = t & MASK
+    t = c14 + (t >> 32)
+    c14 = t & MASK
+    c15 = t >> 32
+
+    # reduce c[7] to zero, by adding q * prime
+    q = (c7 * 0x5588B13F) & MASK
+    t = c7 + q * 0xD0364141
+    t = c8 + q * 0xBFD25E8C + (t >> 32)
+    c8 = t & MASK
+    t = c9 + q * 0xAF48A03B + (t >> 32)
+    c9 = t & MASK
+    t = c10 + q * 0xBAAEDCE6 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + q * 0xFFFFFFFE + (t >> 32)
+    c11 = t & MASK
+    t = c12 + q * 0xFFFFFFFF + (t >> 32)
+    c12 = t & MASK
+    t = c13 + q * 0xFFFFFFFF + (t >> 32)
+    c13 = t & MASK
+    t = c14 + q * 0xFFFFFFFF + (t >> 32)
+    c14 = t & MASK
+    t = c15 + (t >> 32) + pc
+    c15 = t & MASK
+    pc = t >> 32
+
+    # fold final carry back in, using 2^256 = R mod prime
+    t = c8 + pc * 0x2FC9BEBF
+    c8 = t & MASK
+    t = c9 + pc * 0x402DA173 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + pc * 0x50B75FC4 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + pc * 0x45512319 + (t >> 32)
+    c11 = t & MASK
+    t = c12 + pc + (t >> 32)
+    c12 = t & MASK
+    t = c13 + (t >> 32)
+    c13 = t & MASK
+    t = c14 + (t >> 32)
+    c14 = t & MASK
+    t = c15 + (t >> 32)
+    c15 = t & MASK
+    pc = t >> 32
+
+    # which overflows again only if operands carry excess bits
+    t = c8 + pc * 0x2FC9BEBF
+    c8 = t & MASK
+    t = c9 + pc * 0x402DA173 + (t >> 32)
+    c9 = t & MASK
+    t = c10 + pc * 0x50B75FC4 + (t >> 32)
+    c10 = t & MASK
+    t = c11 + pc * 0x45512319 + (t >> 32)
+    c11 = t & MASK
+    c12 = (c12 + pc + (t >> 32)) & MASK
+
+    return (c8, c9, c10, c11, c12, c13, c14, c15)
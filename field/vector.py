@@ -0,0 +1,201 @@
+#!/usr/bin/python3
+
+import numpy as np
+from typing import List
+from typing_extensions import Self
+from . import base_field_consts as fp
+from . import scalar_field_consts as fr
+
+# Each limb holds 32 -bit value, kept in 64 -bit lane, so that product of two limbs
+# plus two more limbs never overflows
+RADIX_BIT_LEN: int = 32
+RADIX_MASK = np.uint64((1 << RADIX_BIT_LEN) - 1)
+LIMB_COUNT: int = 8
+
+
+def to_limbs(num: int) -> List[int]:
+    """
+    Converts a 256 -bit integer to its radix-r representation | r = 2^32
+    """
+    return [
+        (num >> (i * RADIX_BIT_LEN)) & ((1 << RADIX_BIT_LEN) - 1)
+        for i in range(LIMB_COUNT)
+    ]
+
+
+def adc(a: np.ndarray, b: np.ndarray, carry: np.ndarray):
+    """
+    Lane-wise addition with carry, returning 32 -bit sum limb and carry, same as carry chain
+    of `add` in generated `base_field_utils.py`
+    """
+    tmp = a + b + carry
+    return tmp & RADIX_MASK, tmp >> RADIX_BIT_LEN
+
+
+def mac(a: np.ndarray, b: np.ndarray, c: np.ndarray, carry: np.ndarray):
+    """
+    Lane-wise multiply-accumulate with carry, returning 32 -bit limb and carry, same as each
+    step of `montgomery_mul` in generated `base_field_utils.py`
+    """
+    tmp = a + b * c + carry
+    return tmp & RADIX_MASK, tmp >> RADIX_BIT_LEN
+
+
+def sbb(a: np.ndarray, b: np.ndarray, borrow: np.ndarray):
+    """
+    Lane-wise subtraction with borrow, returning 32 -bit difference limb and borrow, same as
+    borrow chain of `neg` in generated `base_field_utils.py`, where wrapping at 2^64 is implicit
+    """
+    tmp = a - (b + (borrow >> (RADIX_BIT_LEN - 1)))
+    return tmp & RADIX_MASK, tmp >> RADIX_BIT_LEN
+
+
+class FieldVector:
+    """
+    Many elements of a secp256k1 prime field, kept in Montgomery form, as struct of arrays
+    i.e. limbs[i][j] holds i -th 32 -bit limb of j -th element. Each arithmetic operation
+    processes all elements at once, following same algorithm as scalar implementation.
+    """
+
+    # Following class attributes are defined by concrete field types
+    MODULUS: int = 0
+    MU: int = 0
+    R: int = 0
+    R2: int = 0
+
+    def __init__(self, limbs: np.ndarray):
+        assert limbs.shape[0] == LIMB_COUNT and limbs.dtype == np.uint64
+        self._limbs = limbs
+
+    @classmethod
+    def from_nums(cls, nums: List[int]) -> Self:
+        """
+        Given many field elements as integers, this routine converts them to Montgomery form
+        """
+        limbs = np.array([to_limbs(num % cls.MODULUS) for num in nums], dtype=np.uint64)
+        limbs = limbs.reshape(len(nums), LIMB_COUNT).T.copy()
+
+        r2 = np.array(to_limbs(cls.R2), dtype=np.uint64).reshape(LIMB_COUNT, 1)
+        return cls(cls._montgomery_mul(limbs, np.repeat(r2, len(nums), axis=1)))
+
+    def to_nums(self) -> List[int]:
+        """
+        Given many field elements in Montgomery form, this routine computes them as integers
+        """
+        one = np.zeros_like(self._limbs)
+        one[0] = 1
+
+        limbs = self._montgomery_mul(self._limbs, one)
+        limbs = [[int(limb) for limb in row] for row in limbs]
+
+        nums = []
+        for j in range(len(self)):
+            num = 0
+            for i in reversed(range(LIMB_COUNT)):
+                num = (num << RADIX_BIT_LEN) | limbs[i][j]
+            nums.append(num % self.MODULUS)
+
+        return nums
+
+    def __len__(self) -> int:
+        """
+        Number of field elements held in vector
+        """
+        return self._limbs.shape[1]
+
+    @classmethod
+    def _montgomery_mul(cls, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Lane-wise version of `montgomery_mul` in generated `base_field_utils.py` i.e. algorithm 2
+        of https://eprint.iacr.org/2017/1057.pdf, working with any secp256k1 prime field
+        """
+        prime = [np.uint64(limb) for limb in to_limbs(cls.MODULUS)]
+        one = [np.uint64(limb) for limb in to_limbs(cls.R)]
+        mu = np.uint64(cls.MU)
+
+        c = np.zeros((LIMB_COUNT << 1, a.shape[1]), dtype=np.uint64)
+        pc = np.zeros(a.shape[1], dtype=np.uint64)
+
+        for i in range(LIMB_COUNT):
+            carry = np.zeros_like(pc)
+            for j in range(LIMB_COUNT):
+                c[i + j], carry = mac(c[i + j], a[i], b[j], carry)
+            c[i + LIMB_COUNT] = carry
+
+            q = (mu * c[i]) & RADIX_MASK
+
+            _, carry = mac(c[i], q, prime[0], np.zeros_like(pc))
+            for j in range(1, LIMB_COUNT):
+                c[i + j], carry = mac(c[i + j], q, prime[j], carry)
+            c[i + LIMB_COUNT], pc = adc(c[i + LIMB_COUNT], pc, carry)
+
+        carry = np.zeros_like(pc)
+        for j in range(LIMB_COUNT):
+            c[j + LIMB_COUNT], carry = adc(c[j + LIMB_COUNT], one[j] * pc, carry)
+
+        return c[LIMB_COUNT:].copy()
+
+    def __mul__(self, rhs: Self) -> Self:
+        """
+        Lane-wise modular multiplication of two vectors of field elements, in Montgomery form
+        """
+        return type(self)(self._montgomery_mul(self._limbs, rhs._limbs))
+
+    def __add__(self, rhs: Self) -> Self:
+        """
+        Lane-wise modular addition of two vectors of field elements, in Montgomery form
+        """
+        one = [np.uint64(limb) for limb in to_limbs(self.R)]
+
+        c = np.empty_like(self._limbs)
+        carry = np.zeros(len(self), dtype=np.uint64)
+        for j in range(LIMB_COUNT):
+            c[j], carry = adc(self._limbs[j], rhs._limbs[j], carry)
+
+        pc = carry
+        carry = np.zeros_like(pc)
+        for j in range(LIMB_COUNT):
+            c[j], carry = adc(c[j], one[j] * pc, carry)
+
+        return type(self)(c)
+
+    def __neg__(self) -> Self:
+        """
+        Lane-wise negation of a vector of field elements s.t. a + b = 0, if b = -a
+        """
+        prime = [np.uint64(limb) for limb in to_limbs(self.MODULUS)]
+
+        c = np.empty_like(self._limbs)
+        borrow = np.zeros(len(self), dtype=np.uint64)
+        for j in range(LIMB_COUNT):
+            c[j], borrow = sbb(prime[j], self._limbs[j], borrow)
+
+        return type(self)(c)
+
+    def __sub__(self, rhs: Self) -> Self:
+        """
+        Lane-wise modular subtraction of two vectors of field elements, in Montgomery form
+        """
+        return self + (-rhs)
+
+
+class BaseFieldVector(FieldVector):
+    """
+    Many secp256k1 base field elements, kept in Montgomery form, as struct of arrays
+    """
+
+    MODULUS: int = fp.P
+    MU: int = fp.MU
+    R: int = fp.R
+    R2: int = fp.R2
+
+
+class ScalarFieldVector(FieldVector):
+    """
+    Many secp256k1 scalar field elements, kept in Montgomery form, as struct of arrays
+    """
+
+    MODULUS: int = fr.N
+    MU: int = fr.MU
+    R: int = fr.R
+    R2: int = fr.R2
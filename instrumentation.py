@@ -0,0 +1,173 @@
+#!/usr/bin/python3
+
+from time import perf_counter
+from functools import wraps
+from threading import Lock, local
+from collections import Counter, defaultdict
+from typing import Dict, Tuple
+from field import BaseField, ScalarField
+from point import Point, JacobianPoint
+
+# Instrumented operations, grouped by class they belong to. Operations invoked from within another
+# operation of same group ( e.g. multiplications performed during inversion ) are not counted separately.
+OPERATIONS = {
+    "Fp": (
+        BaseField,
+        (
+            "__mul__",
+            "__add__",
+            "__sub__",
+            "__neg__",
+            "add_lazy",
+            "sub_lazy",
+            "inv",
+            "inv_vartime",
+            "sqrt",
+        ),
+    ),
+    "Fn": (
+        ScalarField,
+        ("__mul__", "__add__", "__sub__", "__neg__", "inv", "inv_vartime"),
+    ),
+    "Point": (
+        Point,
+        (
+            "__add__",
+            "__neg__",
+            "addMixed",
+            "double",
+            "toAffine",
+            "batch_to_affine",
+            "liftX",
+        ),
+    ),
+    "Jacobian": (JacobianPoint, ("addMixed", "double")),
+}
+
+# Short names of arithmetic operators, used in reports
+OPERATORS = {"__mul__": "mul", "__add__": "add", "__sub__": "sub", "__neg__": "neg"}
+
+
+class Profile:
+    """
+    Per operation call counts and wall-time ( in seconds, excluding time spent in nested operations
+    of same group ), collected while instrumentation is enabled, see `instrument`
+    """
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.times: Dict[str, float] = defaultdict(float)
+
+    def report(self, label: str) -> str:
+        """
+        Summarizes operation counts in a single line, like `verify = 2 Fn.inv + 5,400 Fp.mul + ...`,
+        listing most frequent operations first
+        """
+        terms = " + ".join(f"{cnt:,} {op}" for op, cnt in self.counts.most_common())
+        return f"{label} = {terms or 0}"
+
+    def table(self) -> str:
+        """
+        Tabulates call count, total and mean wall-time of each operation, most expensive one first
+        """
+        rows = sorted(self.counts, key=lambda op: self.times[op], reverse=True)
+
+        lines = [
+            f"{'operation':<20} {'calls':>10} {'total (ms)':>12} {'mean (us)':>12}"
+        ]
+        for op in rows:
+            total = self.times[op]
+            lines.append(
+                f"{op:<20} {self.counts[op]:>10,} {total * 1e3:>12.3f} {total * 1e6 / self.counts[op]:>12.3f}"
+            )
+
+        return "\n".join(lines)
+
+
+class instrument:
+    """
+    Context manager, which instruments field and group operations ( see `OPERATIONS` ) with call
+    counters and wall-time accumulators, while it's active, by replacing them with wrappers. Original
+    operations are restored on exit, so instrumentation costs nothing when it's not enabled.
+
+    >>> with instrument() as prof:
+    ...     ecdsa.verify(pkey, msg, sig)
+    >>> print(prof.report("verify"))
+
+    Only one instrumentation can be active at a time. Counters are shared by all threads.
+    """
+
+    _lock = Lock()
+
+    def __init__(self):
+        self.profile = Profile()
+        self._originals = []
+
+    def _wrap(self, group: str, name: str, func, active: local):
+        """
+        Wraps an operation, s.t. its invocations are counted and timed, unless it's invoked from
+        within another operation of same group
+        """
+        op = f"{group}.{OPERATORS.get(name, name)}"
+        counts = self.profile.counts
+        times = self.profile.times
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if getattr(active, group, False):
+                return func(*args, **kwargs)
+
+            setattr(active, group, True)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                times[op] += perf_counter() - start
+                counts[op] += 1
+                setattr(active, group, False)
+
+        return wrapper
+
+    def __enter__(self) -> Profile:
+        if not instrument._lock.acquire(blocking=False):
+            raise RuntimeError("instrumentation is already active")
+
+        # whether an operation of some group is being executed, tracked per thread
+        active = local()
+
+        for group, (cls, names) in OPERATIONS.items():
+            for name in names:
+                if name not in cls.__dict__:
+                    continue
+
+                attr = cls.__dict__[name]
+                self._originals.append((cls, name, attr))
+
+                if isinstance(attr, classmethod):
+                    wrapped = classmethod(
+                        self._wrap(group, name, attr.__func__, active)
+                    )
+                else:
+                    wrapped = self._wrap(group, name, attr, active)
+
+                setattr(cls, name, wrapped)
+
+        return self.profile
+
+    def __exit__(self, *_):
+        for cls, name, attr in reversed(self._originals):
+            setattr(cls, name, attr)
+
+        self._originals.clear()
+        instrument._lock.release()
+
+
+def profile_operation(label: str, func, *args, **kwargs) -> Tuple[Profile, str]:
+    """
+    Invokes `func` with given arguments, under instrumentation, returning collected profile and
+    its one line report
+    """
+    with instrument() as prof:
+        func(*args, **kwargs)
+
+    return prof, prof.report(label)
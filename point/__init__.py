@@ -1,4 +1,10 @@
 #!/usr/bin/python3
 
-from field import BaseField
-from .point import Point
+from field import BaseField, Gx, Gy, N, P, BETA, split_scalar, batch_inv
+from .point import Point, strauss, sum_normalized
+from .point import set_lazy_reduction, get_lazy_reduction
+from .jacobian import JacobianPoint
+from .fixed_base import FixedBaseTable, generator_table, mul_generator
+from .fixed_base import set_generator_table_budget, get_generator_table_budget
+from .multi_scalar import OddMultiples, mul_double_scalar, mul_multi_scalar, pippenger
+from .batch import RANDOM_COEFF_BITS, random_coefficient, bisect
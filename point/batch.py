@@ -0,0 +1,36 @@
+#!/usr/bin/python3
+
+from typing import Callable, List, TypeVar
+from secrets import randbits
+
+# Bit length of random coefficients used for combining equations in a batch
+RANDOM_COEFF_BITS: int = 128
+
+T = TypeVar("T")
+
+
+def random_coefficient(idx: int) -> int:
+    """
+    Random coefficient, by which `idx` -th equation of a batch is scaled, before all of them are
+    summed up into one, see section 3 of https://eprint.iacr.org/2012/549.pdf. First coefficient
+    can be fixed to 1, without affecting soundness.
+    """
+    return 1 if idx == 0 else randbits(RANDOM_COEFF_BITS)
+
+
+def bisect(items: List[T], check: Callable[[List[T]], bool]) -> List[bool]:
+    """
+    Checks a batch of items at once, using given batch check, recursively halving it when batch
+    check fails, so that invalid items are located, returning per item validity
+    """
+    if not items:
+        return []
+
+    if check(items):
+        return [True] * len(items)
+
+    if len(items) == 1:
+        return [False]
+
+    mid = len(items) >> 1
+    return bisect(items[:mid], check) + bisect(items[mid:], check)
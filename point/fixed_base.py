@@ -0,0 +1,209 @@
+#!/usr/bin/python3
+
+from sys import getsizeof
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from typing_extensions import Self
+from . import N
+from .point import Point, sum_normalized
+
+# Default amount of memory ( in bytes ) which can be spent on precomputed multiples of generator
+DEFAULT_MEMORY_BUDGET: int = 3 << 20
+
+# Widest window considered, when choosing table shape from a memory budget
+MAX_WINDOW_WIDTH: int = 16
+
+# Window width of wNAF, used for generator point in joint scalar multiplication
+GENERATOR_WNAF_WIDTH: int = 8
+
+# Memory budget used by `mul_generator`, see `set_generator_table_budget`
+_generator_budget: int = DEFAULT_MEMORY_BUDGET
+
+# Only generator table kept around, along with memory budget it was built for
+_generator_table: Optional[Tuple[int, "FixedBaseTable"]] = None
+
+
+def footprint(obj: object) -> int:
+    """
+    Approximates how many bytes an object occupies in memory, while recursively
+    accounting for its attributes/ slots and container elements
+    """
+    size = getsizeof(obj)
+
+    if isinstance(obj, (list, tuple)):
+        return size + sum(footprint(elm) for elm in obj)
+
+    if hasattr(obj, "__dict__"):
+        size += getsizeof(obj.__dict__)
+        size += sum(footprint(val) for val in vars(obj).values())
+
+    for slot in getattr(type(obj), "__slots__", ()):
+        if hasattr(obj, slot):
+            size += footprint(getattr(obj, slot))
+
+    return size
+
+
+def table_size(width: int) -> int:
+    """
+    Number of elliptic curve points kept in a fixed-base table of given window width,
+    for 256 -bit scalars
+    """
+    windows = -(-256 // width)
+    return windows * ((1 << width) - 1)
+
+
+def normalize(points: List[Point]) -> List[Point]:
+    """
+    Converts many elliptic curve points to projective coordinates with Z = 1, sharing one
+    inversion across all of them, while keeping identity element as it is
+    """
+    affine = Point.batch_to_affine(points)
+    return [
+        p if p.isZero() else Point.fromAffine(x, y) for p, (x, y) in zip(points, affine)
+    ]
+
+
+class FixedBaseTable:
+    """
+    Precomputed multiples of a fixed secp256k1 elliptic curve point `B`, organized as
+    ⌈256/w⌉ rows of 2^w - 1 points each, such that row[i][j - 1] = j * 2^(w * i) * B. All
+    precomputed points are normalized s.t. Z = 1.
+
+    A scalar multiplication is then a sequence of ⌈256/w⌉ table lookups and point additions,
+    without any point doubling, see section 3.3.1 of https://link.springer.com/book/10.1007/b97644
+    """
+
+    def __init__(self, base: Point, width: int):
+        assert 1 <= width <= MAX_WINDOW_WIDTH, "window width must be ∈ [1, 16]"
+        assert not base.isZero(), "base point can't be identity"
+
+        self._width = width
+        self._table = []
+
+        windows = -(-256 // width)
+        for _ in range(windows):
+            row = [base]
+            for _ in range((1 << width) - 2):
+                row.append(row[-1] + base)
+            self._table.append(row)
+
+            for _ in range(width):
+                base = base.double()
+
+        points = normalize([p for row in self._table for p in row])
+        row_len = (1 << width) - 1
+        self._table = [points[i : i + row_len] for i in range(0, len(points), row_len)]
+
+    @classmethod
+    def fromBudget(cls, base: Point, memory_budget: int) -> Self:
+        """
+        Given a memory budget in bytes, this routine builds table with widest window
+        s.t. all precomputed points fit in that budget. At least window width of 1 is used,
+        which requires 256 points.
+        """
+        per_point = footprint(base)
+
+        width = 1
+        while width < MAX_WINDOW_WIDTH:
+            if table_size(width + 1) * per_point > memory_budget:
+                break
+            width += 1
+
+        return cls(base, width)
+
+    @property
+    def width(self) -> int:
+        """
+        Window width ( in bits ) used for splitting scalar
+        """
+        return self._width
+
+    @property
+    def rows(self) -> List[List[Point]]:
+        """
+        Precomputed multiples of base point, see class level documentation for layout
+        """
+        return self._table
+
+    def __len__(self) -> int:
+        """
+        Number of precomputed elliptic curve points held in table
+        """
+        return sum(len(row) for row in self._table)
+
+    def mul(self, scalar: int) -> Point:
+        """
+        Multiplies base point with a scalar, using precomputed table, such that
+        return value = scalar * B
+        """
+        scalar %= N
+        mask = (1 << self._width) - 1
+
+        picked = []
+        for row in self._table:
+            digit = scalar & mask
+            if digit:
+                picked.append(row[digit - 1])
+
+            scalar >>= self._width
+
+        return sum_normalized(picked)
+
+
+def generator_table(memory_budget: Optional[int] = None) -> FixedBaseTable:
+    """
+    Fixed-base table for secp256k1 generator point, built once per process, for given memory
+    budget ( by default, one set using `set_generator_table_budget` ). Only one table is kept,
+    so asking for a different budget replaces it.
+    """
+    global _generator_table
+
+    budget = _generator_budget if memory_budget is None else memory_budget
+    if _generator_table is None or _generator_table[0] != budget:
+        # previous table is released before building new one, so that both never coexist
+        _generator_table = None
+        _generator_table = (
+            budget,
+            FixedBaseTable.fromBudget(Point.generator(), budget),
+        )
+
+    return _generator_table[1]
+
+
+@lru_cache(maxsize=None)
+def generator_odd_multiples(width: int = GENERATOR_WNAF_WIDTH) -> List[Point]:
+    """
+    Odd multiples of secp256k1 generator point i.e. [G, 3G, ..., (2^(w-1) - 1)G], built once
+    per process ( per window width ) and normalized s.t. Z = 1
+    """
+    return normalize(Point.generator().oddMultiples(width))
+
+
+def set_generator_table_budget(memory_budget: int):
+    """
+    Sets memory budget ( in bytes ) of generator table used by `mul_generator`, which is
+    rebuilt lazily on next use, while table built for previous budget is released right away
+    """
+    global _generator_budget, _generator_table
+
+    assert memory_budget > 0, "memory budget must be positive"
+    _generator_budget = memory_budget
+
+    if _generator_table is not None and _generator_table[0] != memory_budget:
+        _generator_table = None
+
+
+def get_generator_table_budget() -> int:
+    """
+    Memory budget ( in bytes ) of generator table used by `mul_generator`
+    """
+    return _generator_budget
+
+
+def mul_generator(scalar: int) -> Point:
+    """
+    Multiplies secp256k1 generator point `G` with a scalar, using process-wide
+    precomputed table, such that return value = scalar * G
+    """
+    return generator_table().mul(scalar)
@@ -0,0 +1,141 @@
+#!/usr/bin/python3
+
+from typing import Tuple
+from typing_extensions import Self
+from . import BaseField
+
+# Frequently used constants, kept around so that they're not recomputed
+ZERO = BaseField.from_num(0)
+ONE = BaseField.from_num(1)
+
+
+class JacobianPoint:
+    """
+    A secp256k1 elliptic curve point, kept in Jacobian coordinate system i.e. (X, Y, Z) represents
+    affine point (X / Z^2, Y / Z^3). Formulas are faster than those of projective coordinate system,
+    but not complete, so special cases are handled explicitly.
+
+    See https://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian-0.html
+    """
+
+    __slots__ = ("_x", "_y", "_z")
+
+    def __init__(self, x: BaseField, y: BaseField, z: BaseField):
+        self._x = x
+        self._y = y
+        self._z = z
+
+    @classmethod
+    def zero(cls) -> Self:
+        """
+        Identity element of group, having Z = 0
+        """
+        return cls(ONE, ONE, ZERO)
+
+    def isZero(self) -> bool:
+        """
+        Checks whether elliptic curve point is identity element of group i.e. Z = 0
+        """
+        return self._z == ZERO
+
+    @classmethod
+    def fromProjective(cls, x: BaseField, y: BaseField, z: BaseField) -> Self:
+        """
+        Given projective coordinate (X, Y, Z) of secp256k1 elliptic curve point, this routine
+        computes equivalent point in Jacobian coordinate system i.e. (X * Z, Y * Z^2, Z)
+        """
+        if z == ZERO:
+            return cls.zero()
+
+        return cls(x * z, y * (z * z), z)
+
+    def toProjective(self) -> Tuple[BaseField, BaseField, BaseField]:
+        """
+        Computes projective coordinate (X * Z, Y, Z^3) of elliptic curve point kept in Jacobian
+        coordinate system, where identity element is mapped to (0, 1, 0)
+        """
+        if self.isZero():
+            return ZERO, ONE, ZERO
+
+        return self._x * self._z, self._y, self._z * self._z * self._z
+
+    def double(self) -> Self:
+        """
+        Doubles elliptic curve point in Jacobian coordinate system, using `dbl-2009-l` formula
+        for a = 0, costing 2M + 5S, see https://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian-0.html#doubling-dbl-2009-l
+        """
+        x, y, z = self._x, self._y, self._z
+
+        a = x * x
+        b = y * y
+        c = b * b
+
+        d = x + b
+        d = d * d
+        d = d - a
+        d = d - c
+        d = d + d
+
+        e = a + a
+        e = e + a
+        f = e * e
+
+        x3 = f - (d + d)
+
+        c8 = c + c
+        c8 = c8 + c8
+        c8 = c8 + c8
+
+        y3 = e * (d - x3)
+        y3 = y3 - c8
+
+        z3 = y * z
+        z3 = z3 + z3
+
+        return JacobianPoint(x3, y3, z3)
+
+    def addMixed(self, x2: BaseField, y2: BaseField) -> Self:
+        """
+        Adds an elliptic curve point in Jacobian coordinate system and another one given by its
+        affine coordinates (x2, y2), using `madd-2007-bl` formula, costing 7M + 4S, see
+        https://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian-0.html#addition-madd-2007-bl
+        """
+        if self.isZero():
+            return JacobianPoint(x2, y2, ONE)
+
+        x1, y1, z1 = self._x, self._y, self._z
+
+        z1z1 = z1 * z1
+        u2 = x2 * z1z1
+        s2 = y2 * z1 * z1z1
+
+        h = u2 - x1
+        r = s2 - y1
+
+        if h == ZERO:
+            if r == ZERO:
+                return self.double()
+            return JacobianPoint.zero()
+
+        hh = h * h
+        i = hh + hh
+        i = i + i
+        j = h * i
+
+        r = r + r
+        v = x1 * i
+
+        x3 = r * r
+        x3 = x3 - j
+        x3 = x3 - (v + v)
+
+        y1j = y1 * j
+        y3 = r * (v - x3)
+        y3 = y3 - (y1j + y1j)
+
+        z3 = z1 + h
+        z3 = z3 * z3
+        z3 = z3 - z1z1
+        z3 = z3 - hh
+
+        return JacobianPoint(x3, y3, z3)
@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+
+from typing import List, Union
+from functools import lru_cache
+from . import N, split_scalar
+from .point import Point, WNAF_WIDTH, strauss
+from .fixed_base import generator_odd_multiples, normalize, GENERATOR_WNAF_WIDTH
+
+
+@lru_cache(maxsize=None)
+def generator_endo_odd_multiples(width: int = GENERATOR_WNAF_WIDTH) -> List[Point]:
+    """
+    Odd multiples of λ * G i.e. [λG, 3λG, ..., (2^(w-1) - 1)λG], obtained by applying secp256k1
+    endomorphism on precomputed odd multiples of generator, built once per process
+    """
+    return [p.endomorphism() for p in generator_odd_multiples(width)]
+
+
+class OddMultiples:
+    """
+    Precomputed odd multiples of an elliptic curve point `p` i.e. [p, 3p, ..., (2^(w-1) - 1)p], along
+    with their images under secp256k1 endomorphism ( computed lazily ), as used by interleaved wNAF method.
+    When `normalized` is truthy, all precomputed points are kept with Z = 1, enabling mixed addition.
+    """
+
+    def __init__(self, p: Point, width: int = WNAF_WIDTH, normalized: bool = False):
+        points = p.oddMultiples(width)
+        if normalized:
+            points = normalize(points)
+
+        self.width = width
+        self.points = points
+        self._endo = None
+
+    @property
+    def endo(self) -> List[Point]:
+        """
+        Odd multiples of λp i.e. [λp, 3λp, ..., (2^(w-1) - 1)λp]
+        """
+        if self._endo is None:
+            self._endo = [q.endomorphism() for q in self.points]
+
+        return self._endo
+
+
+def mul_double_scalar(
+    u1: int, u2: int, q: Union[Point, OddMultiples], endomorphism: bool = True
+) -> Point:
+    """
+    Computes u1 * G + u2 * Q in one interleaved pass | G = secp256k1 generator point,
+    while odd multiples of G are drawn from process-wide precomputed table. Odd multiples
+    of Q can also be supplied, when they're precomputed.
+
+    When `endomorphism` is truthy, both scalars are split into ~128 -bit halves using GLV method,
+    so that u1 * G + u2 * Q = u1' * G + u1'' * λG + u2' * Q + u2'' * λQ, halving number of doublings.
+    """
+    u1 %= N
+    u2 %= N
+
+    if isinstance(q, Point):
+        q = OddMultiples(q)
+
+    g_table = generator_odd_multiples()
+
+    if not endomorphism:
+        return strauss(
+            [u1, u2],
+            [g_table, q.points],
+            [GENERATOR_WNAF_WIDTH, q.width],
+        )
+
+    u1_, u1__ = split_scalar(u1)
+    u2_, u2__ = split_scalar(u2)
+
+    return strauss(
+        [u1_, u1__, u2_, u2__],
+        [g_table, generator_endo_odd_multiples(), q.points, q.endo],
+        [GENERATOR_WNAF_WIDTH, GENERATOR_WNAF_WIDTH, q.width, q.width],
+    )
+
+
+def pippenger(scalars: List[int], points: List[Point], width: int) -> Point:
+    """
+    Computes Σ scalars[i] * points[i] using bucket method, where scalars ∈ [0, n) are
+    processed in windows of given width, see section 4 of https://eprint.iacr.org/2012/549.pdf
+    """
+    assert len(scalars) == len(points)
+
+    windows = -(-256 // width)
+    mask = (1 << width) - 1
+
+    res = Point.zero()
+    for j in reversed(range(windows)):
+        if j != windows - 1:
+            for _ in range(width):
+                res = res.double()
+
+        buckets = [None] * mask
+        for k, p in zip(scalars, points):
+            digit = (k >> (j * width)) & mask
+            if digit:
+                b = buckets[digit - 1]
+                buckets[digit - 1] = p if b is None else b + p
+
+        # Σ digit * bucket[digit], computed using running sums
+        running = Point.zero()
+        acc = Point.zero()
+        for b in reversed(buckets):
+            if b is not None:
+                running = running + b
+            acc = acc + running
+
+        res = res + acc
+
+    return res
+
+
+def pippenger_cost(n: int, width: int) -> int:
+    """
+    Approximate number of point additions/ doublings performed by `pippenger`, for n terms
+    """
+    return -(-256 // width) * (n + (1 << (width + 1))) + 256
+
+
+def strauss_cost(n: int, width: int = WNAF_WIDTH) -> int:
+    """
+    Approximate number of point additions/ doublings performed by GLV based `strauss`, for n terms
+    """
+    return n * ((1 << (width - 1)) + 256 // (width + 1)) + 128
+
+
+def mul_multi_scalar(scalars: List[int], points: List[Point]) -> Point:
+    """
+    Computes Σ scalars[i] * points[i], choosing in between GLV based interleaved wNAF method
+    ( cheaper for few terms ) and bucket method ( cheaper for many terms ), depending on
+    estimated cost
+    """
+    assert len(scalars) == len(points)
+
+    scalars = [k % N for k in scalars]
+    n = len(points)
+
+    width = min(range(1, 17), key=lambda c: pippenger_cost(n, c))
+    if pippenger_cost(n, width) < strauss_cost(n):
+        return pippenger(scalars, points, width)
+
+    ks = []
+    tables = []
+    for k, p in zip(scalars, points):
+        k1, k2 = split_scalar(k)
+        t = p.oddMultiples(WNAF_WIDTH)
+
+        ks.extend((k1, k2))
+        tables.extend((t, [q.endomorphism() for q in t]))
+
+    return strauss(ks, tables, [WNAF_WIDTH] * len(ks))
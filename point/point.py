@@ -1,19 +1,62 @@
 #!/usr/bin/python3
 
+from os import environ
+from functools import lru_cache
 from typing_extensions import Self
-from . import BaseField
-from typing import Tuple
+from utils import wnaf
+from . import BaseField, Gx, Gy, N, P, BETA, split_scalar, batch_inv
+from .jacobian import JacobianPoint, ZERO, ONE
+from typing import List, Tuple
+
+# Default window width of wNAF, used for scalar multiplication of arbitrary points
+WNAF_WIDTH: int = 5
+
+# b = 7, is secp256k1 curve parameter
+B = BaseField.from_num(7)
+# = 3 * b
+B3 = BaseField.from_num(3 * 7)
+# Cube root of unity, defining secp256k1 endomorphism, as base field element
+BETA_FP = BaseField.from_num(BETA)
+
+# Maximum number of compressed encodings, whose decompressed points are kept around
+DECOMPRESSION_CACHE_SIZE: int = 1 << 10
+
+# Whether point addition/ doubling formulas leave intermediate sums/ differences, which only feed
+# multiplications, partially reduced, see `set_lazy_reduction`
+_lazy_reduction: bool = environ.get("SECP256K1_LAZY_REDUCTION", "0") == "1"
+
+
+def set_lazy_reduction(enabled: bool):
+    """
+    Enables/ disables lazy reduction mode of point addition/ doubling formulas, where field
+    additions/ subtractions whose results are only multiplied skip carry propagation and
+    conditional correction ( see `BaseField.add_lazy` and `BaseField.sub_lazy` ). Resulting
+    coordinates are fully reduced, irrespective of mode.
+    """
+    global _lazy_reduction
+    _lazy_reduction = enabled
+
+
+def get_lazy_reduction() -> bool:
+    """
+    Whether lazy reduction mode of point addition/ doubling formulas is enabled
+    """
+    return _lazy_reduction
 
 
 class Point:
     """
-    A secp256k1 elliptic curve point, kept in projective coordinate system
+    A secp256k1 elliptic curve point, kept in projective coordinate system, along with its affine
+    coordinates, once they're computed, see `toAffine`
     """
 
+    __slots__ = ("_x", "_y", "_z", "_affine")
+
     def __init__(self, x: BaseField, y: BaseField, z: BaseField):
         self._x = x
         self._y = y
         self._z = z
+        self._affine = None
 
     def __str__(self) -> str:
         """
@@ -29,20 +72,41 @@ class Point:
 
     def __eq__(self, rhs: Self) -> bool:
         """
-        First converts both of elliptic curve points to affine coordinate system & then
-        checks for equality
+        Checks equality of two elliptic curve points in projective coordinate system, without
+        computing inverse of Z, by cross-multiplying i.e. X1 * Z2 = X2 * Z1 and Y1 * Z2 = Y2 * Z1.
+        Also holds for identity element, which has X = Z = 0, but Y != 0. If affine coordinates of
+        both points are already known, they're compared instead, as identity element's (0, 0) is not
+        on curve.
         """
-        x1, y1 = self.toAffine()
-        x2, y2 = rhs.toAffine()
+        if self._affine is not None and rhs._affine is not None:
+            x1, y1 = self._affine
+            x2, y2 = rhs._affine
+            return (x1 == x2) & (y1 == y2)
+
+        x1, y1, z1 = self._x, self._y, self._z
+        x2, y2, z2 = rhs._x, rhs._y, rhs._z
 
-        return (x1 == x2) & (y1 == y2)
+        return (x1 * z2 == x2 * z1) & (y1 * z2 == y2 * z1)
 
     @classmethod
     def zero(cls) -> Self:
         """
         Identity element of group, see https://github.com/dusk-network/bls12_381/blob/2c679a2/src/g1.rs#L587-L593
         """
-        return cls(BaseField.from_num(0), BaseField.from_num(1), BaseField.from_num(0))
+        return cls(ZERO, ONE, ZERO)
+
+    def isZero(self) -> bool:
+        """
+        Checks whether elliptic curve point is identity element of group i.e. Z = 0
+        """
+        return self._z == ZERO
+
+    def isNormalized(self) -> bool:
+        """
+        Checks whether elliptic curve point is kept with Z = 1, so that its X, Y coordinates
+        are same as affine ones
+        """
+        return self._z == ONE
 
     @classmethod
     def fromAffine(cls, x: BaseField, y: BaseField) -> Self:
@@ -50,30 +114,143 @@ class Point:
         Given affine coordinate of secp256k1 elliptic curve point, this routine
         returns equivalent point in projective coordinate system
         """
-        return Point(x, y, BaseField.from_num(1))
+        return Point(x, y, ONE)
+
+    @classmethod
+    def generator(cls) -> Self:
+        """
+        Secp256k1 curve generator point `G`, in projective coordinate system
+        """
+        return cls.fromAffine(BaseField.from_num(Gx), BaseField.from_num(Gy))
+
+    @classmethod
+    def batch_to_affine(cls, points: List[Self]) -> List[Tuple[BaseField, BaseField]]:
+        """
+        Given many secp256k1 elliptic curve points in projective coordinate system, this routine
+        computes their equivalent affine coordinates, while sharing one inversion across all of them.
+
+        Identity element is mapped to (0, 0), same as `toAffine`. Points, whose affine coordinates are
+        already known, are skipped, while others keep computed ones around.
+        """
+        pending = [p for p in points if p._affine is None]
+        inv_zs = batch_inv([p._z for p in pending])
+
+        for p, inv_z in zip(pending, inv_zs):
+            p._affine = (p._x * inv_z, p._y * inv_z)
+
+        return [p._affine for p in points]
+
+    @classmethod
+    def liftX(cls, x: int, odd: bool) -> Self:
+        """
+        Given affine x-coordinate ( as integer ) of a secp256k1 point and parity of its y-coordinate,
+        this routine computes that point in projective coordinate system, by solving y^2 = x^3 + 7.
+
+        Raises ValueError, if x is not a valid x-coordinate of some point on curve.
+        """
+        if not 0 <= x < P:
+            raise ValueError("x-coordinate must be ∈ [0, P)")
+
+        fx = BaseField.from_num(x)
+        fy = (fx * fx * fx + B).sqrt()
+        if fy is None:
+            raise ValueError("x-coordinate doesn't belong to any point on curve")
+
+        if (fy.to_num() & 1) != int(odd):
+            fy = -fy
+
+        return cls.fromAffine(fx, fy)
+
+    def to_bytes(self, compressed: bool = True) -> bytes:
+        """
+        Encodes elliptic curve point as per section 2.3.3 of https://www.secg.org/sec1-v2.pdf i.e.
+        0x02 | 0x03 ( denoting parity of y ) followed by 32 -bytes big-endian affine x-coordinate, when
+        compressed, otherwise 0x04 followed by 32 -bytes big-endian affine x and y -coordinates. Identity
+        element is encoded as single 0x00 byte.
+        """
+        if self.isZero():
+            return b"\x00"
+
+        x, y = self.toAffine()
+        x, y = x.to_num(), y.to_num()
+
+        if compressed:
+            return bytes([2 | (y & 1)]) + x.to_bytes(32, "big")
+
+        return b"\x04" + x.to_bytes(32, "big") + y.to_bytes(32, "big")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """
+        Decodes elliptic curve point from its SEC1 encoding ( see `to_bytes` ), either compressed
+        or uncompressed. Decompressed points are cached, see `decompress`.
+
+        Raises ValueError, if encoding is malformed or it doesn't represent a point on curve.
+        """
+        data = bytes(data)
+
+        if data == b"\x00":
+            return cls.zero()
+
+        if len(data) == 33 and data[0] in (2, 3):
+            return decompress(data)
+
+        if len(data) == 65 and data[0] == 4:
+            x = int.from_bytes(data[1:33], "big")
+            y = int.from_bytes(data[33:], "big")
+
+            if not (x < P and y < P):
+                raise ValueError("coordinates must be ∈ [0, P)")
+
+            fx = BaseField.from_num(x)
+            fy = BaseField.from_num(y)
+            if not fy * fy == fx * fx * fx + B:
+                raise ValueError("point doesn't belong to curve")
+
+            return cls.fromAffine(fx, fy)
+
+        raise ValueError("malformed SEC1 encoding of elliptic curve point")
 
     def toAffine(self) -> Tuple[BaseField, BaseField]:
         """
         Given projective coordinate of secp256k1 elliptic curve point, this routine
-        computes equivalent point in affine coordinate system
+        computes equivalent point in affine coordinate system. It's computed only once,
+        later calls return same coordinates. Identity element is mapped to (0, 0).
+
+        Points kept with Z = 1 ( see `isNormalized` ) need no inversion, which is the case
+        for decoded/ normalized ones.
         """
-        inv_z = self._z.inv()
+        if self._affine is None:
+            if self.isNormalized():
+                self._affine = (self._x, self._y)
+            else:
+                inv_z = self._z.inv()
+                self._affine = (self._x * inv_z, self._y * inv_z)
+
+        return self._affine
 
-        x = self._x * inv_z
-        y = self._y * inv_z
+    def hasAffineX(self, x: int) -> bool:
+        """
+        Checks whether affine x-coordinate of elliptic curve point is `x`, without computing
+        inverse of Z i.e. by testing X = x * Z. Identity element has no affine x-coordinate.
+        """
+        if self.isZero():
+            return False
 
-        return x, y
+        return self._x == BaseField.from_num(x) * self._z
 
     def __add__(self, rhs: Self) -> Self:
         """
         Adds two elliptic curve points in projective coordinate system, using exception-free addition
         formula provided in algorithm 7 of https://eprint.iacr.org/2015/1060.pdf
         """
+        if _lazy_reduction:
+            return self._addLazy(rhs)
+
         x1, y1, z1 = self._x, self._y, self._z
         x2, y2, z2 = rhs._x, rhs._y, rhs._z
 
-        b = 7
-        b3 = BaseField.from_num(3 * b)
+        b3 = B3
 
         t0 = x1 * x2
         t1 = y1 * y2
@@ -121,6 +298,161 @@ class Point:
 
         return Point(x3, y3, z3)
 
+    def addMixed(self, rhs: Self) -> Self:
+        """
+        Adds two elliptic curve points in projective coordinate system, where right hand side operand
+        has Z = 1 ( see `isNormalized` ), using exception-free mixed addition formula provided in
+        algorithm 8 of https://eprint.iacr.org/2015/1060.pdf. Right hand side operand can't be identity.
+        """
+        if _lazy_reduction:
+            return self._addMixedLazy(rhs)
+
+        x1, y1, z1 = self._x, self._y, self._z
+        x2, y2 = rhs._x, rhs._y
+
+        b3 = B3
+
+        t0 = x1 * x2
+        t1 = y1 * y2
+        t3 = x2 + y2
+
+        t4 = x1 + y1
+        t3 = t3 * t4
+        t4 = t0 + t1
+
+        t3 = t3 - t4
+        t4 = y2 * z1
+        t4 = t4 + y1
+
+        y3 = x2 * z1
+        y3 = y3 + x1
+        x3 = t0 + t0
+
+        t0 = x3 + t0
+        t2 = b3 * z1
+        z3 = t1 + t2
+
+        t1 = t1 - t2
+        y3 = b3 * y3
+        x3 = t4 * y3
+
+        t2 = t3 * t1
+        x3 = t2 - x3
+        y3 = y3 * t0
+
+        t1 = t1 * z3
+        y3 = t1 + y3
+        t0 = t0 * t3
+
+        z3 = z3 * t4
+        z3 = z3 + t0
+
+        return Point(x3, y3, z3)
+
+    def _addLazy(self, rhs: Self) -> Self:
+        """
+        Same as `__add__`, but intermediate sums/ differences, which only feed multiplications, are
+        left partially reduced. Trailing comments track how many excess bits each of them carries,
+        which must stay ≤ `LAZY_EXCESS_BITS`.
+        """
+        x1, y1, z1 = self._x, self._y, self._z
+        x2, y2, z2 = rhs._x, rhs._y, rhs._z
+
+        b3 = B3
+
+        t0 = x1 * x2
+        t1 = y1 * y2
+        t2 = z1 * z2
+
+        t3 = x1.add_lazy(y1)  # 1
+        t4 = x2.add_lazy(y2)  # 1
+        t3 = t3 * t4
+
+        t4 = t0.add_lazy(t1)  # 1
+        t3 = t3.sub_lazy(t4, 1)  # 4
+        t4 = y1.add_lazy(z1)  # 1
+
+        x3 = y2.add_lazy(z2)  # 1
+        t4 = t4 * x3
+        x3 = t1.add_lazy(t2)  # 1
+
+        t4 = t4.sub_lazy(x3, 1)  # 4
+        x3 = x1.add_lazy(z1)  # 1
+        y3 = x2.add_lazy(z2)  # 1
+
+        x3 = x3 * y3
+        y3 = t0.add_lazy(t2)  # 1
+        y3 = x3.sub_lazy(y3, 1)  # 4
+
+        x3 = t0.add_lazy(t0)  # 1
+        t0 = x3.add_lazy(t0)  # 2
+        t2 = b3 * t2
+
+        z3 = t1.add_lazy(t2)  # 1
+        t1 = t1.sub_lazy(t2, 0)  # 3
+        y3 = b3 * y3
+
+        x3 = t4 * y3
+        t2 = t3 * t1
+        x3 = t2 - x3
+
+        y3 = y3 * t0
+        t1 = t1 * z3
+        y3 = t1 + y3
+
+        t0 = t0 * t3
+        z3 = z3 * t4
+        z3 = z3 + t0
+
+        return Point(x3, y3, z3)
+
+    def _addMixedLazy(self, rhs: Self) -> Self:
+        """
+        Same as `addMixed`, but intermediate sums/ differences, which only feed multiplications, are
+        left partially reduced, see `_addLazy`
+        """
+        x1, y1, z1 = self._x, self._y, self._z
+        x2, y2 = rhs._x, rhs._y
+
+        b3 = B3
+
+        t0 = x1 * x2
+        t1 = y1 * y2
+        t3 = x2.add_lazy(y2)  # 1
+
+        t4 = x1.add_lazy(y1)  # 1
+        t3 = t3 * t4
+        t4 = t0.add_lazy(t1)  # 1
+
+        t3 = t3.sub_lazy(t4, 1)  # 4
+        t4 = y2 * z1
+        t4 = t4.add_lazy(y1)  # 1
+
+        y3 = x2 * z1
+        y3 = y3.add_lazy(x1)  # 1
+        x3 = t0.add_lazy(t0)  # 1
+
+        t0 = x3.add_lazy(t0)  # 2
+        t2 = b3 * z1
+        z3 = t1.add_lazy(t2)  # 1
+
+        t1 = t1.sub_lazy(t2, 0)  # 3
+        y3 = b3 * y3
+        x3 = t4 * y3
+
+        t2 = t3 * t1
+        x3 = t2 - x3
+        y3 = y3 * t0
+
+        t1 = t1 * z3
+        y3 = t1 + y3
+        t0 = t0 * t3
+
+        z3 = z3 * t4
+        z3 = z3 + t0
+
+        return Point(x3, y3, z3)
+
     def __neg__(self) -> Self:
         """
         Negates elliptic curve point in projective coordinate system by changing sign of Y -coordinate
@@ -140,10 +472,12 @@ class Point:
         Doubles elliptic curve point `p` in projective coordinate system, using exception-free doubling
         formula provided in algorithm 9 of https://eprint.iacr.org/2015/1060.pdf | return value = p + p
         """
+        if _lazy_reduction:
+            return self._doubleLazy()
+
         x, y, z = self._x, self._y, self._z
 
-        b = 7
-        b3 = BaseField.from_num(3 * b)
+        b3 = B3
 
         t0 = y * y
         z3 = t0 + t0
@@ -171,16 +505,177 @@ class Point:
 
         return Point(x3, y3, z3)
 
-    def mulScalar(self, scalar: int) -> Self:
-        res = Point.zero()
-        tmp = self
+    def _doubleLazy(self) -> Self:
+        """
+        Same as `double`, but intermediate sums/ differences, which only feed multiplications, are
+        left partially reduced, see `_addLazy`
+        """
+        x, y, z = self._x, self._y, self._z
+
+        b3 = B3
 
-        idx = 0
-        while idx < 256:
-            if (scalar >> idx) & 1:
-                res += tmp
+        t0 = y * y
+        z3 = t0.add_lazy(t0)  # 1
+        z3 = z3.add_lazy(z3)  # 2
 
-            tmp = tmp.double()
-            idx += 1
+        z3 = z3.add_lazy(z3)  # 3
+        t1 = y * z
+        t2 = z * z
+
+        t2 = b3 * t2
+        x3 = t2 * z3
+        y3 = t0.add_lazy(t2)  # 1
+
+        z3 = t1 * z3
+        t1 = t2.add_lazy(t2)  # 1
+        t2 = t1.add_lazy(t2)  # 2
+
+        t0 = t0.sub_lazy(t2, 2)  # 5
+        y3 = t0 * y3
+        y3 = x3 + y3
+
+        t1 = x * y
+        x3 = t0 * t1
+        x3 = x3 + x3
+
+        return Point(x3, y3, z3)
+
+    def oddMultiples(self, width: int) -> List[Self]:
+        """
+        Computes odd multiples of elliptic curve point `p`, as required by width-w NAF based
+        scalar multiplication | return value = [p, 3p, 5p, ..., (2^(w-1) - 1)p]
+        """
+        assert width >= 2, "window width must be >= 2"
+
+        dbl = self.double()
+        res = [self]
+        for _ in range((1 << (width - 2)) - 1):
+            res.append(res[-1] + dbl)
 
         return res
+
+    def mulScalar(self, scalar: int, width: int = WNAF_WIDTH) -> Self:
+        """
+        Multiplies elliptic curve point `p` with a scalar, returning scalar * p.
+
+        For width >= 2, scalar is recoded in width-w NAF and odd multiples of `p` are precomputed,
+        see algorithm 3.36 of https://link.springer.com/book/10.1007/b97644, while width = 1 selects
+        plain double-and-add. Either way, iteration count is bounded by bit length of the scalar.
+        """
+        assert width >= 1, "window width must be >= 1"
+        scalar %= N
+
+        if width == 1:
+            res = Point.zero()
+            tmp = self
+
+            for idx in range(scalar.bit_length()):
+                if (scalar >> idx) & 1:
+                    res += tmp
+
+                tmp = tmp.double()
+
+            return res
+
+        return strauss([scalar], [self.oddMultiples(width)], [width])
+
+    def endomorphism(self) -> Self:
+        """
+        Applies secp256k1 endomorphism on elliptic curve point `p`, in projective coordinate
+        system | (X, Y, Z) -> (β * X, Y, Z), which is same as λ * p
+        """
+        return Point(self._x * BETA_FP, self._y, self._z)
+
+    def mulScalarGLV(self, scalar: int, width: int = WNAF_WIDTH) -> Self:
+        """
+        Multiplies elliptic curve point `p` with a scalar, returning scalar * p, while splitting
+        scalar into two ~128 -bit halves s.t. scalar * p = k1 * p + k2 * λp, which are then processed
+        in an interleaved manner, halving number of point doublings. See section 3.5 of
+        https://link.springer.com/book/10.1007/b97644
+        """
+        assert width >= 2, "window width must be >= 2"
+        k1, k2 = split_scalar(scalar % N)
+
+        t1 = self.oddMultiples(width)
+        t2 = [p.endomorphism() for p in t1]
+
+        return strauss([k1, k2], [t1, t2], [width, width])
+
+
+def strauss(scalars: List[int], tables: List[List[Point]], widths: List[int]) -> Point:
+    """
+    Computes Σ scalars[i] * points[i] in a single interleaved pass, sharing doublings in between
+    all terms, where tables[i] holds odd multiples of points[i] for window width widths[i]. Scalars
+    can be negative.
+
+    Each scalar is recoded in width-w NAF, see algorithm 3.51 of https://link.springer.com/book/10.1007/b97644
+
+    Tables normalized s.t. Z = 1 are added using mixed addition. When all of them are normalized,
+    accumulator is kept in Jacobian coordinate system, for cheaper doubling and mixed addition.
+    """
+    assert len(scalars) == len(tables) == len(widths)
+
+    digits = []
+    for k, w in zip(scalars, widths):
+        sign = -1 if k < 0 else 1
+        digits.append([sign * d for d in wnaf(abs(k), w)])
+
+    length = max((len(d) for d in digits), default=0)
+    normalized = [all(p.isNormalized() for p in t) for t in tables]
+
+    if all(normalized):
+        res = JacobianPoint.zero()
+        for i in reversed(range(length)):
+            res = res.double()
+
+            for d, t in zip(digits, tables):
+                if i >= len(d) or not d[i]:
+                    continue
+
+                p = t[abs(d[i]) >> 1]
+                res = res.addMixed(p._x, p._y if d[i] > 0 else -p._y)
+
+        return Point(*res.toProjective())
+
+    res = Point.zero()
+    started = False
+
+    for i in reversed(range(length)):
+        if started:
+            res = res.double()
+
+        for d, t, affine in zip(digits, tables, normalized):
+            if i >= len(d) or not d[i]:
+                continue
+
+            p = t[abs(d[i]) >> 1]
+            if d[i] < 0:
+                p = -p
+
+            res = res.addMixed(p) if affine else res + p
+            started = True
+
+    return res
+
+
+def sum_normalized(points: List[Point]) -> Point:
+    """
+    Adds many elliptic curve points, each of them having Z = 1 ( see `isNormalized` ), while
+    accumulating in Jacobian coordinate system, using mixed addition
+    """
+    res = JacobianPoint.zero()
+    for p in points:
+        res = res.addMixed(p._x, p._y)
+
+    return Point(*res.toProjective())
+
+
+@lru_cache(maxsize=DECOMPRESSION_CACHE_SIZE)
+def decompress(data: bytes) -> Point:
+    """
+    Decompresses a 33 -bytes SEC1 compressed encoding of elliptic curve point, which costs a square
+    root computation i.e. a full exponentiation. Least recently used decompressed points are kept
+    around ( up to `DECOMPRESSION_CACHE_SIZE` of them ), so that hot keys are decompressed only once.
+    Callers must not mutate returned point.
+    """
+    return Point.liftX(int.from_bytes(data[1:], "big"), data[0] & 1)
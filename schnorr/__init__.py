@@ -0,0 +1,7 @@
+#!/usr/bin/python3
+
+from .hashing import tagged_hash
+from .keygen import keygen, generate_public_key, lift_public_key
+from .sign import sign
+from .verify import verify
+from .batch import verify_batch
@@ -0,0 +1,70 @@
+#!/usr/bin/python3
+
+from typing import Dict, List, Tuple
+from field import N, ScalarField
+from point import Point, mul_generator, mul_multi_scalar, random_coefficient, bisect
+from .verify import parse
+
+
+def check_batch(items: List[Tuple[bytes, Point, int, int, Point]]) -> bool:
+    """
+    Given (public key, P, e, s, R) tuples, this routine checks whether s * G = R + e * P holds for
+    all of them at once, by testing (Σ z * s) * G - Σ z * R - Σ z * e * P = 0 for random coefficients
+    z, using one multi-scalar multiplication. Terms sharing same public key are merged into one.
+
+    See https://github.com/bitcoin/bips/blob/master/bip-0340.mediawiki#batch-verification
+    """
+    g = 0
+    scalars = []
+    points = []
+    keys: Dict[bytes, list] = {}
+
+    for idx, (pkey, q, e, s, R) in enumerate(items):
+        z = random_coefficient(idx)
+        fz = ScalarField.from_num(z)
+
+        g += fz.mul_num(s)
+        scalars.append(N - z)
+        points.append(R)
+
+        key = keys.setdefault(pkey, [q, 0])
+        key[1] += fz.mul_num(e)
+
+    for q, c in keys.values():
+        scalars.append(-c % N)
+        points.append(q)
+
+    res = mul_generator(g % N) + mul_multi_scalar(scalars, points)
+    return res.isZero()
+
+
+def verify_batch(items: List[Tuple[bytes, bytes, bytes]]) -> List[bool]:
+    """
+    Given a batch of (x-only public key, message, signature) tuples, this routine verifies all of them
+    using randomized linear combination, which costs one multi-scalar multiplication ( plus lifting
+    each R to a point ), falling back to bisection for locating invalid ones.
+
+    Returns per entry boolean values denoting success, in same order as input.
+    """
+    res = [False] * len(items)
+    pending = []
+    positions = []
+
+    for idx, (pkey, msg, sig) in enumerate(items):
+        parsed = parse(pkey, msg, sig)
+        if parsed is None:
+            continue
+
+        q, e, r, s = parsed
+        try:
+            R = Point.liftX(r, False)
+        except ValueError:
+            continue
+
+        pending.append((pkey, q, e, s, R))
+        positions.append(idx)
+
+    for idx, ok in zip(positions, bisect(pending, check_batch)):
+        res[idx] = ok
+
+    return res
@@ -0,0 +1,32 @@
+#!/usr/bin/python3
+
+from hashlib import sha256
+from functools import lru_cache
+from field import N
+
+
+@lru_cache(maxsize=None)
+def tag_prefix(tag: str) -> bytes:
+    """
+    SHA256(tag) || SHA256(tag), prepended to every message hashed under given tag, computed once
+    per tag
+    """
+    h = sha256(tag.encode()).digest()
+    return h + h
+
+
+def tagged_hash(tag: str, msg: bytes) -> bytes:
+    """
+    Hashes message under given tag i.e. SHA256(SHA256(tag) || SHA256(tag) || msg), so that hashes
+    computed for different purposes never collide, see https://github.com/bitcoin/bips/blob/master/bip-0340.mediawiki#design
+    """
+    return sha256(tag_prefix(tag) + msg).digest()
+
+
+def hash_challenge(r: bytes, pkey: bytes, msg: bytes) -> int:
+    """
+    Computes challenge e = int(hash_BIP0340/challenge(bytes(R) || bytes(P) || m)) mod n, for
+    x-coordinate of ephemeral point R, x-only public key P and message m
+    """
+    e = tagged_hash("BIP0340/challenge", r + pkey + msg)
+    return int.from_bytes(e, "big") % N
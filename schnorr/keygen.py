@@ -0,0 +1,51 @@
+#!/usr/bin/python3
+
+from typing import Tuple
+from field import N
+from point import Point, mul_generator
+from secrets import randbelow
+
+
+def generate_secret_key() -> int:
+    """
+    Generate a random Schnorr secret key, which is ∈ [1, N)
+    """
+    return 1 + randbelow(N - 1)
+
+
+def generate_public_key(skey: int) -> bytes:
+    """
+    Given a Schnorr secret key, this routine generates corresponding x-only public key i.e. 32 -bytes
+    big-endian x-coordinate of pkey = skey * G | G = secp256k1 generator point. Implicitly, it stands
+    for the point with that x-coordinate and even y-coordinate, see `lift_public_key`.
+    """
+    if not 0 < skey < N:
+        raise ValueError("secret key must be ∈ [1, N)")
+
+    x, _ = mul_generator(skey).toAffine()
+    return x.to_num().to_bytes(32, "big")
+
+
+def lift_public_key(pkey: bytes) -> Point:
+    """
+    Given an x-only public key, this routine returns the point having that x-coordinate and even
+    y-coordinate. Decompressed points are cached, so hot keys are lifted only once.
+
+    Raises ValueError, if public key is not 32 -bytes or it's not x-coordinate of some point on curve.
+    """
+    if len(pkey) != 32:
+        raise ValueError("x-only public key must be 32 -bytes")
+
+    return Point.from_bytes(b"\x02" + pkey)
+
+
+def keygen() -> Tuple[int, bytes]:
+    """
+    Generate a random Schnorr secret key, x-only public key pair ( in order )
+
+    Follows scheme described https://github.com/bitcoin/bips/blob/master/bip-0340.mediawiki#public-key-generation
+    """
+    skey = generate_secret_key()
+    pkey = generate_public_key(skey)
+
+    return skey, pkey
@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+
+from typing import Optional
+from secrets import token_bytes
+from field import N, ScalarField
+from point import mul_generator
+from .hashing import tagged_hash, hash_challenge
+
+
+def sign(skey: int, msg: bytes, aux_rand: Optional[bytes] = None) -> bytes:
+    """
+    Given Schnorr secret key ( a 256 -bit integer ∈ [1, N) ) and a message `m`, this routine computes
+    a 64 -bytes BIP340 signature i.e. bytes(R) || bytes(s). Nonce is derived from secret key, message
+    and 32 -bytes auxiliary randomness, which is drawn fresh, unless it's given.
+
+    Follows scheme described https://github.com/bitcoin/bips/blob/master/bip-0340.mediawiki#default-signing
+    """
+    if not 0 < skey < N:
+        raise ValueError("secret key must be ∈ [1, N)")
+
+    if aux_rand is None:
+        aux_rand = token_bytes(32)
+
+    # public key is x-only, so secret key is negated, when public key has odd y-coordinate
+    x, y = mul_generator(skey).toAffine()
+    d = skey if y.to_num() & 1 == 0 else N - skey
+    pkey = x.to_num().to_bytes(32, "big")
+
+    t = d ^ int.from_bytes(tagged_hash("BIP0340/aux", aux_rand), "big")
+    k = tagged_hash("BIP0340/nonce", t.to_bytes(32, "big") + pkey + msg)
+    k = int.from_bytes(k, "big") % N
+    if k == 0:
+        raise ValueError(
+            "derived nonce is zero, retry with different auxiliary randomness"
+        )
+
+    # so is ephemeral point, so nonce is negated, when it has odd y-coordinate
+    x, y = mul_generator(k).toAffine()
+    k = k if y.to_num() & 1 == 0 else N - k
+    r = x.to_num().to_bytes(32, "big")
+
+    e = hash_challenge(r, pkey, msg)
+    s = (k + ScalarField.from_num(d).mul_num(e)) % N
+
+    return r + s.to_bytes(32, "big")
@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+
+from typing import Optional, Tuple
+from field import N, P
+from point import Point, mul_double_scalar
+from .hashing import hash_challenge
+from .keygen import lift_public_key
+
+
+def parse(pkey: bytes, msg: bytes, sig: bytes) -> Optional[Tuple[Point, int, int, int]]:
+    """
+    Given x-only public key, message and signature, this routine lifts public key and decodes
+    signature, returning (P, e, r, s), where e is challenge. Returns None, if public key or
+    signature is malformed.
+    """
+    if len(sig) != 64:
+        return None
+
+    try:
+        q = lift_public_key(pkey)
+    except ValueError:
+        return None
+
+    r = int.from_bytes(sig[:32], "big")
+    s = int.from_bytes(sig[32:], "big")
+    if not (r < P and s < N):
+        return None
+
+    return q, hash_challenge(sig[:32], pkey, msg), r, s
+
+
+def verify(pkey: bytes, msg: bytes, sig: bytes) -> bool:
+    """
+    Given x-only public key, message `m` and 64 -bytes signature, this routine attempts to verify
+    signature, by computing R = s * G - e * P in one interleaved pass and checking that it's not
+    identity, that its y-coordinate is even and that its x-coordinate is r.
+
+    Returns boolean value denoting success.
+
+    Follows scheme described https://github.com/bitcoin/bips/blob/master/bip-0340.mediawiki#verification
+    """
+    parsed = parse(pkey, msg, sig)
+    if parsed is None:
+        return False
+
+    q, e, r, s = parsed
+
+    R = mul_double_scalar(s, N - e, q)
+    if R.isZero():
+        return False
+
+    x, y = R.toAffine()
+    return y.to_num() & 1 == 0 and x.to_num() == r
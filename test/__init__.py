@@ -1,5 +1,21 @@
 #!/usr/bin/python3
 
-from field import BaseField, P, Gx, Gy, ScalarField, N
-from point import Point
+from field import BaseField, P, Gx, Gy, ScalarField, N, LAMBDA, split_scalar, batch_inv
+from field.inversion import build_chain, chain_pow
+from field.base_field import BaseField as MontgomeryBaseField
+from field.base_field_native import BaseField as NativeBaseField
+from field.scalar_field import ScalarField as MontgomeryScalarField
+from field.scalar_field_native import ScalarField as NativeScalarField
+from point import Point, FixedBaseTable, generator_table, mul_generator
+from point import mul_double_scalar, mul_multi_scalar, pippenger
+from point import JacobianPoint, strauss, sum_normalized
+from point import set_lazy_reduction, get_lazy_reduction
+from point import set_generator_table_budget, get_generator_table_budget
+from point.fixed_base import normalize
+from point.point import decompress
+from utils import wnaf
 import ecdsa
+import schnorr
+from ecdsa.hashing import hash_message
+from instrumentation import instrument
+from field import codegen
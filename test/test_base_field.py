@@ -1,13 +1,19 @@
 #!/usr/bin/python3
 
-from . import BaseField, P
+import pytest
+from . import MontgomeryBaseField, NativeBaseField, P, batch_inv
+from . import build_chain, chain_pow
 from random import randint
 
 # execute test cases for these many rounds
 TEST_CNT: int = 1 << 10
 
+# base field arithmetic backends, each of them must behave same way
+BACKENDS = {"montgomery": MontgomeryBaseField, "native": NativeBaseField}
 
-def test_montgomery_repr():
+
+@pytest.mark.parametrize("BaseField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_montgomery_repr(BaseField):
     """
     Test with random secp256k1 base field elements whether convertion in between
     numeric, radix-r and Montgomery form is behaving as expected
@@ -21,7 +27,8 @@ def test_montgomery_repr():
         assert num == num_, f"expeted {num}, found {num_}"
 
 
-def test_base_field_multiplication():
+@pytest.mark.parametrize("BaseField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_base_field_multiplication(BaseField):
     """
     Test if modular multiplication of two randomly generated secp256k1 base
     field elements, using Montgomery algorithm, is behaving as expected
@@ -39,7 +46,8 @@ def test_base_field_multiplication():
         assert c == c_, f"expected {c}, found {c_}"
 
 
-def test_base_field_addition():
+@pytest.mark.parametrize("BaseField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_base_field_addition(BaseField):
     """
     Test if modular addition of two randomly generated secp256k1 base field
     elements, using Montgomery algorithm, is behaving as expected
@@ -57,7 +65,8 @@ def test_base_field_addition():
         assert c == c_, f"expected {c}, found {c_}"
 
 
-def test_base_field_subtraction():
+@pytest.mark.parametrize("BaseField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_base_field_subtraction(BaseField):
     """
     Test if modular subtraction of two randomly generated secp256k1 base
     field elements, using Montgomery algorithm, is behaving as expected
@@ -75,7 +84,40 @@ def test_base_field_subtraction():
         assert c == c_, f"expected {c}, found {c_}"
 
 
-def test_base_field_inversion():
+@pytest.mark.parametrize("BaseField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_base_field_lazy_arithmetic(BaseField):
+    """
+    Test if partially reduced results of chained lazy additions/ subtractions of secp256k1 base field
+    elements, carrying as many excess bits as point formulas let them, are correctly reduced by
+    multiplication
+    """
+    cases = [(P - 1, P - 1, P - 1)]
+    cases += [
+        (randint(0, P - 1), randint(0, P - 1), randint(0, P - 1))
+        for _ in range(TEST_CNT)
+    ]
+
+    for a, b, c in cases:
+        fp_a = BaseField.from_num(a)
+        fp_b = BaseField.from_num(b)
+        fp_c = BaseField.from_num(c)
+
+        s = fp_a.add_lazy(fp_b)  # 1
+        s = s.add_lazy(s)  # 2
+        d = fp_c.sub_lazy(s, 2)  # 5
+        e = fp_c.sub_lazy(fp_a, 0).sub_lazy(fp_b, 0)  # 4
+
+        f = ((c - 2 * (a + b)) * (c - a - b)) % P
+        f_ = (d * e).to_num()
+        assert f == f_, f"expected {f}, found {f_}"
+
+        g = ((c - 2 * (a + b)) * a) % P
+        g_ = (d * fp_a).to_num()
+        assert g == g_, f"expected {g}, found {g_}"
+
+
+@pytest.mark.parametrize("BaseField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_base_field_inversion(BaseField):
     """
     Test if modular multiplicative inversion of one randomly generated secp256k1
     base field element, in Montgomery representation, is behaving as expected
@@ -89,3 +131,90 @@ def test_base_field_inversion():
         b = fp_b.to_num()
 
         assert b == 1, f"expected 1, found {b}"
+
+
+@pytest.mark.parametrize("BaseField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_base_field_vartime_inversion(BaseField):
+    """
+    Test if variable-time modular multiplicative inversion of randomly generated secp256k1
+    base field element agrees with constant-time inversion
+    """
+    for _ in range(1 << 4):
+        a = randint(1, P - 1)
+
+        fp_a = BaseField.from_num(a)
+        fp_b = fp_a.inv_vartime()
+        fp_c = fp_a.inv()
+
+        assert fp_b == fp_c, f"expected {fp_c}, found {fp_b}"
+        assert (fp_a * fp_b).to_num() == 1
+
+    assert BaseField.from_num(0).inv_vartime().to_num() == 0
+
+
+@pytest.mark.parametrize("BaseField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_base_field_square_root(BaseField):
+    """
+    Test if square root of randomly generated secp256k1 base field element is computed, when
+    it's a quadratic residue, while non-residues are rejected
+    """
+    for _ in range(1 << 4):
+        a = randint(0, P - 1)
+
+        fp_a = BaseField.from_num(a)
+        fp_b = (fp_a * fp_a).sqrt()
+
+        assert fp_b == fp_a or fp_b == -fp_a, f"expected ±{fp_a}, found {fp_b}"
+
+    # P = 3 mod 4, so -1 is a quadratic non-residue
+    assert BaseField.from_num(P - 1).sqrt() is None
+    assert BaseField.from_num(0).sqrt() == BaseField.from_num(0)
+
+
+def test_addition_chain():
+    """
+    Test if exponentiation using addition chains, built for random exponents, is behaving as expected
+    """
+    for _ in range(TEST_CNT >> 2):
+        a = randint(0, P - 1)
+        e = randint(1, 1 << 256)
+
+        b = chain_pow(NativeBaseField.from_num(a), build_chain(e)).to_num()
+        c = pow(a, e, P)
+
+        assert b == c, f"expected {c}, found {b}"
+
+
+@pytest.mark.parametrize("BaseField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_base_field_batch_inversion(BaseField):
+    """
+    Test if simultaneous inversion of many secp256k1 base field elements agrees with
+    inverting them one by one, while mapping zero elements to zero
+    """
+    nums = [randint(1, P - 1) for _ in range(1 << 4)] + [0]
+    nums.insert(1, 0)
+
+    elems = [BaseField.from_num(num) for num in nums]
+    for num, elem in zip(nums, batch_inv(elems)):
+        expected = 0 if num == 0 else pow(num, -1, P)
+        assert elem.to_num() == expected, f"expected {expected}, found {elem.to_num()}"
+
+
+@pytest.mark.parametrize("BaseField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_base_field_element_layout(BaseField):
+    """
+    Test that secp256k1 base field elements are slotted and immutable, keeping their value in a
+    compact store ( i.e. a tuple of limbs or a single integer ), instead of a per-instance dictionary
+    """
+    a = BaseField.from_num(randint(0, P - 1))
+    b = a * a + a
+
+    for elem in (a, b, -a, a - b):
+        assert not hasattr(elem, "__dict__"), "field element must not have __dict__"
+        assert all(
+            isinstance(getattr(elem, slot), (int, tuple))
+            for slot in BaseField.__slots__
+        ), "field element must be backed by a tuple or an integer"
+
+    with pytest.raises(AttributeError):
+        a.value = 0
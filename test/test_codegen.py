@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+
+from . import codegen, P, N
+from os import path
+from random import randint
+import pytest
+
+# execute test cases for these many rounds
+TEST_CNT: int = 1 << 8
+
+# primes of various sizes, for which field arithmetic modules are generated at run time
+PRIMES = {
+    "p127": (1 << 127) - 1,
+    "p255": (1 << 255) - 19,
+    "p256": 0xFFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF,
+    "secp256k1-p": P,
+    "secp256k1-n": N,
+    "p521": (1 << 521) - 1,
+}
+
+
+def test_builtin_modules_up_to_date():
+    """
+    Test that field arithmetic modules checked into `field` package are same as what generator emits
+    """
+    for name in codegen.MODULES:
+        target = path.join(path.dirname(codegen.__file__), f"{name}.py")
+        with open(target) as fd:
+            assert fd.read() == codegen.generate_builtin(name), f"{name} is stale"
+
+
+@pytest.mark.parametrize("prime", PRIMES.values(), ids=PRIMES.keys())
+def test_generated_arithmetic(prime, tmp_path, monkeypatch):
+    """
+    Test that Montgomery form arithmetic of a module generated at run time ( and cached on disk )
+    agrees with integer arithmetic modulo same prime
+    """
+    monkeypatch.setattr(codegen, "CACHE_DIR", str(tmp_path))
+    fq = codegen.load.__wrapped__(prime)
+
+    assert len(list(tmp_path.glob("*.py"))) == 1, "generated module must be cached"
+
+    def into(num: int):
+        return fq.to_montgomery(fq.to_radix_r(num))
+
+    def out(limbs) -> int:
+        return fq.from_radix_r(fq.from_montgomery(limbs)) % prime
+
+    for _ in range(TEST_CNT):
+        a = randint(0, prime - 1)
+        b = randint(0, prime - 1)
+
+        assert out(into(a)) == a
+        assert out(fq.montgomery_mul(into(a), into(b))) == (a * b) % prime
+        assert out(fq.add(into(a), into(b))) == (a + b) % prime
+        assert out(fq.sub(into(a), into(b))) == (a - b) % prime
+        assert out(fq.neg(into(a))) == (-a) % prime
+
+
+@pytest.mark.parametrize("prime", PRIMES.values(), ids=PRIMES.keys())
+def test_generated_lazy_arithmetic(prime, tmp_path, monkeypatch):
+    """
+    Test that Montgomery multiplication of a module generated at run time accepts operands carrying
+    excess bits, up to worst case magnitude, and that lazy addition/ subtraction keep their limbs
+    within stated bounds
+    """
+    monkeypatch.setattr(codegen, "CACHE_DIR", str(tmp_path))
+    fq = codegen.load.__wrapped__(prime)
+    n = fq.LIMB_COUNT
+    r_inv = pow(1 << (32 * n), -1, prime)
+
+    def num(limbs) -> int:
+        return fq.from_radix_r(limbs) % prime
+
+    def excess(limbs) -> int:
+        assert all(limb >= 0 for limb in limbs)
+        return max(max(limb.bit_length() for limb in limbs) - 32, 0)
+
+    def rand(bits: int):
+        return tuple(randint(0, (1 << (32 + bits)) - 1) for _ in range(n))
+
+    def check_mul(a, b):
+        c = fq.montgomery_mul(a, b)
+        assert excess(c) == 0
+        assert num(c) == (num(a) * num(b) * r_inv) % prime
+
+    top = (1 << (32 + fq.LAZY_EXCESS_BITS)) - 1
+    check_mul((top,) * n, (top,) * n)
+
+    for _ in range(TEST_CNT):
+        ea = randint(0, fq.LAZY_EXCESS_BITS - 3)
+        eb = randint(0, fq.LAZY_EXCESS_BITS - 3)
+        a, b = rand(ea), rand(eb)
+
+        c = fq.add_lazy(a, b)
+        assert excess(c) <= max(ea, eb) + 1
+        assert num(c) == (num(a) + num(b)) % prime
+
+        d = fq.sub_lazy(a, b, eb)
+        assert excess(d) <= max(ea, eb + 2) + 1
+        assert num(d) == (num(a) - num(b)) % prime
+
+        check_mul(rand(fq.LAZY_EXCESS_BITS), rand(fq.LAZY_EXCESS_BITS))
+        check_mul(c, d)
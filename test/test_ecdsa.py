@@ -1,6 +1,15 @@
 #!/usr/bin/python3
 
+import os
+import asyncio
+from ast import literal_eval
+import pytest
+from typing import Tuple
 import ecdsa
+from . import Point, N, P, ScalarField, mul_double_scalar, mul_generator, hash_message
+from ecdsa.verify import has_affine_x_mod_n
+from instrumentation import instrument
+from threading import Thread
 
 
 def test_ecdsa():
@@ -14,3 +23,401 @@ def test_ecdsa():
     verified = ecdsa.verify(pkey, msg, (r, s))
 
     assert verified, "ECDSA signature verification failed"
+
+
+def test_ecdsa_verify_comparison():
+    """
+    Test if ECDSA verification compares r against affine x-coordinate ( reduced modulo N ) without
+    inverting Z, including the case where x-coordinate is r + N, while rejecting r, s ∉ (0, N)
+    """
+    # first point, whose x-coordinate is ∈ [N, P)
+    x = N
+    while True:
+        try:
+            R = Point.liftX(x, False)
+            break
+        except ValueError:
+            x += 1
+
+    R = R + R - R
+    assert not R.isNormalized()
+    assert has_affine_x_mod_n(R, x - N)
+    assert not has_affine_x_mod_n(R, x - N + 1)
+    assert not has_affine_x_mod_n(Point.zero(), P - N)
+
+    msg = b"this is a message !"
+    skey, pkey = ecdsa.keygen()
+    (r, s) = ecdsa.sign(skey, msg)
+
+    assert ecdsa.verify(pkey, msg, (r, s))
+    for sig in ((0, 0), (0, s), (r, 0), (r + N, s), (r, s + N)):
+        assert not ecdsa.verify(pkey, msg, sig), f"{sig} must be rejected"
+    assert ecdsa.verify_many([(pkey, msg, (0, 0)), (pkey, msg, (r, s))]) == [
+        False,
+        True,
+    ]
+
+
+def test_ecdsa_verify_decoded_key_inversions():
+    """
+    Test if verifying against a freshly decoded ( affine, Z = 1 ) public key, whose prepared form
+    is already cached, performs no base field inversion, either one by one or streaming records
+    """
+    from ecdsa.stream import encode_record, verify_records
+
+    msg = b"this is a message !"
+    skey, pkey = ecdsa.keygen()
+    sig = ecdsa.sign(skey, msg)
+    assert ecdsa.verify(pkey, msg, sig)
+
+    records = b"".join(encode_record(pkey, hash_message(msg), sig) for _ in range(8))
+
+    with instrument() as prof:
+        for enc in (pkey.to_bytes(), pkey.to_bytes(False)):
+            assert ecdsa.verify(Point.from_bytes(enc), msg, sig)
+        assert verify_records(records) == []
+
+    assert prof.counts["Fp.inv"] == 0, "decoded public key must not be inverted"
+
+
+def ephemeral_point(pkey: Point, msg: bytes, sig: Tuple[int, int]) -> Point:
+    """
+    Recomputes ephemeral point R = h * s^-1 * G + r * s^-1 * Q of a valid ECDSA signature
+    """
+    (r, s) = sig
+    s1 = ScalarField.from_num(s).inv()
+
+    u1 = (ScalarField.from_num(hash_message(msg)) * s1).to_num()
+    u2 = (ScalarField.from_num(r) * s1).to_num()
+
+    return mul_double_scalar(u1, u2, pkey)
+
+
+def test_ecdsa_batch_verification():
+    """
+    Test if ECDSA batch verification accepts valid signatures, carrying either ephemeral
+    point or its recovery id, and locates invalid ones.
+    """
+    items = []
+    for i in range(4):
+        msg = f"message {i}".encode()
+        skey, pkey = ecdsa.keygen()
+        (r, s) = ecdsa.sign(skey, msg)
+
+        R = ephemeral_point(pkey, msg, (r, s))
+        if i & 1:
+            x, y = R.toAffine()
+            R = ((x.to_num() >= N) << 1) | (y.to_num() & 1)
+
+        items.append((pkey, msg, (r, s, R)))
+
+    assert ecdsa.verify_batch(items) == [True] * 4, "ECDSA batch verification failed"
+
+    pkey, msg, (r, s, R) = items[2]
+    items[2] = (pkey, msg + b"!", (r, s, R))
+    pkey, msg, (r, s, R) = items[3]
+    items[3] = (pkey, msg, (r, N - s, R))
+
+    res = ecdsa.verify_batch(items)
+    assert res == [
+        True,
+        True,
+        False,
+        False,
+    ], f"expected invalid entries to be located, found {res}"
+    assert ecdsa.verify_batch([]) == []
+
+
+def test_prepared_public_key_cache():
+    """
+    Test if prepared public keys are cached in least recently used manner, with usage statistics
+    being tracked, and if verification works with both prepared and bare public keys.
+    """
+    cache = ecdsa.PublicKeyCache(2)
+    keys = [mul_generator(k) for k in (2, 3, 5)]
+
+    a = cache.get(keys[0])
+    assert cache.get(keys[0]) is a
+    assert (
+        cache.get(Point.fromAffine(*keys[0].toAffine())) is a
+    ), "cache must be keyed by encoding"
+
+    cache.get(keys[1])
+    cache.get(keys[0])
+    cache.get(keys[2])
+
+    assert cache.stats() == (3, 3, 1, 2, 2), f"unexpected statistics {cache.stats()}"
+    assert cache.get(keys[0]) is a, "recently used entry must not be evicted"
+    assert cache.get(keys[1]) is not None and cache.stats().misses == 4
+
+    cache.resize(1)
+    assert len(cache) == 1
+    cache.clear()
+    assert cache.stats() == (0, 0, 0, 0, 1)
+
+    # concurrent lookups of same keys must not corrupt cache
+    cache = ecdsa.PublicKeyCache(4)
+    threads = [Thread(target=lambda: [cache.get(k) for k in keys]) for _ in range(4)]
+    [t.start() for t in threads]
+    [t.join() for t in threads]
+
+    stats = cache.stats()
+    assert stats.hits + stats.misses == 12 and stats.size == 3
+
+    msg = b"this is a message !"
+    skey, pkey = ecdsa.keygen()
+    sig = ecdsa.sign(skey, msg)
+
+    assert ecdsa.verify(ecdsa.PreparedPublicKey(pkey), msg, sig)
+    assert ecdsa.verify(pkey, msg, sig)
+    assert not ecdsa.verify(pkey, msg + b"!", sig)
+
+    # zero-sized cache must not prepare public keys, as they're never reused
+    cache = ecdsa.PublicKeyCache(0)
+    assert cache.get(pkey) is pkey
+    assert cache.stats() == (0, 1, 0, 0, 0)
+
+    ecdsa.PUBLIC_KEY_CACHE.resize(0)
+    try:
+        with instrument() as prof:
+            assert ecdsa.verify(pkey, msg, sig)
+            assert ecdsa.verify_many([(pkey, msg, sig), (pkey, msg + b"!", sig)]) == [
+                True,
+                False,
+            ]
+        assert prof.counts["Fp.inv"] == 0, "public key must not be normalized"
+        assert len(ecdsa.PUBLIC_KEY_CACHE) == 0
+    finally:
+        ecdsa.PUBLIC_KEY_CACHE.resize(ecdsa.prepared.DEFAULT_CACHE_SIZE)
+
+
+def test_parallel_executor():
+    """
+    Test if ECDSA sign/ verify operations sharded across worker processes, produce results
+    in input order.
+    """
+    keys = [ecdsa.keygen() for _ in range(2)]
+    msgs = [i.to_bytes(4, "big") for i in range(5)]
+
+    with ecdsa.ParallelExecutor(workers=2, chunk_size=2) as executor:
+        sigs = executor.sign([(keys[i & 1][0], msg) for i, msg in enumerate(msgs)])
+
+        items = [
+            (keys[i & 1][1], msg, sig) for i, (msg, sig) in enumerate(zip(msgs, sigs))
+        ]
+        # swap public keys of last item, so that its verification fails
+        items[-1] = (keys[1][1], msgs[-1], sigs[-1])
+
+        res = executor.verify(items)
+
+    assert res == [True] * 4 + [
+        False
+    ], "parallel ECDSA sign/ verify doesn't preserve order"
+
+
+def test_batched_sign_verify():
+    """
+    Test if ECDSA sign/ verify sharing inversions across a batch, agree with their
+    one-at-a-time counterparts.
+    """
+    keys = [ecdsa.keygen() for _ in range(2)]
+    msgs = [i.to_bytes(4, "big") for i in range(4)]
+
+    sigs = ecdsa.sign_batch([(keys[i & 1][0], msg) for i, msg in enumerate(msgs)])
+    for i, (msg, sig) in enumerate(zip(msgs, sigs)):
+        assert ecdsa.verify(keys[i & 1][1], msg, sig), "batch signing failed"
+
+    items = [(keys[i & 1][1], msg, sig) for i, (msg, sig) in enumerate(zip(msgs, sigs))]
+    # corrupt last two items, with out of range and mismatching signatures, respectively
+    items[-2] = (keys[1][1], msgs[-2], (sigs[-2][0], 0))
+    items[-1] = (keys[0][1], msgs[-1], sigs[-1])
+
+    assert ecdsa.verify_many(items) == [
+        True,
+        True,
+        False,
+        False,
+    ], "batch verification failed"
+
+
+def test_async_sign_verify():
+    """
+    Test if concurrent asyncio sign/ verify requests, coalesced into micro-batches under
+    backpressure, resolve to correct results.
+    """
+    skey, pkey = ecdsa.keygen()
+    msgs = [i.to_bytes(4, "big") for i in range(6)]
+
+    async def run():
+        async with ecdsa.AsyncECDSA(max_batch_size=4, max_pending=3) as signer:
+            sigs = await asyncio.gather(*[signer.sign(skey, msg) for msg in msgs])
+
+            items = [(pkey, msg, sig) for msg, sig in zip(msgs, sigs)]
+            items[0] = (pkey, msgs[1], sigs[0])
+
+            return await asyncio.gather(*[signer.verify(*item) for item in items])
+
+    res = asyncio.run(run())
+    assert res == [False] + [True] * 5, "asyncio ECDSA sign/ verify failed"
+
+
+def test_async_close_saturated():
+    """
+    Test if closing a micro-batcher, while requests are waiting for a free slot, resolves all
+    of them, either with a result or by rejecting them.
+    """
+    from ecdsa.aio import MicroBatcher
+    from concurrent.futures import ThreadPoolExecutor
+
+    async def run():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            batcher = MicroBatcher(
+                lambda reqs: [req * 2 for req in reqs], executor, max_pending=1
+            )
+            tasks = [asyncio.create_task(batcher.submit(i)) for i in range(3)]
+            await asyncio.sleep(0)
+
+            await batcher.close()
+            done, pending = await asyncio.wait(tasks, timeout=1)
+            return tasks, pending
+
+    tasks, pending = asyncio.run(run())
+    assert not pending, "requests waiting for a slot must be resolved on close"
+    assert tasks[0].result() == 0
+    assert all(isinstance(t.exception(), RuntimeError) for t in tasks[1:])
+
+
+def test_verify_file(tmp_path):
+    """
+    Test if streaming verification of a file of fixed size records, yields indices of
+    exactly those records failing verification, with or without worker processes.
+    """
+    from ecdsa.stream import encode_record
+
+    skey, pkey = ecdsa.keygen()
+    msgs = [i.to_bytes(4, "big") for i in range(5)]
+    sigs = [ecdsa.sign(skey, msg) for msg in msgs]
+
+    records = [
+        encode_record(pkey, hash_message(msg), sig) for msg, sig in zip(msgs, sigs)
+    ]
+    # wrong message digest, then public key not on curve
+    records[1] = encode_record(pkey, hash_message(msgs[0]), sigs[1])
+    records[3] = bytes(64) + records[3][64:]
+
+    path = tmp_path / "records.bin"
+    path.write_bytes(b"".join(records))
+
+    progress = []
+    res = list(
+        ecdsa.verify_file(
+            str(path), batch_size=2, progress=lambda *p: progress.append(p)
+        )
+    )
+
+    assert res == [1, 3], "streaming verification failed"
+    assert progress == [(2, 5), (4, 5), (5, 5)], "progress isn't reported per batch"
+
+    with ecdsa.ParallelExecutor(workers=2) as executor:
+        res = list(ecdsa.verify_file(str(path), 2, executor.pool, max_inflight=2))
+
+    assert res == [1, 3], "streaming verification using worker processes failed"
+
+
+def test_signer_nonce_pool():
+    """
+    Test if signer, spending precomputed nonces from a background refilled pool, produces
+    valid signatures, never reusing a nonce, while accounting for pool running empty.
+    """
+    skey, pkey = ecdsa.keygen()
+    msgs = [i.to_bytes(4, "big") for i in range(6)]
+
+    with ecdsa.Signer(skey, pool_size=4, low_watermark=1, refill_batch=2) as signer:
+        assert signer.wait_ready(timeout=60), "nonce pool wasn't filled up"
+        assert signer.stats().size == 4
+
+        sigs = [signer.sign(msg) for msg in msgs]
+        stats = signer.stats()
+
+    for msg, sig in zip(msgs, sigs):
+        assert ecdsa.verify(pkey, msg, sig), "signing using precomputed nonce failed"
+
+    # distinct r implies distinct nonces
+    assert len({r for r, _ in sigs}) == len(sigs), "precomputed nonce was reused"
+    assert stats.signed == 6
+    assert stats.precomputed + stats.misses >= 6
+    assert stats.capacity == 4
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_signer_fork_safety():
+    """
+    Test if a forked child process never spends a nonce precomputed by its parent signer, which
+    would reveal secret key, while still being able to sign using its own pool
+    """
+    skey, pkey = ecdsa.keygen()
+
+    with ecdsa.Signer(skey, pool_size=4, low_watermark=1, refill_batch=2) as signer:
+        assert signer.wait_ready(timeout=60), "nonce pool wasn't filled up"
+        inherited = {r for _, r in signer._pool}
+
+        rfd, wfd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                os.close(rfd)
+                sigs = [signer.sign(i.to_bytes(4, "big")) for i in range(6)]
+                ready = signer.wait_ready(timeout=60)
+                os.write(wfd, repr((sigs, ready, signer.stats().size)).encode())
+                code = 0
+            finally:
+                os._exit(code)
+
+        os.close(wfd)
+        with os.fdopen(rfd) as fd:
+            out = fd.read()
+        _, status = os.waitpid(pid, 0)
+
+        parent = [signer.sign(i.to_bytes(4, "big")) for i in range(6)]
+
+    assert os.WEXITSTATUS(status) == 0, "child failed to sign"
+    sigs, ready, size = literal_eval(out)
+
+    assert ready and size == 4, "child's nonce pool wasn't refilled"
+    for i, sig in enumerate(sigs):
+        assert ecdsa.verify(pkey, i.to_bytes(4, "big"), sig)
+
+    assert not {r for r, _ in sigs} & inherited, "child reused parent's nonce"
+    assert not {r for r, _ in sigs} & {r for r, _ in parent}, "nonce reused across fork"
+
+
+def test_public_key_recovery():
+    """
+    Test if public key is recovered from message, recoverable signature and its recovery id,
+    both one at a time and in batch, while invalid inputs are rejected.
+    """
+    keys = [ecdsa.keygen() for _ in range(3)]
+    msgs = [i.to_bytes(4, "big") for i in range(3)]
+
+    items = []
+    for (skey, pkey), msg in zip(keys, msgs):
+        (r, s, recid) = ecdsa.sign(skey, msg, recoverable=True)
+
+        assert ecdsa.verify(pkey, msg, (r, s))
+        assert ecdsa.recover(msg, (r, s), recid) == pkey, "public key recovery failed"
+
+        items.append((msg, (r, s), recid))
+
+    # flipped y-parity recovers some other key, out of range s recovers nothing
+    items.append((msgs[0], items[0][1], items[0][2] ^ 1))
+    items.append((msgs[0], (items[0][1][0], N), items[0][2]))
+
+    res = ecdsa.recover_batch(items)
+
+    assert [q.isNormalized() for q in res[:3]] == [True] * 3
+    assert res[:3] == [pkey for _, pkey in keys], "batch public key recovery failed"
+    assert res[3] != keys[0][1] and res[4] is None
+
+    with pytest.raises(ValueError):
+        ecdsa.recover(msgs[0], (0, 1), 0)
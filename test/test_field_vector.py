@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+
+import pytest
+from . import P, N
+from random import randint
+
+pytest.importorskip("numpy")
+from field.vector import BaseFieldVector, ScalarFieldVector
+
+# vectors of these many field elements are tested
+VECTOR_LEN: int = 1 << 10
+
+# vectorized field types, along with their moduli
+FIELDS = {"base": (BaseFieldVector, P), "scalar": (ScalarFieldVector, N)}
+
+
+@pytest.mark.parametrize("field", FIELDS.values(), ids=FIELDS.keys())
+def test_vector_montgomery_repr(field):
+    """
+    Test whether conversion of many random field elements to/ from Montgomery form,
+    kept as struct of arrays, is behaving as expected
+    """
+    vec, mod = field
+    nums = [randint(0, mod - 1) for _ in range(VECTOR_LEN)] + [0, 1, mod - 1]
+
+    nums_ = vec.from_nums(nums).to_nums()
+    assert nums == nums_, "conversion of field element vector failed"
+
+
+@pytest.mark.parametrize("field", FIELDS.values(), ids=FIELDS.keys())
+def test_vector_arithmetic(field):
+    """
+    Test if lane-wise modular multiplication, addition, subtraction and negation of two
+    vectors of random field elements is behaving as expected
+    """
+    vec, mod = field
+    a = [randint(0, mod - 1) for _ in range(VECTOR_LEN)] + [0, mod - 1, mod - 1]
+    b = [randint(0, mod - 1) for _ in range(VECTOR_LEN)] + [mod - 1, 0, mod - 1]
+
+    va = vec.from_nums(a)
+    vb = vec.from_nums(b)
+
+    assert (va * vb).to_nums() == [(x * y) % mod for x, y in zip(a, b)]
+    assert (va + vb).to_nums() == [(x + y) % mod for x, y in zip(a, b)]
+    assert (va - vb).to_nums() == [(x - y) % mod for x, y in zip(a, b)]
+    assert (-va).to_nums() == [(-x) % mod for x in a]
@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+
+import pytest
+from . import BaseField, ScalarField, Point, instrument, ecdsa
+
+
+def test_operation_counters():
+    """
+    Test if field and group operations are counted only while instrumentation is enabled,
+    without counting operations nested within another one of same group.
+    """
+    a = BaseField.from_num(3)
+    b = BaseField.from_num(5)
+    mul = BaseField.__mul__
+
+    with instrument() as prof:
+        a * b
+        a - b
+        a.inv()
+        ScalarField.from_num(7).inv()
+        Point.generator().double().toAffine()
+
+        with pytest.raises(RuntimeError):
+            with instrument():
+                pass
+
+    assert BaseField.__mul__ is mul, "original operation wasn't restored"
+
+    # multiplications of inversion are not counted, while those of point doubling are
+    assert prof.counts["Fp.inv"] == 2
+    assert prof.counts["Fp.sub"] + prof.counts["Fp.sub_lazy"] > 1
+    assert prof.counts["Fp.mul"] > 1
+    assert prof.counts["Fn.inv"] == 1
+    assert prof.counts["Point.double"] == 1
+    assert prof.counts["Point.toAffine"] == 1
+
+    muls = prof.counts["Fp.mul"]
+    a * b
+    assert prof.counts["Fp.mul"] == muls, "counted while disabled"
+    assert prof.report("ops").startswith("ops = ")
+
+
+def test_ecdsa_verify_profile():
+    """
+    Test if profile of ECDSA verification reports inversions and multiplications.
+    """
+    skey, pkey = ecdsa.keygen()
+    sig = ecdsa.sign(skey, b"msg")
+
+    with instrument() as prof:
+        assert ecdsa.verify(pkey, b"msg", sig)
+
+    report = prof.report("verify")
+    assert "Fn.inv_vartime" in report and "Fp.mul" in report
+    assert len(prof.table().splitlines()) == len(prof.counts) + 1
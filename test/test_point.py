@@ -1,12 +1,24 @@
 #!/usr/bin/python3
 
-from . import Point
-from . import BaseField, Gx, Gy
+from . import Point, FixedBaseTable, generator_table, mul_generator
+from . import mul_double_scalar, mul_multi_scalar, pippenger, wnaf
+from . import JacobianPoint, strauss, sum_normalized, normalize
+from . import BaseField, Gx, Gy, N, LAMBDA, decompress
+from . import set_lazy_reduction, get_lazy_reduction, instrument
+from . import set_generator_table_budget, get_generator_table_budget
 from random import randint
+import tracemalloc
+import weakref
+import pytest
 
 # execute test cases for these many rounds
 TEST_CNT: int = 1 << 9
 
+# Upper bounds on memory used by a projective point ( including its coordinates ) and on peak memory
+# allocated during a scalar multiplication, in bytes, as traced by `tracemalloc`
+POINT_MEMORY_BOUND: int = 1280
+MUL_SCALAR_PEAK_BOUND: int = 1 << 14
+
 
 def random_point() -> Point:
     """
@@ -47,3 +59,391 @@ def test_point_doubling():
         c = a.double()
 
         assert b == c, f"expected {b}, found {c}"
+
+
+def test_fixed_base_multiplication():
+    """
+    Test if scalar multiplication using precomputed fixed-base tables agrees with
+    generic double-and-add scalar multiplication
+    """
+    gen = Point.generator()
+    assert generator_table().width > 1, "memory budget should allow windowed table"
+
+    for _ in range(1 << 2):
+        k = randint(0, N - 1)
+
+        a = mul_generator(k)
+        b = gen.mulScalar(k)
+
+        assert a == b, f"expected {b}, found {a}"
+
+    zero = Point.zero()
+    assert mul_generator(0) == zero, "0 * G must be identity"
+    assert mul_generator(N) == zero, "N * G must be identity"
+
+
+def test_generator_table_budget():
+    """
+    Test if only one generator table is kept around, no matter how it's asked for, and if
+    changing memory budget releases table built for previous one
+    """
+    budget = get_generator_table_budget()
+    table = generator_table()
+    assert generator_table(budget) is table, "both call forms must share one table"
+
+    ref = weakref.ref(table)
+    del table
+
+    try:
+        set_generator_table_budget(1 << 12)
+        assert ref() is None, "table built for previous budget must be released"
+
+        assert (
+            generator_table().width == 1
+        ), "tiny budget must fall back to narrowest window"
+
+        k = randint(0, N - 1)
+        assert mul_generator(k) == Point.generator().mulScalar(k)
+    finally:
+        set_generator_table_budget(budget)
+
+    base = random_point()
+    table = FixedBaseTable(base, 3)
+    assert len(table) == 86 * 7
+
+    k = randint(0, N - 1)
+    a = table.mul(k)
+    b = base.mulScalar(k)
+
+    assert a == b, f"expected {b}, found {a}"
+
+
+def test_wnaf_recoding():
+    """
+    Test if width-w NAF recoding of random scalars is behaving as expected
+    """
+    for _ in range(TEST_CNT):
+        k = randint(0, N - 1)
+        w = randint(2, 8)
+
+        digits = wnaf(k, w)
+        k_ = sum(d << i for i, d in enumerate(digits))
+        assert k == k_, f"expected {k}, found {k_}"
+
+        nonzero = [i for i, d in enumerate(digits) if d]
+        assert all(digits[i] & 1 and abs(digits[i]) < (1 << (w - 1)) for i in nonzero)
+        assert all(j - i >= w for i, j in zip(nonzero, nonzero[1:]))
+
+
+def test_double_scalar_multiplication():
+    """
+    Test if joint double-scalar multiplication u1 * G + u2 * Q agrees with two separate
+    scalar multiplications, followed by point addition
+    """
+    gen = Point.generator()
+
+    for _ in range(1 << 1):
+        q = random_point()
+        u1 = randint(0, N - 1)
+        u2 = randint(0, N - 1)
+
+        b = gen.mulScalar(u1) + q.mulScalar(u2)
+
+        for endo in (False, True):
+            a = mul_double_scalar(u1, u2, q, endo)
+            assert a == b, f"expected {b}, found {a}"
+
+    q = random_point()
+    assert mul_double_scalar(0, 0, q) == Point.zero()
+    assert mul_double_scalar(1, N - 1, gen) == Point.zero()
+
+
+def test_scalar_multiplication():
+    """
+    Test if scalar multiplication of random secp256k1 point agrees across different
+    wNAF window widths ( including plain double-and-add ) and with repeated addition
+    """
+    a = random_point()
+    k = randint(0, N - 1)
+
+    b = a.mulScalar(k, 1)
+    for w in (2, 4, 6):
+        c = a.mulScalar(k, w)
+        assert b == c, f"expected {b}, found {c}"
+
+    for k in range(1 << 3):
+        b = Point.zero()
+        for _ in range(k):
+            b = b + a
+
+        for w in (1, 5):
+            c = a.mulScalar(k, w)
+            assert b == c, f"expected {b}, found {c}"
+
+    assert a.mulScalar(N) == Point.zero()
+    assert a.mulScalar(N + 1) == a
+
+
+def test_endomorphism_scalar_multiplication():
+    """
+    Test if secp256k1 endomorphism agrees with scalar multiplication by λ and if GLV based
+    scalar multiplication of random secp256k1 point is behaving as expected
+    """
+    a = random_point()
+
+    b = a.endomorphism()
+    c = a.mulScalar(LAMBDA)
+    assert b == c, f"expected {c}, found {b}"
+
+    for _ in range(1 << 1):
+        k = randint(0, N - 1)
+
+        b = a.mulScalarGLV(k)
+        c = a.mulScalar(k)
+        assert b == c, f"expected {c}, found {b}"
+
+    assert a.mulScalarGLV(0) == Point.zero()
+    assert a.mulScalarGLV(N - 1) == -a
+
+
+def test_multi_scalar_multiplication():
+    """
+    Test if multi-scalar multiplication using interleaved wNAF method agrees with
+    bucket method, for random secp256k1 points and scalars
+    """
+    points = [random_point() for _ in range(3)]
+    scalars = [randint(0, N - 1) for _ in range(3)]
+
+    a = mul_multi_scalar(scalars, points)
+    b = pippenger(scalars, points, 2)
+    assert a == b, f"expected {b}, found {a}"
+
+    c = mul_multi_scalar(scalars[:1], points[:1])
+    d = points[0].mulScalar(scalars[0])
+    assert c == d, f"expected {d}, found {c}"
+
+    assert mul_multi_scalar([], []).isZero()
+    assert mul_multi_scalar([N - 1, 1], points[:1] * 2).isZero()
+
+
+def test_lift_x():
+    """
+    Test if secp256k1 point can be recovered from its affine x-coordinate and y-parity
+    """
+    for _ in range(1 << 4):
+        a = random_point()
+        x, y = a.toAffine()
+
+        b = Point.liftX(x.to_num(), y.to_num() & 1)
+        assert a == b, f"expected {a}, found {b}"
+        assert a.hasAffineX(x.to_num())
+
+
+def test_sec1_encoding():
+    """
+    Test if secp256k1 point survives SEC1 compressed and uncompressed encoding round trip, while
+    malformed encodings are rejected
+    """
+    for _ in range(1 << 4):
+        a = random_point()
+
+        for compressed in (True, False):
+            enc = a.to_bytes(compressed)
+            assert len(enc) == (33 if compressed else 65)
+
+            b = Point.from_bytes(enc)
+            assert a == b, f"expected {a}, found {b}"
+
+    assert Point.from_bytes(Point.zero().to_bytes()).isZero()
+
+    g = Point.generator()
+    enc = g.to_bytes()
+    assert (
+        enc.hex() == "02" + hex(Gx)[2:]
+    ), "unexpected compressed encoding of generator"
+
+    # decompression of same encoding is served from cache
+    decompress.cache_clear()
+    Point.from_bytes(enc)
+    Point.from_bytes(enc)
+    assert decompress.cache_info().hits == 1
+
+    malformed = [
+        b"",
+        b"\x05" + enc[1:],
+        enc[:-1],
+        b"\x04" + bytes(64),
+        b"\x02" + (5).to_bytes(32, "big"),
+    ]
+    for enc in malformed:
+        with pytest.raises(ValueError):
+            Point.from_bytes(enc)
+
+
+def test_point_equality():
+    """
+    Test if equality check of secp256k1 points, by cross-multiplying projective coordinates, agrees
+    with comparing their affine coordinates, without computing any inversion, and that affine
+    coordinates are computed only once
+    """
+    for _ in range(TEST_CNT >> 3):
+        a = random_point() + random_point()
+        b = a + random_point()
+        k = BaseField.from_num(randint(1, Gx))
+        zero = BaseField.from_num(0)
+
+        with instrument() as prof:
+            assert a == Point(a._x * k, a._y * k, a._z * k)
+            assert Point.zero() == Point(zero, k, zero)
+            assert not a == b
+            assert not a == Point.zero() and not Point.zero() == a
+
+        assert prof.counts["Fp.inv"] == 0, "equality check must not invert"
+
+        affine = a.toAffine()
+        assert a.toAffine() is affine, "affine coordinates must be memoized"
+        assert Point.batch_to_affine([b, a])[1] is affine
+
+        # once affine coordinates of both points are known, they're compared instead
+        c = Point.fromAffine(*affine)
+        z = Point.zero()
+        for p in (b, c, z):
+            p.toAffine()
+
+        assert a == c and not a == b
+        assert not a == z and not z == a
+        assert z == Point(zero, k, zero)
+
+
+def test_batch_to_affine():
+    """
+    Test if batch conversion of secp256k1 points to affine coordinates, using simultaneous
+    inversion, agrees with converting them one by one, including identity element
+    """
+    points = [random_point() for _ in range(1 << 3)]
+    points = [p + q for p, q in zip(points, points[1:])]
+    points.insert(3, Point.zero())
+
+    for p, (x, y) in zip(points, Point.batch_to_affine(points)):
+        # fresh copy, as affine coordinates of `p` are now memoized
+        x_, y_ = Point(p._x, p._y, p._z).toAffine()
+        assert (x == x_) and (y == y_), f"expected ({x_}, {y_}), found ({x}, {y})"
+
+    assert Point.batch_to_affine([]) == []
+    assert Point.batch_to_affine([Point.zero()])[0][0] == BaseField.from_num(0)
+
+
+def test_mixed_point_addition():
+    """
+    Test if mixed addition ( right hand side operand having Z = 1 ), in both projective and
+    Jacobian coordinate system, agrees with general point addition
+    """
+    for _ in range(TEST_CNT >> 3):
+        a = random_point() + random_point()
+        b = random_point()
+        b_ = normalize([b])[0]
+        assert b_.isNormalized()
+
+        c = a + b
+        d = a.addMixed(b_)
+        assert c == d, f"expected {c}, found {d}"
+
+        e = JacobianPoint.fromProjective(a._x, a._y, a._z).addMixed(b_._x, b_._y)
+        e = Point(*e.toProjective())
+        assert c == e, f"expected {c}, found {e}"
+
+        f = JacobianPoint.fromProjective(a._x, a._y, a._z).double()
+        f = Point(*f.toProjective())
+        assert a.double() == f, f"expected {a.double()}, found {f}"
+
+    # special cases of Jacobian mixed addition i.e. identity, doubling and inverse
+    a = normalize([random_point()])[0]
+    j = JacobianPoint.zero().addMixed(a._x, a._y)
+    assert Point(*j.toProjective()) == a
+    assert Point(*j.addMixed(a._x, a._y).toProjective()) == a.double()
+    assert j.addMixed(a._x, -a._y).isZero()
+    assert Point.zero().addMixed(a) == a
+
+
+def test_lazy_reduction_point_formulas():
+    """
+    Test if point addition, mixed addition and doubling formulas compute same coordinates, when
+    intermediate sums/ differences are left partially reduced, including special cases
+    """
+    points = [random_point() + random_point() for _ in range(TEST_CNT >> 3)]
+    points += [Point.zero(), Point.generator()]
+    eager = get_lazy_reduction()
+
+    def coords(p: Point):
+        return p._x, p._y, p._z
+
+    try:
+        for a in points:
+            b = random_point()
+            b_ = normalize([b])[0]
+            cases = [(a, b), (a, a), (a, -a), (b, -b), (a, Point.zero())]
+
+            set_lazy_reduction(False)
+            expected = [coords(p + q) for p, q in cases]
+            expected += [coords(a.addMixed(b_)), coords(a.double())]
+
+            set_lazy_reduction(True)
+            found = [coords(p + q) for p, q in cases]
+            found += [coords(a.addMixed(b_)), coords(a.double())]
+
+            assert expected == found, f"expected {expected}, found {found}"
+    finally:
+        set_lazy_reduction(eager)
+
+
+def test_normalized_table_multiplication():
+    """
+    Test if interleaved wNAF multiplication and point summation, when all precomputed points
+    are normalized ( so that Jacobian accumulator is used ), are behaving as expected
+    """
+    a = random_point()
+    table = normalize(a.oddMultiples(4))
+
+    k1 = randint(0, 1 << 128)
+    k2 = randint(0, 1 << 128)
+
+    b = strauss([k1, -k2], [table, table], [4, 4])
+    c = a.mulScalar(k1 - k2)
+    assert b == c, f"expected {c}, found {b}"
+
+    d = sum_normalized(table)
+    e = a.mulScalar(1 + 3 + 5 + 7)
+    assert d == e, f"expected {e}, found {d}"
+    assert sum_normalized([]).isZero()
+
+
+def test_point_memory_footprint():
+    """
+    Test that secp256k1 points are slotted, and that memory used per point and peak memory allocated
+    during scalar multiplication, as traced by `tracemalloc`, stay within bounds
+    """
+    gen = Point.generator()
+    pts = [gen.mulScalar(randint(1, N - 1)) for _ in range(1 << 5)]
+
+    for pt in (gen, pts[0], JacobianPoint.zero()):
+        assert not hasattr(pt, "__dict__"), "point must not have __dict__"
+
+    tracemalloc.start()
+    try:
+        sums = [pt + gen for pt in pts]
+        per_point = tracemalloc.get_traced_memory()[0] / len(sums)
+
+        # first multiplication warms up caches, which are not accounted for
+        gen.mulScalar(randint(1, N - 1))
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+
+        gen.mulScalar(randint(1, N - 1))
+        peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+    assert per_point < POINT_MEMORY_BOUND, f"{per_point} bytes per point"
+    assert (
+        peak < MUL_SCALAR_PEAK_BOUND
+    ), f"{peak} bytes peak during scalar multiplication"
@@ -1,13 +1,18 @@
 #!/usr/bin/python3
 
-from . import ScalarField, N
+import pytest
+from . import MontgomeryScalarField, NativeScalarField, N, LAMBDA, split_scalar
 from random import randint
 
 # execute test cases for these many rounds
 TEST_CNT: int = 1 << 10
 
+# scalar field arithmetic backends, each of them must behave same way
+BACKENDS = {"montgomery": MontgomeryScalarField, "native": NativeScalarField}
 
-def test_montgomery_repr():
+
+@pytest.mark.parametrize("ScalarField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_montgomery_repr(ScalarField):
     """
     Test with random secp256k1 scalar field elements whether convertion in between
     numeric, radix-r and Montgomery form is behaving as expected
@@ -21,7 +26,8 @@ def test_montgomery_repr():
         assert num == num_, f"expeted {num}, found {num_}"
 
 
-def test_scalar_field_multiplication():
+@pytest.mark.parametrize("ScalarField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_scalar_field_multiplication(ScalarField):
     """
     Test if modular multiplication of two randomly generated secp256k1 scalar
     field elements, using Montgomery algorithm, is behaving as expected
@@ -39,7 +45,8 @@ def test_scalar_field_multiplication():
         assert c == c_, f"expected {c}, found {c_}"
 
 
-def test_scalar_field_addition():
+@pytest.mark.parametrize("ScalarField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_scalar_field_addition(ScalarField):
     """
     Test if modular addition of two randomly generated secp256k1 scalar field
     elements, using Montgomery algorithm, is behaving as expected
@@ -57,7 +64,8 @@ def test_scalar_field_addition():
         assert c == c_, f"expected {c}, found {c_}"
 
 
-def test_scalar_field_subtraction():
+@pytest.mark.parametrize("ScalarField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_scalar_field_subtraction(ScalarField):
     """
     Test if modular subtraction of two randomly generated secp256k1 scalar
     field elements, using Montgomery algorithm, is behaving as expected
@@ -75,7 +83,8 @@ def test_scalar_field_subtraction():
         assert c == c_, f"expected {c}, found {c_}"
 
 
-def test_scalar_field_inversion():
+@pytest.mark.parametrize("ScalarField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_scalar_field_inversion(ScalarField):
     """
     Test if modular multiplicative inversion of one randomly generated secp256k1
     scalar field element, in Montgomery representation, is behaving as expected
@@ -89,3 +98,51 @@ def test_scalar_field_inversion():
         b = fp_b.to_num()
 
         assert b == 1, f"expected 1, found {b}"
+
+
+@pytest.mark.parametrize("ScalarField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_scalar_field_vartime_inversion(ScalarField):
+    """
+    Test if variable-time modular multiplicative inversion of randomly generated secp256k1
+    scalar field element agrees with constant-time inversion
+    """
+    for _ in range(1 << 4):
+        a = randint(1, N - 1)
+
+        fp_a = ScalarField.from_num(a)
+        fp_b = fp_a.inv_vartime()
+        fp_c = fp_a.inv()
+
+        assert fp_b == fp_c, f"expected {fp_c}, found {fp_b}"
+        assert (fp_a * fp_b).to_num() == 1
+
+    assert ScalarField.from_num(0).inv_vartime().to_num() == 0
+
+
+@pytest.mark.parametrize("ScalarField", BACKENDS.values(), ids=BACKENDS.keys())
+def test_scalar_field_integer_multiplication(ScalarField):
+    """
+    Test if multiplying a secp256k1 scalar field element by an integer operand ( which is not
+    converted to field element ) results into canonical integer product
+    """
+    for _ in range(TEST_CNT):
+        a = randint(0, N - 1)
+        b = randint(0, (1 << 256) - 1)
+        c = (a * b) % N
+
+        c_ = ScalarField.from_num(a).mul_num(b)
+
+        assert c == c_, f"expected {c}, found {c_}"
+
+
+def test_scalar_decomposition():
+    """
+    Test if GLV decomposition of random secp256k1 scalars results into two short scalars
+    k1, k2 s.t. k = k1 + k2 * λ mod n
+    """
+    for _ in range(TEST_CNT):
+        k = randint(0, N - 1)
+        k1, k2 = split_scalar(k)
+
+        assert (k1 + k2 * LAMBDA) % N == k, f"failed to decompose {k}"
+        assert abs(k1).bit_length() <= 129 and abs(k2).bit_length() <= 129
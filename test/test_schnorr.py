@@ -0,0 +1,129 @@
+#!/usr/bin/python3
+
+from . import N, P, schnorr
+from random import randbytes, randint
+
+# BIP340 test vectors, as (secret key, public key, auxiliary randomness, message, signature, result),
+# where secret key and auxiliary randomness are left empty for verification only vectors, see
+# https://github.com/bitcoin/bips/blob/master/bip-0340/test-vectors.csv
+TEST_VECTORS = [
+    (
+        "0000000000000000000000000000000000000000000000000000000000000003",
+        "F9308A019258C31049344F85F89D5229B531C845836F99B08601F113BCE036F9",
+        "0000000000000000000000000000000000000000000000000000000000000000",
+        "0000000000000000000000000000000000000000000000000000000000000000",
+        "E907831F80848D1069A5371B402410364BDF1C5F8307B0084C55F1CE2DCA8215"
+        "25F66A4A85EA8B71E482A74F382D2CE5EBEEE8FDB2172F477DF4900D310536C0",
+        True,
+    ),
+    (
+        "B7E151628AED2A6ABF7158809CF4F3C762E7160F38B4DA56A784D9045190CFEF",
+        "DFF1D77F2A671C5F36183726DB2341BE58FEAE1DA2DECED843240F7B502BA659",
+        "0000000000000000000000000000000000000000000000000000000000000001",
+        "243F6A8885A308D313198A2E03707344A4093822299F31D0082EFA98EC4E6C89",
+        "6896BD60EEAE296DB48A229FF71DFE071BDE413E6D43F917DC8DCF8C78DE3341"
+        "8906D11AC976ABCCB20B091292BFF4EA897EFCB639EA871CFA95F6DE339E4B0A",
+        True,
+    ),
+    (
+        "",
+        "D69C3509BB99E412E68B0FE8544E72837DFA30746D8BE2AA65975F29D22DC7B9",
+        "",
+        "4DF3C3F68FCC83B27E9D42C90431A72499F17875C81A599B566C9889B9696703",
+        "00000000000000000000003B78CE563F89A0ED9414F5AA28AD0D96D6795F9C63"
+        "76AFB1548AF603B3EB45C9F8207DEE1060CB71C04E80F593060B07D28308D7F4",
+        True,
+    ),
+    (
+        "",
+        "EEFDEA4CDB677750A420FEE807EACF21EB9898AE79B9768766E4FAA04A2D4A34",
+        "",
+        "243F6A8885A308D313198A2E03707344A4093822299F31D0082EFA98EC4E6C89",
+        "6CFF5C3BA86C69EA4B7376F31A9BCB4F74C1976089B2D9963DA2E5543E177769"
+        "69E89B4C5564D00349106B8497785DD7D1D713A8AE82B32FA79D5F7FC407D39B",
+        False,
+    ),
+]
+
+
+def test_bip340_vectors():
+    """
+    Test if Schnorr key generation, signing and verification agree with BIP340 test vectors,
+    both individually and as a batch
+    """
+    items = []
+    for skey, pkey, aux, msg, sig, result in TEST_VECTORS:
+        pkey, msg, sig = bytes.fromhex(pkey), bytes.fromhex(msg), bytes.fromhex(sig)
+
+        if skey:
+            skey = int(skey, 16)
+            assert schnorr.generate_public_key(skey) == pkey
+            assert schnorr.sign(skey, msg, bytes.fromhex(aux)) == sig
+
+        assert schnorr.verify(pkey, msg, sig) == result
+        items.append((pkey, msg, sig))
+
+    assert schnorr.verify_batch(items) == [v[-1] for v in TEST_VECTORS]
+
+
+def test_schnorr():
+    """
+    Test if Schnorr keygen -> sign -> verify flow works as expected, for messages of any length,
+    while rejecting tampered and malformed inputs
+    """
+    skey, pkey = schnorr.keygen()
+    _, other = schnorr.keygen()
+
+    for msg in (b"", b"this is a message !", randbytes(1 << 10)):
+        sig = schnorr.sign(skey, msg)
+        assert schnorr.verify(pkey, msg, sig), "Schnorr signature verification failed"
+
+        r, s = int.from_bytes(sig[:32], "big"), int.from_bytes(sig[32:], "big")
+        forged = [
+            (pkey, msg + b"!", sig),
+            (other, msg, sig),
+            (pkey, msg, sig[:32] + ((N - s) % N).to_bytes(32, "big")),
+            (pkey, msg, sig[:32] + (s + N).to_bytes(33, "big")[1:]),
+            (pkey, msg, (r + P).to_bytes(33, "big")[1:] + sig[32:]),
+            (pkey, msg, sig[:-1]),
+            (pkey[:-1], msg, sig),
+            (P.to_bytes(32, "big"), msg, sig),
+        ]
+        for item in forged:
+            assert not schnorr.verify(*item), f"{item} must be rejected"
+
+    # same message and auxiliary randomness, always yield same signature
+    aux = randbytes(32)
+    assert schnorr.sign(skey, b"msg", aux) == schnorr.sign(skey, b"msg", aux)
+    assert schnorr.sign(skey, b"msg", aux) != schnorr.sign(skey, b"msg")
+
+
+def test_schnorr_batch_verification():
+    """
+    Test if Schnorr batch verification agrees with verifying signatures one by one, while locating
+    invalid entries among signatures under few repeated keys
+    """
+    keys = [schnorr.keygen() for _ in range(3)]
+
+    items = []
+    for i in range(12):
+        skey, pkey = keys[i % len(keys)]
+        msg = randbytes(randint(0, 64))
+        items.append((pkey, msg, schnorr.sign(skey, msg)))
+
+    assert schnorr.verify_batch(items) == [True] * len(items)
+
+    # tampered message, signature under another key, malformed signature, r not on curve
+    items[1] = (items[1][0], items[1][1] + b"!", items[1][2])
+    items[4] = (items[5][0], items[4][1], items[4][2])
+    items[7] = (items[7][0], items[7][1], items[7][2][:-1])
+    items[9] = (
+        items[9][0],
+        items[9][1],
+        (P - 1).to_bytes(32, "big") + items[9][2][32:],
+    )
+
+    res = schnorr.verify_batch(items)
+    assert res == [schnorr.verify(*item) for item in items]
+    assert res == [i not in (1, 4, 7, 9) for i in range(len(items))]
+    assert schnorr.verify_batch([]) == []
@@ -1,5 +1,7 @@
 #!/usr/bin/python3
 
+from typing import List
+
 
 def bit_count(num: int) -> int:
     """
@@ -52,5 +54,34 @@ def mul_inv(num: int, mod: int) -> int:
     return modulo(old_s, mod)
 
 
+def wnaf(num: int, width: int) -> List[int]:
+    """
+    Computes width-w non-adjacent form of a non-negative integer, returning signed digits
+    from least to most significant s.t. num = Σ digits[i] * 2^i, where each non-zero digit is odd,
+    ∈ (-2^(w-1), 2^(w-1)) and followed by at least w - 1 zero digits, see algorithm 3.35 of
+    https://link.springer.com/book/10.1007/b97644
+    """
+    assert num >= 0 and width >= 2
+
+    mask = (1 << width) - 1
+    half = 1 << (width - 1)
+    digits = []
+
+    while num > 0:
+        if num & 1:
+            digit = num & mask
+            if digit >= half:
+                digit -= 1 << width
+
+            num -= digit
+        else:
+            digit = 0
+
+        digits.append(digit)
+        num >>= 1
+
+    return digits
+
+
 if __name__ == "__main__":
     print("Use `utils` as library module")